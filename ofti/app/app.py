@@ -37,6 +37,7 @@ from ofti.foam.config import fzf_enabled, get_config
 from ofti.foam.exceptions import QuitAppError
 from ofti.foam.openfoam import OpenFOAMError, discover_case_files
 from ofti.foam.openfoam_env import ensure_environment
+from ofti.foam.subprocess_utils import shell_env
 from ofti.foamlib.adapter import available as foamlib_available
 from ofti.ui.adapter import CursesAdapter
 from ofti.ui.router import ScreenRouter
@@ -260,9 +261,7 @@ def _tasks_screen(stdscr: Any, state: AppState) -> None:
 def _run_terminal(stdscr: Any, case_path: Path, command: str | None) -> None:
     curses.def_prog_mode()
     curses.endwin()
-    env = os.environ.copy()
-    env.pop("BASH_ENV", None)
-    env.pop("ENV", None)
+    env = shell_env()
     shell_cmd = command or ""
     try:
         if shell_cmd:
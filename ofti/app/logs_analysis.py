@@ -6,8 +6,7 @@ from typing import Any
 
 from ofti.foamlib.logs import (
     execution_time_deltas,
-    parse_log_metrics_and_residuals,
-    read_log_text,
+    read_log_metrics_and_residuals,
 )
 from ofti.ui_curses.prompts import _show_message
 from ofti.ui_curses.viewer import Viewer
@@ -22,12 +21,10 @@ def residual_timeline_screen(stdscr: Any, case_path: Path) -> None:
     if path is None:
         return
     try:
-        text = read_log_text(path)
+        metrics, residuals = read_log_metrics_and_residuals(path)
     except OSError as exc:
         _show_message(stdscr, f"Failed to read {path.name}: {exc}")
         return
-
-    metrics, residuals = parse_log_metrics_and_residuals(text)
     if not residuals:
         _show_message(stdscr, f"No residuals found in {path.name}.")
         return
@@ -64,12 +61,11 @@ def log_analysis_screen(stdscr: Any, case_path: Path) -> None:
     if path is None:
         return
     try:
-        text = read_log_text(path)
+        metrics, residuals = read_log_metrics_and_residuals(path)
     except OSError as exc:
         _show_message(stdscr, f"Failed to read {path.name}: {exc}")
         return
 
-    metrics, residuals = parse_log_metrics_and_residuals(text)
     if not (metrics.times or metrics.courants or metrics.execution_times or residuals):
         _show_message(stdscr, f"No metrics found in {path.name}.")
         return
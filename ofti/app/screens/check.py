@@ -23,6 +23,7 @@ from ofti.foam.openfoam import (
 )
 from ofti.foam.tasks import Task
 from ofti.ui.status import draw_status_bar, status_message
+from ofti.ui_curses.keys import set_input_timeout
 
 
 def start_check_thread(case_path: Path, state: AppState) -> None:
@@ -123,7 +124,7 @@ def check_syntax_menu(
 
     current = 0
     scroll = 0
-    stdscr.timeout(200)
+    set_input_timeout(stdscr, 200)
     try:
         while True:
             labels, checks = check_labels(case_path, files, state)
@@ -173,7 +174,7 @@ def check_syntax_menu(
 
             scroll = menu_scroll(current, scroll, stdscr, len(labels), header_rows=3)
     finally:
-        stdscr.timeout(-1)
+        set_input_timeout(stdscr, -1)
 
 
 def check_labels(
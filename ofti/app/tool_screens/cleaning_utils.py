@@ -5,15 +5,13 @@ from pathlib import Path
 from typing import Any
 
 from ofti.app.tool_screens.runner import _expand_shell_command, _show_message
-from ofti.foam.subprocess_utils import run_trusted
+from ofti.foam.subprocess_utils import run_trusted, shell_env
 from ofti.tools.helpers import with_bashrc
 
 
 def _run_shell_capture(case_path: Path, shell_cmd: str) -> tuple[str, str]:
     command = with_bashrc(_expand_shell_command(shell_cmd, case_path))
-    env = os.environ.copy()
-    env.pop("BASH_ENV", None)
-    env.pop("ENV", None)
+    env = shell_env()
     try:
         result = run_trusted(
             ["bash", "--noprofile", "--norc", "-c", command],
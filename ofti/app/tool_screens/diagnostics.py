@@ -195,7 +195,7 @@ def _human_size(size: int) -> str:
 
 
 def _prompt_line(stdscr: Any, prompt: str) -> str:
-    stdscr.clear()
+    stdscr.erase()
     value = prompt_line(stdscr, prompt)
     if value is None:
         return ""
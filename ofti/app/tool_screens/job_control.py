@@ -99,7 +99,7 @@ def _start_background_command(
     case_path: Path,
     name: str,
     cmd: list[str],
-) -> None:
+) -> bool:
     expanded = run_ops.expand_command(case_path, cmd)
 
     try:
@@ -113,19 +113,20 @@ def _start_background_command(
         )
     except ValueError as exc:
         _show_message(stdscr, _with_no_foam_hint(f"Failed to run {name}: {exc}"))
-        return
+        return False
     pid = result.pid
     if pid is None:
         _show_message(stdscr, f"Failed to run {name}: missing background pid")
-        return
+        return False
     _show_message(
         stdscr,
         f"Started {name} (pid {pid}).",
     )
+    return True
 
 
-def start_tool_background(stdscr: Any, case_path: Path, name: str, cmd: list[str]) -> None:
-    _start_background_command(stdscr, case_path, name, cmd)
+def start_tool_background(stdscr: Any, case_path: Path, name: str, cmd: list[str]) -> bool:
+    return _start_background_command(stdscr, case_path, name, cmd)
 
 
 def pause_job_screen(stdscr: Any, case_path: Path) -> None:
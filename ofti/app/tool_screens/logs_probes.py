@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import os
 import re
-from math import sqrt
+from math import hypot
 from pathlib import Path
 from typing import Any
 
@@ -10,6 +11,8 @@ from ofti.app.tool_screens.menu_helpers import build_menu
 from ofti.app.tool_screens.runner import _show_message
 from ofti.ui_curses.viewer import Viewer
 
+_VEC_RE = re.compile(r"\(([^)]+)\)")
+
 
 def probes_viewer_screen(stdscr: Any, case_path: Path) -> None:
     probes_root = case_path / "postProcessing" / "probes"
@@ -17,11 +20,7 @@ def probes_viewer_screen(stdscr: Any, case_path: Path) -> None:
         _show_message(stdscr, "postProcessing/probes not found in case directory.")
         return
 
-    candidates = [
-        path
-        for path in probes_root.rglob("*")
-        if path.is_file() and path.name != "positions"
-    ]
+    candidates = _find_probe_files(probes_root)
     if not candidates:
         _show_message(stdscr, "No probe files found under postProcessing/probes.")
         return
@@ -40,7 +39,8 @@ def probes_viewer_screen(stdscr: Any, case_path: Path) -> None:
 
     path = candidates[choice]
     try:
-        text = path.read_text(errors="ignore")
+        # Decode raw bytes once; skips the text-mode newline translation pass.
+        text = path.read_bytes().decode("utf-8", errors="ignore")
     except OSError as exc:
         _show_message(stdscr, f"Failed to read {path.name}: {exc}")
         return
@@ -67,7 +67,25 @@ def probes_viewer_screen(stdscr: Any, case_path: Path) -> None:
     Viewer(stdscr, "\n".join(lines)).display()
 
 
+def _find_probe_files(root: Path) -> list[Path]:
+    found: list[str] = []
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file() and entry.name != "positions":
+                        found.append(entry.path)
+        except OSError:
+            continue
+    return sorted(Path(path) for path in found)
+
+
 def _parse_probe_series(text: str) -> tuple[list[float], list[float], int]:
+    if "(" not in text:
+        return _parse_scalar_probe_series(text)
     times: list[float] = []
     values: list[float] = []
     probe_count = 0
@@ -87,15 +105,34 @@ def _parse_probe_series(text: str) -> tuple[list[float], list[float], int]:
     return times, values, probe_count
 
 
+def _parse_scalar_probe_series(text: str) -> tuple[list[float], list[float], int]:
+    # Only the first probe is plotted, so skip float() on the remaining columns.
+    times: list[float] = []
+    values: list[float] = []
+    probe_count = 0
+    for raw in text.splitlines():
+        parts = raw.split()
+        if len(parts) < 2 or parts[0].startswith(("//", "#")):
+            continue
+        try:
+            time = float(parts[0])
+            value = float(parts[1])
+        except ValueError:
+            continue
+        times.append(time)
+        values.append(value)
+        probe_count = len(parts) - 1
+    return times, values, probe_count
+
+
 def _parse_probe_line(line: str) -> tuple[float, list[float], int] | None:
-    parts = line.split(maxsplit=1)
-    if not parts:
-        return None
+    if "\t" in line:
+        line = line.replace("\t", " ")
+    time_text, _sep, rest = line.strip().partition(" ")
     try:
-        time = float(parts[0])
+        time = float(time_text)
     except ValueError:
         return None
-    rest = parts[1] if len(parts) > 1 else ""
     values, count = _parse_probe_values(rest)
     if not values:
         return None
@@ -103,17 +140,16 @@ def _parse_probe_line(line: str) -> tuple[float, list[float], int] | None:
 
 
 def _parse_probe_values(rest: str) -> tuple[list[float], int]:
-    vectors = re.findall(r"\(([^)]+)\)", rest)
+    vectors = _VEC_RE.findall(rest)
     if vectors:
         values_list: list[float] = []
         for vec in vectors:
-            numbers = [float(val) for val in vec.split() if val]
+            numbers = [float(val) for val in vec.split()]
             if numbers:
-                magnitude = sqrt(sum(val * val for val in numbers))
-                values_list.append(magnitude)
+                values_list.append(hypot(*numbers))
         if values_list:
             return values_list, len(values_list)
-    floats = [float(val) for val in rest.split() if val]
+    floats = [float(val) for val in rest.split()]
     if floats:
         return floats, len(floats)
     return ([], 0)
@@ -1,28 +1,40 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import Any
 
 from ofti.app.tool_screens.menu_helpers import build_menu
-from ofti.app.tool_screens.runner import _show_message
+from ofti.app.tool_screens.runner import _show_message, flush_tool_logs
 from ofti.core.case import detect_solver
+from ofti.core.pipeline import tail_text
 
+_tail_text = tail_text
 
-def _tail_text(text: str, max_lines: int = 20) -> str:
-    lines = text.strip().splitlines()
-    if len(lines) <= max_lines:
-        return "\n".join(lines) if lines else "(empty)"
-    tail = "\n".join(lines[-max_lines:])
-    return f"... ({len(lines) - max_lines} lines omitted)\n{tail}"
+
+def _list_logs(case_path: Path, prefix: str = "log.", *, by_mtime: bool = False) -> list[Path]:
+    flush_tool_logs()
+    try:
+        with os.scandir(case_path) as it:
+            entries = [
+                (entry.name, entry.stat().st_mtime_ns if by_mtime else 0)
+                for entry in it
+                if entry.name.startswith(prefix) and entry.is_file()
+            ]
+    except OSError:
+        return []
+    entries.sort(key=(lambda item: item[1]) if by_mtime else (lambda item: item[0]))
+    return [case_path / name for name, _mtime in entries]
 
 
 def _preferred_log_file(case_path: Path) -> Path | None:
+    flush_tool_logs()
     solver = detect_solver(case_path)
     if solver and solver != "unknown":
         candidate = case_path / f"log.{solver}"
         if candidate.is_file():
             return candidate
-    logs = sorted(case_path.glob("log.*"), key=lambda p: p.stat().st_mtime)
+    logs = _list_logs(case_path, by_mtime=True)
     if logs:
         return logs[-1]
     return None
@@ -34,7 +46,7 @@ def _select_log_file(
     *,
     title: str = "Select log file",
 ) -> Path | None:
-    log_files = sorted(case_path.glob("log.*"))
+    log_files = _list_logs(case_path)
     if not log_files:
         _show_message(stdscr, "No log.* files found in case directory.")
         return None
@@ -62,7 +74,7 @@ def _select_solver_log_file(
     if not solver or solver == "unknown":
         _show_message(stdscr, "Solver not detected; cannot pick solver logs.")
         return None
-    log_files = sorted(case_path.glob(f"log.{solver}*"))
+    log_files = _list_logs(case_path, f"log.{solver}")
     if not log_files:
         _show_message(stdscr, f"No log.{solver}* files found in case directory.")
         return None
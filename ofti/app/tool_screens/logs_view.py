@@ -1,23 +1,40 @@
 from __future__ import annotations
 
 import curses
+from collections import deque
 from contextlib import suppress
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 from ofti.app.logs_analysis import log_analysis_screen
-from ofti.app.tool_screens.logs_select import _select_log_file
+from ofti.app.tool_screens.logs_select import _list_logs, _select_log_file
 from ofti.app.tool_screens.menu_helpers import build_menu
-from ofti.app.tool_screens.runner import _show_message
-from ofti.core.checkmesh import extract_last_courant
+from ofti.app.tool_screens.runner import _show_message, flush_tool_logs
+from ofti.core.checkmesh import parse_courant_line
 from ofti.foam.config import get_config, key_hint, key_in
 from ofti.foamlib.logs import read_log_tail_lines, read_log_text
+from ofti.ui_curses.keys import set_input_timeout
 from ofti.ui_curses.viewer import Viewer
 
 _LOG_TAIL_POLL_MS = 500
 _LOG_TAIL_MAX_LINES = 400
+_LOG_TAIL_VISIBLE_LINES = 50
 _LOG_TAIL_MAX_BYTES = 256 * 1024
+_LOG_TAIL_EDGE_BYTES = 64
 _LOG_VIEW_MAX_BYTES = 2 * 1024 * 1024
+_LOG_TAIL_PATTERNS = ("FATAL", "bounding", "Courant", "nan", "SIGFPE", "floating point exception")
+_LOG_TAIL_PATTERNS_LOWER = tuple(pattern.lower() for pattern in _LOG_TAIL_PATTERNS)
+
+
+@dataclass
+class _TailState:
+    ino: int = -1
+    size: int = -1
+    mtime_ns: int = -1
+    lines: deque[str] = field(default_factory=lambda: deque(maxlen=_LOG_TAIL_MAX_LINES))
+    partial: bytes = b""
+    edge: bytes = b""
 
 
 def logs_screen(stdscr: Any, case_path: Path) -> None:
@@ -60,7 +77,7 @@ def logs_screen(stdscr: Any, case_path: Path) -> None:
 
 
 def log_tail_screen(stdscr: Any, case_path: Path) -> None:
-    log_files = sorted(case_path.glob("log.*"))
+    log_files = _list_logs(case_path)
     if not log_files:
         _show_message(stdscr, "No log.* files found in case directory.")
         return
@@ -77,69 +94,165 @@ def log_tail_screen(stdscr: Any, case_path: Path) -> None:
     if choice == -1 or choice == len(labels):
         return
 
-    path = log_files[choice]
+    tail_log_file(stdscr, log_files[choice])
+
+
+def tail_log_file(stdscr: Any, path: Path) -> None:
     cfg = get_config()
-    patterns = ["FATAL", "bounding", "Courant", "nan", "SIGFPE", "floating point exception"]
-    stdscr.timeout(_LOG_TAIL_POLL_MS)
+    back_keys = cfg.keys.get("back", [])
+    header = f"Tailing {path.name} ({key_hint('back', 'h')} to exit)"
+    state = _TailState()
+    view: tuple[list[str], list[bool], str] | None = None
+    flush_tool_logs()
+    set_input_timeout(stdscr, _LOG_TAIL_POLL_MS)
     try:
         while True:
             try:
-                lines = read_log_tail_lines(
-                    path,
-                    max_lines=_LOG_TAIL_MAX_LINES,
-                    max_bytes=_LOG_TAIL_MAX_BYTES,
-                )
+                changed = _refresh_tail_state(path, state)
             except OSError as exc:
                 _show_message(stdscr, f"Failed to read {path.name}: {exc}")
                 return
-            tail = lines[-50:]
-            last_courant = extract_last_courant(lines)
-            has_fpe = any("floating point exception" in line.lower() for line in lines)
-            has_nan = any("nan" in line.lower() for line in lines)
-            alerts = []
-            if last_courant is not None and last_courant > cfg.courant_limit:
-                alerts.append(f"Courant>{cfg.courant_limit:g}")
-            if has_fpe:
-                alerts.append("FPE")
-            if has_nan:
-                alerts.append("NaN")
+            if changed or view is None:
+                view = _tail_view(_tail_state_lines(state), cfg.courant_limit)
+            tail, marks, highlight = view
             stdscr.clear()
             height, width = stdscr.getmaxyx()
-            back_hint = key_hint("back", "h")
-            header = f"Tailing {path.name} ({back_hint} to exit)"
             with suppress(curses.error):
                 stdscr.addstr(header[: max(1, width - 1)] + "\n")
             with suppress(curses.error):
-                highlight = "Highlight: " + ", ".join(patterns)
-                if last_courant is not None:
-                    highlight += f" | Courant max: {last_courant:g}"
-                if alerts:
-                    highlight += " | ALERT: " + ", ".join(alerts)
                 stdscr.addstr(highlight[: max(1, width - 1)] + "\n\n")
-            for line in tail:
-                if stdscr.getyx()[0] >= height - 1:
-                    break
-                mark = ""
-                if any(pat.lower() in line.lower() for pat in patterns):
-                    mark = "!! "
-                    with suppress(curses.error):
-                        stdscr.attron(curses.A_BOLD)
-                try:
-                    stdscr.addstr((mark + line)[: max(1, width - 1)] + "\n")
-                except curses.error:
-                    break
-                if mark:
-                    with suppress(curses.error):
-                        stdscr.attroff(curses.A_BOLD)
+            _draw_tail_block(stdscr, tail, marks, height=height, width=width)
             stdscr.refresh()
             key = stdscr.getch()
-            if key_in(key, get_config().keys.get("back", [])):
+            if key_in(key, back_keys):
                 return
     finally:
-        stdscr.timeout(-1)
+        set_input_timeout(stdscr, -1)
+
+
+def _tail_view(lines: list[str], courant_limit: float) -> tuple[list[str], list[bool], str]:
+    has_fpe = has_nan = False
+    last_courant = None
+    marks = []
+    for line in lines:
+        lowered = line.lower()
+        if "floating point exception" in lowered:
+            has_fpe = True
+        if "nan" in lowered:
+            has_nan = True
+        if "courant" in lowered:
+            value = parse_courant_line(line)
+            if value is not None:
+                last_courant = value
+        marks.append(any(pat in lowered for pat in _LOG_TAIL_PATTERNS_LOWER))
+    alerts = []
+    if last_courant is not None and last_courant > courant_limit:
+        alerts.append(f"Courant>{courant_limit:g}")
+    if has_fpe:
+        alerts.append("FPE")
+    if has_nan:
+        alerts.append("NaN")
+    highlight = "Highlight: " + ", ".join(_LOG_TAIL_PATTERNS)
+    if last_courant is not None:
+        highlight += f" | Courant max: {last_courant:g}"
+    if alerts:
+        highlight += " | ALERT: " + ", ".join(alerts)
+    visible = _LOG_TAIL_VISIBLE_LINES
+    return lines[-visible:], marks[-visible:], highlight
+
+
+def _draw_tail_block(
+    stdscr: Any,
+    lines: list[str],
+    marks: list[bool],
+    *,
+    height: int,
+    width: int,
+) -> None:
+    start_row = stdscr.getyx()[0]
+    rows = min(len(lines), max(0, height - 1 - start_row))
+    if rows <= 0:
+        return
+    limit = max(1, width - 1)
+    marked = marks[-rows:]
+    body = "".join(
+        ("!! " + line if mark else line)[:limit] + "\n"
+        for line, mark in zip(lines[-rows:], marked, strict=True)
+    )
+    with suppress(curses.error):
+        stdscr.addstr(start_row, 0, body)
+    for offset, mark in enumerate(marked):
+        if mark:
+            with suppress(curses.error):
+                stdscr.chgat(start_row + offset, 0, limit, curses.A_BOLD)
+
+
+def _refresh_tail_state(path: Path, state: _TailState) -> bool:
+    stat = path.stat()
+    if (stat.st_ino, stat.st_size, stat.st_mtime_ns) == (state.ino, state.size, state.mtime_ns):
+        return False
+    grown = stat.st_size - state.size
+    if (
+        stat.st_ino != state.ino
+        or state.size < 0
+        or not 0 <= grown <= _LOG_TAIL_MAX_BYTES
+        or not _append_tail_bytes(path, state, grown)
+    ):
+        _reset_tail_state(path, state, stat.st_size)
+    state.ino = stat.st_ino
+    state.size = stat.st_size
+    state.mtime_ns = stat.st_mtime_ns
+    return True
+
+
+def _append_tail_bytes(path: Path, state: _TailState, grown: int) -> bool:
+    # Re-read the bytes just before the old end; if they changed, the log was
+    # truncated and regrew between polls, so the caller reloads the tail.
+    with path.open("rb") as handle:
+        handle.seek(state.size - len(state.edge))
+        data = handle.read(len(state.edge) + grown)
+    if not data.startswith(state.edge):
+        return False
+    if grown:
+        fresh = data[len(state.edge):]
+        state.edge = data[-_LOG_TAIL_EDGE_BYTES:]
+        *complete, partial = (state.partial + fresh).split(b"\n")
+        # A writer that never emits a newline must not grow the tail unbounded.
+        state.partial = partial[-_LOG_TAIL_MAX_BYTES:]
+        state.lines.extend(line.decode("utf-8", errors="ignore").rstrip("\r") for line in complete)
+    return True
+
+
+def _reset_tail_state(path: Path, state: _TailState, size: int) -> None:
+    state.lines.clear()
+    state.lines.extend(
+        read_log_tail_lines(
+            path,
+            max_lines=_LOG_TAIL_MAX_LINES,
+            max_bytes=_LOG_TAIL_MAX_BYTES,
+        ),
+    )
+    state.partial = b""
+    state.edge = b""
+    if size <= 0:
+        return
+    edge_len = min(size, _LOG_TAIL_EDGE_BYTES)
+    with path.open("rb") as handle:
+        handle.seek(size - edge_len)
+        state.edge = handle.read(edge_len)
+    if state.lines and not state.edge.endswith(b"\n"):
+        state.partial = state.lines.pop().encode("utf-8")
+
+
+def _tail_state_lines(state: _TailState) -> list[str]:
+    lines = list(state.lines)
+    if state.partial:
+        lines.append(state.partial.decode("utf-8", errors="ignore"))
+    return lines
 
 
 def _read_log_view_text(path: Path) -> str:
+    flush_tool_logs()
     size = path.stat().st_size
     if size <= _LOG_VIEW_MAX_BYTES:
         return path.read_text(encoding="utf-8", errors="ignore")
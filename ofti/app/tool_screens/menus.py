@@ -1,30 +1,18 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
-from functools import partial
+from importlib import import_module
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-from ofti.app import case_ops, logs_analysis, logs_fields, time_pruner
+from ofti.app import case_ops
 from ofti.app.menus import case_tools as shared_case_tools
 from ofti.app.tool_screens import (
-    cleaning_ops,
     diagnostics,
     job_control,
-    logs_probes,
-    logs_view,
-    mesh_utils,
-    parametric,
-    pipeline,
-    postprocessing,
-    reconstruct,
-    run,
     shell_tools,
-    solver,
-    solver_control,
-    tool_dicts_foamcalc,
-    tool_dicts_postprocess,
     yplus,
 )
 from ofti.app.tool_screens.menu_helpers import build_menu
@@ -41,54 +29,68 @@ from ofti.tools import case_doctor
 from ofti.tools.cli_tools import run as run_ops
 from ofti.tools.tool_aliases import STATIC_TOOL_ALIAS_GROUPS
 from ofti.ui.help import menu_hint, tools_help, tools_physics_help
-from ofti.ui_curses.blockmesh_helper import blockmesh_helper_screen
-from ofti.ui_curses.boundary_matrix import boundary_matrix_screen
 from ofti.ui_curses.high_speed import high_speed_helper_screen
-from ofti.ui_curses.initial_conditions import initial_conditions_screen
 from ofti.ui_curses.snappy_toggle import snappy_staged_screen
-from ofti.ui_curses.thermo_wizard import thermophysical_wizard_screen
 
-clean_time_directories = cleaning_ops.clean_time_directories
 clone_case = case_ops.clone_case
 diagnostics_screen = diagnostics.diagnostics_screen
-foam_calc_prompt = tool_dicts_foamcalc.foam_calc_prompt
-log_analysis_screen = logs_analysis.log_analysis_screen
-field_summary_screen = logs_fields.field_summary_screen
-logs_screen = logs_view.logs_screen
-pipeline_editor_screen = pipeline.pipeline_editor_screen
-pipeline_runner_screen = pipeline.pipeline_runner_screen
-foamlib_parametric_study_screen = parametric.foamlib_parametric_study_screen
 open_paraview_screen = case_ops.open_paraview_screen
-post_process_prompt = tool_dicts_postprocess.post_process_prompt
-probes_viewer_screen = logs_probes.probes_viewer_screen
-reconstruct_manager_screen = reconstruct.reconstruct_manager_screen
-remove_all_logs = cleaning_ops.remove_all_logs
 rerun_last_tool = shell_tools.rerun_last_tool
 job_status_poll_screen = shell_tools.job_status_poll_screen
 run_tool_background_screen = job_control.run_tool_background_screen
 stop_job_screen = job_control.stop_job_screen
 pause_job_screen = job_control.pause_job_screen
 resume_job_screen = job_control.resume_job_screen
-residual_timeline_screen = logs_analysis.residual_timeline_screen
-run_checkmesh = run.run_checkmesh
-run_current_solver = solver.run_current_solver
-run_current_solver_live = solver.run_current_solver_live
-run_current_solver_parallel = solver.run_current_solver_parallel
 run_shell_script_screen = shell_tools.run_shell_script_screen
-renumber_mesh_screen = mesh_utils.renumber_mesh_screen
-transform_points_screen = mesh_utils.transform_points_screen
-cfmesh_screen = mesh_utils.cfmesh_screen
-safe_stop_screen = solver_control.safe_stop_screen
-sampling_sets_screen = postprocessing.sampling_sets_screen
-postprocessing_browser_screen = postprocessing.postprocessing_browser_screen
-solver_resurrection_screen = solver_control.solver_resurrection_screen
-time_directory_pruner_screen = time_pruner.time_directory_pruner_screen
 yplus_screen = yplus.yplus_screen
 
-
-@dataclass
+# Screens only reachable through tool aliases are imported on first use.
+_LAZY_SCREENS: dict[str, str] = {
+    "blockmesh_helper_screen": "ofti.ui_curses.blockmesh_helper",
+    "boundary_matrix_screen": "ofti.ui_curses.boundary_matrix",
+    "case_doctor_screen": "ofti.tools.case_doctor",
+    "cfmesh_screen": "ofti.app.tool_screens.mesh_utils",
+    "clean_time_directories": "ofti.app.tool_screens.cleaning_ops",
+    "field_summary_screen": "ofti.app.logs_fields",
+    "foam_calc_prompt": "ofti.app.tool_screens.tool_dicts_foamcalc",
+    "foamlib_parametric_study_screen": "ofti.app.tool_screens.parametric",
+    "initial_conditions_screen": "ofti.ui_curses.initial_conditions",
+    "log_analysis_screen": "ofti.app.logs_analysis",
+    "logs_screen": "ofti.app.tool_screens.logs_view",
+    "pipeline_editor_screen": "ofti.app.tool_screens.pipeline",
+    "pipeline_runner_screen": "ofti.app.tool_screens.pipeline",
+    "post_process_prompt": "ofti.app.tool_screens.tool_dicts_postprocess",
+    "postprocessing_browser_screen": "ofti.app.tool_screens.postprocessing",
+    "probes_viewer_screen": "ofti.app.tool_screens.logs_probes",
+    "reconstruct_manager_screen": "ofti.app.tool_screens.reconstruct",
+    "remove_all_logs": "ofti.app.tool_screens.cleaning_ops",
+    "renumber_mesh_screen": "ofti.app.tool_screens.mesh_utils",
+    "residual_timeline_screen": "ofti.app.logs_analysis",
+    "run_checkmesh": "ofti.app.tool_screens.run",
+    "run_current_solver": "ofti.app.tool_screens.solver",
+    "run_current_solver_live": "ofti.app.tool_screens.solver",
+    "run_current_solver_parallel": "ofti.app.tool_screens.solver",
+    "safe_stop_screen": "ofti.app.tool_screens.solver_control",
+    "sampling_sets_screen": "ofti.app.tool_screens.postprocessing",
+    "solver_resurrection_screen": "ofti.app.tool_screens.solver_control",
+    "thermophysical_wizard_screen": "ofti.ui_curses.thermo_wizard",
+    "time_directory_pruner_screen": "ofti.app.time_pruner",
+    "transform_points_screen": "ofti.app.tool_screens.mesh_utils",
+}
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_SCREENS.get(name)
+    if module_name is None:
+        raise AttributeError(name)
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+@dataclass(frozen=True)
 class _ToolAlias:
-    handler: Callable[[], None]
+    handler_key: str
     background_cmd: list[str] | None
     display_name: str
 
@@ -120,9 +122,8 @@ def run_tool_by_name(
         )
         return True
 
-    aliases = _tool_aliases(stdscr, case_path)
     key = run_ops.normalize_tool_name(name)
-    alias = aliases.get(key)
+    alias = _TOOL_ALIAS_TABLE.get(key)
     if alias is None:
         return False
     if background:
@@ -136,7 +137,7 @@ def run_tool_by_name(
             alias.background_cmd,
         )
         return True
-    alias.handler()
+    _tool_alias_handler(alias.handler_key)(stdscr, case_path)
     return True
 
 
@@ -203,87 +204,92 @@ def case_operations_screen(
         shared_case_tools.compare_dictionaries_screen(stdscr, case_path)
 
 
-def _tool_aliases(stdscr: Any, case_path: Path) -> dict[str, _ToolAlias]:
+def _build_tool_alias_table() -> Mapping[str, _ToolAlias]:
     aliases: dict[str, _ToolAlias] = {}
-
-    def add(
-        name: str,
-        handler: Callable[[], None],
-        background_cmd: list[str] | None = None,
-    ) -> None:
-        key = run_ops.normalize_tool_name(name)
-        existing = aliases.get(key)
-        if existing and background_cmd is None:
-            background_cmd = existing.background_cmd
-        aliases[key] = _ToolAlias(handler=handler, background_cmd=background_cmd, display_name=name)
-
-    def add_many(
-        names: tuple[str, ...],
-        handler: Callable[[], None],
-        background_cmd: list[str] | None = None,
-    ) -> None:
-        for name in names:
-            add(name, handler, background_cmd)
-
-    def bind(func: Callable[[Any, Path], None]) -> Callable[[], None]:
-        return partial(func, stdscr, case_path)
-
-    handlers: dict[str, Callable[[], None]] = {
-        "rerun": bind(rerun_last_tool),
-        "highspeed": bind(high_speed_helper_screen),
-        "boundarymatrix": bind(boundary_matrix_screen),
-        "initialconditions": bind(initial_conditions_screen),
-        "thermowizard": bind(thermophysical_wizard_screen),
-        "blockmeshhelper": bind(blockmesh_helper_screen),
-        "snappystaged": bind(_run_snappy_staged),
-        "pipelineedit": bind(pipeline_editor_screen),
-        "pipelinerun": bind(pipeline_runner_screen),
-        "parametricwizard": bind(foamlib_parametric_study_screen),
-        "fieldsummary": bind(field_summary_screen),
-        "postprocessingbrowser": bind(postprocessing_browser_screen),
-        "samplingsets": bind(sampling_sets_screen),
-        "runparallel": bind(run_current_solver_parallel),
-        "meshquality": bind(run_checkmesh),
-        "physicshelpers": bind(physics_tools_screen),
-        "runscript": bind(run_shell_script_screen),
-        "postprocess": bind(post_process_prompt),
-        "foamcalc": bind(foam_calc_prompt),
-        "runcurrentsolver": bind(run_current_solver),
-        "runlive": bind(run_current_solver_live),
-        "removelogs": bind(remove_all_logs),
-        "cleantimedirs": bind(clean_time_directories),
-        "reconstruct_manager": bind(reconstruct_manager_screen),
-        "timedir_pruner": bind(time_directory_pruner_screen),
-        "safestop": bind(safe_stop_screen),
-        "solveresume": bind(solver_resurrection_screen),
-        "clone": bind(clone_case),
-        "yplus": bind(yplus_screen),
-        "logs": bind(logs_screen),
-        "residuals": bind(residual_timeline_screen),
-        "probes": bind(probes_viewer_screen),
-        "loganalysis": bind(log_analysis_screen),
-        "paraview": bind(open_paraview_screen),
-        "diagnostics": bind(diagnostics_screen),
-        "casedoctor": bind(case_doctor.case_doctor_screen),
-        "jobstatus": bind(job_status_poll_screen),
-        "jobstart": bind(run_tool_background_screen),
-        "jobstop": bind(stop_job_screen),
-        "jobpause": bind(pause_job_screen),
-        "jobresume": bind(resume_job_screen),
-        "clitools": bind(case_operations_screen),
-        "knife": bind(case_operations_screen),
-        "plot": bind(residual_timeline_screen),
-        "watch": bind(job_status_poll_screen),
-        "run": bind(run_current_solver),
-        "renumbermesh": bind(renumber_mesh_screen),
-        "transformpoints": bind(transform_points_screen),
-        "cfmesh": bind(cfmesh_screen),
-    }
     for names in STATIC_TOOL_ALIAS_GROUPS:
-        add_many(names, handlers[names[0]])
-
-    return aliases
-
+        for name in names:
+            key = run_ops.normalize_tool_name(name)
+            aliases[key] = _ToolAlias(
+                handler_key=names[0],
+                background_cmd=None,
+                display_name=name,
+            )
+    return MappingProxyType(aliases)
+
+
+# Handler attribute names are resolved at dispatch so they follow lazy
+# imports and module attribute overrides.
+_TOOL_ALIAS_HANDLERS: dict[str, str] = {
+    "rerun": "rerun_last_tool",
+    "highspeed": "high_speed_helper_screen",
+    "boundarymatrix": "boundary_matrix_screen",
+    "initialconditions": "initial_conditions_screen",
+    "thermowizard": "thermophysical_wizard_screen",
+    "blockmeshhelper": "blockmesh_helper_screen",
+    "snappystaged": "_run_snappy_staged",
+    "pipelineedit": "pipeline_editor_screen",
+    "pipelinerun": "pipeline_runner_screen",
+    "parametricwizard": "foamlib_parametric_study_screen",
+    "fieldsummary": "field_summary_screen",
+    "postprocessingbrowser": "postprocessing_browser_screen",
+    "samplingsets": "sampling_sets_screen",
+    "runparallel": "run_current_solver_parallel",
+    "meshquality": "run_checkmesh",
+    "physicshelpers": "physics_tools_screen",
+    "runscript": "run_shell_script_screen",
+    "postprocess": "post_process_prompt",
+    "foamcalc": "foam_calc_prompt",
+    "runcurrentsolver": "run_current_solver",
+    "runlive": "run_current_solver_live",
+    "removelogs": "remove_all_logs",
+    "cleantimedirs": "clean_time_directories",
+    "reconstruct_manager": "reconstruct_manager_screen",
+    "timedir_pruner": "time_directory_pruner_screen",
+    "safestop": "safe_stop_screen",
+    "solveresume": "solver_resurrection_screen",
+    "clone": "clone_case",
+    "yplus": "yplus_screen",
+    "logs": "logs_screen",
+    "residuals": "residual_timeline_screen",
+    "probes": "probes_viewer_screen",
+    "loganalysis": "log_analysis_screen",
+    "paraview": "open_paraview_screen",
+    "diagnostics": "diagnostics_screen",
+    "casedoctor": "case_doctor_screen",
+    "jobstatus": "job_status_poll_screen",
+    "jobstart": "run_tool_background_screen",
+    "jobstop": "stop_job_screen",
+    "jobpause": "pause_job_screen",
+    "jobresume": "resume_job_screen",
+    "clitools": "case_operations_screen",
+    "knife": "case_operations_screen",
+    "plot": "residual_timeline_screen",
+    "watch": "job_status_poll_screen",
+    "run": "run_current_solver",
+    "renumbermesh": "renumber_mesh_screen",
+    "transformpoints": "transform_points_screen",
+    "cfmesh": "cfmesh_screen",
+}
+
+
+def _tool_alias_handler(handler_key: str) -> Callable[[Any, Path], None]:
+    name = _TOOL_ALIAS_HANDLERS[handler_key]
+    return globals().get(name) or __getattr__(name)
+
+
+_TOOL_ALIAS_TABLE = _build_tool_alias_table()
+
+
+_TOOLS_SPECIAL_LABELS = (
+    "Diagnostics",
+    "Case doctor",
+    "Case operations",
+    "Run shell script",
+    "Clone case",
+    "Job status",
+    "Stop job",
+    "Physics helpers",
+)
 
 TOOLS_SPECIAL_HINTS = [
     "Environment and installation checks",
@@ -307,24 +313,22 @@ def tools_screen(
     """Tools menu with common solvers/utilities, job helpers, logs, and
     optional shell scripts, all in a single flat list.
     """
-    base_tools: list[tuple[str, list[str]]] = []
-    extra_tools = load_tool_presets(case_path)
-    post_tools = [
-        (f"[post] {name}", cmd) for name, cmd in load_postprocessing_presets(case_path)
+    simple_tools = [
+        *load_tool_presets(case_path),
+        *((f"[post] {name}", cmd) for name, cmd in load_postprocessing_presets(case_path)),
     ]
 
-    simple_tools = base_tools + extra_tools + post_tools
-
-    labels = ["Re-run last tool"] + [name for name, _ in simple_tools] + [
-        "Diagnostics",
-        "Case doctor",
-        "Case operations",
-        "Run shell script",
-        "Clone case",
-        "Job status",
-        "Stop job",
-        "Physics helpers",
+    labels = [
+        "Re-run last tool",
+        *(name for name, _ in simple_tools),
+        *_TOOLS_SPECIAL_LABELS,
     ]
+    menu_labels = [*labels, "Back"]
+
+    # The OpenFOAM environment does not change while the menu is open.
+    mode = tool_status_mode()
+    no_foam = _no_foam_active()
+    help_lines = tools_help()
 
     def hint_for(idx: int) -> str:
         if idx == 0:
@@ -333,25 +337,25 @@ def tools_screen(
                 base = "Re-run last tool (none yet)"
             else:
                 base = f"Re-run last tool: {last.name}"
-            return f"{base} | {tool_status_mode()}"
+            return f"{base} | {mode}"
         simple_index = idx - 1
         if 0 <= simple_index < len(simple_tools):
             name, _cmd = simple_tools[simple_index]
             if name.startswith("[post]"):
-                return f"Post-processing preset: {name} | {tool_status_mode()}"
-            return f"Run tool: {name} | {tool_status_mode()}"
+                return f"Post-processing preset: {name} | {mode}"
+            return f"Run tool: {name} | {mode}"
         special = idx - 1 - len(simple_tools)
         if 0 <= special < len(TOOLS_SPECIAL_HINTS):
             label = labels[idx]
             base = menu_hint("menu:tools", label) or TOOLS_SPECIAL_HINTS[special]
-            return f"{base} | {tool_status_mode()}"
+            return f"{base} | {mode}"
         label = labels[idx] if 0 <= idx < len(labels) else ""
         return menu_hint("menu:tools", label)
 
-    disabled = set(range(len(labels))) if _no_foam_active() else None
+    disabled = set(range(len(labels))) if no_foam else None
     status_line = (
         "Limited mode: OpenFOAM env not found (simple editor only)"
-        if _no_foam_active()
+        if no_foam
         else None
     )
 
@@ -365,14 +369,14 @@ def tools_screen(
         menu = build_menu(
             stdscr,
             "Tools",
-            [*labels, "Back"],
+            menu_labels,
             menu_key="menu:tools",
             hint_provider=hint_for,
             status_line=status,
             disabled_indices=disabled,
             command_handler=command_handler,
             command_suggestions=command_suggestions,
-            help_lines=tools_help(),
+            help_lines=help_lines,
         )
         choice = menu.navigate()
         if choice in (-1, len(labels)):
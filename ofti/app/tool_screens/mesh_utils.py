@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import shlex
 from pathlib import Path
 from typing import Any
 
+from ofti.app.tool_screens import job_control
+from ofti.app.tool_screens.logs_view import _read_log_view_text, tail_log_file
 from ofti.app.tool_screens.menu_helpers import build_menu
-from ofti.app.tool_screens.runner import _show_message, run_tool_command
+from ofti.app.tool_screens.runner import _show_message, flush_tool_logs, run_tool_command
 from ofti.ui_curses.prompts import prompt_args_line, prompt_line
 from ofti.ui_curses.viewer import Viewer
 
@@ -48,7 +51,7 @@ def transform_points_screen(stdscr: Any, case_path: Path) -> None:
         case_path,
         "transformPoints",
         cmd,
-        status=f"Running {' '.join(cmd)}...",
+        status=f"Running {shlex.join(cmd)}...",
     )
 
 
@@ -57,7 +60,12 @@ def cfmesh_screen(stdscr: Any, case_path: Path) -> None:
     if not cfmesh_dict.is_file():
         _show_message(stdscr, "system/cfMeshDict not found.")
         return
-    options = ["Run cartesianMesh", "View cartesianMesh log", "Back"]
+    options = [
+        "Run cartesianMesh",
+        "View cartesianMesh log",
+        "Tail cartesianMesh log (live)",
+        "Back",
+    ]
     menu = build_menu(
         stdscr,
         "cfMesh",
@@ -67,18 +75,30 @@ def cfmesh_screen(stdscr: Any, case_path: Path) -> None:
     choice = menu.navigate()
     if choice in (-1, len(options) - 1):
         return
+    log_path = case_path / "log.cartesianMesh"
     if choice == 0:
-        run_tool_command(
-            stdscr,
-            case_path,
-            "cartesianMesh",
-            ["cartesianMesh"],
-            status="Running cartesianMesh...",
-        )
+        if job_control.start_tool_background(
+            stdscr, case_path, "cartesianMesh", ["cartesianMesh"],
+        ):
+            tail_log_file(stdscr, log_path)
         return
-    if choice == 1:
-        log_path = case_path / "log.cartesianMesh"
+    if choice == 2:
+        flush_tool_logs()
         if not log_path.is_file():
             _show_message(stdscr, "log.cartesianMesh not found.")
             return
-        Viewer(stdscr, log_path.read_text(errors="ignore")).display()
+        tail_log_file(stdscr, log_path)
+        return
+    _view_cfmesh_log(stdscr, log_path)
+
+
+def _view_cfmesh_log(stdscr: Any, log_path: Path) -> None:
+    try:
+        text = _read_log_view_text(log_path)
+    except FileNotFoundError:
+        _show_message(stdscr, "log.cartesianMesh not found.")
+        return
+    except OSError as exc:
+        _show_message(stdscr, f"Failed to read {log_path.name}: {exc}")
+        return
+    Viewer(stdscr, text).display()
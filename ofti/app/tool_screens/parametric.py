@@ -1,30 +1,38 @@
 from __future__ import annotations
 
+import os
+import re
 from pathlib import Path
 from typing import Any
 
 from ofti.app.tool_screens.menu_helpers import build_menu
 from ofti.app.tool_screens.runner import _show_message
 from ofti.core import postprocessing as postprocessing_core
+from ofti.core.case import read_number_of_subdomains
 from ofti.foamlib.parametric import (
     build_parametric_cases,
     build_parametric_cases_from_csv,
     build_parametric_cases_from_grid,
     preprocessing_available,
 )
-from ofti.foamlib.runner import run_cases
+from ofti.foamlib.runner import async_available, run_cases, run_cases_async
+from ofti.ui.status import status_message
 from ofti.ui_curses.prompts import prompt_line
 from ofti.ui_curses.viewer import Viewer
 
+_VALUE_TOKEN_RE = re.compile(r"[^,\s](?:[^,]*[^,\s])?")
+
 
 def foamlib_parametric_study_screen(
     stdscr: Any,
     case_path: Path,
 ) -> None:
-    presets_path = case_path / "ofti.parametric"
+    presets_path = postprocessing_core.parametric_presets_path(case_path)
     presets: list[postprocessing_core.ParametricPreset] = []
+    max_parallel: int | None = None
     if presets_path.is_file():
         presets, errors = postprocessing_core.read_parametric_presets(presets_path)
+        max_parallel = postprocessing_core.read_parametric_parallel(presets_path)
         if errors:
             _show_message(stdscr, "Errors in ofti.parametric; falling back to manual input.")
             presets = []
@@ -52,7 +60,7 @@ def foamlib_parametric_study_screen(
     if flow is None:
         return
     created, run_solver = flow
-    _show_parametric_results(stdscr, created, run_solver)
+    _show_parametric_results(stdscr, created, run_solver, max_parallel=max_parallel)
 
 
 def _select_parametric_mode(
@@ -61,8 +69,8 @@ def _select_parametric_mode(
     *,
     preprocessing_ready: bool,
 ) -> tuple[str, postprocessing_core.ParametricPreset | None] | None:
-    if not presets and not preprocessing_ready:
-        return "single", None
+    if not preprocessing_ready and len(presets) <= 1:
+        return "single", presets[0] if presets else None
 
     labels: list[str] = []
     hints: list[str] = []
@@ -165,12 +173,20 @@ def _run_grid_parametric_flow(
     return created, run_solver
 
 
-def _show_parametric_results(stdscr: Any, created: list[Path], run_solver: bool) -> None:
+def _show_parametric_results(
+    stdscr: Any,
+    created: list[Path],
+    run_solver: bool,
+    *,
+    header: str | None = None,
+    max_parallel: int | None = None,
+) -> None:
     failures: list[Path] = []
     if run_solver:
-        failures = run_cases(created, check=False)
+        failures = _run_created_cases(stdscr, created, max_parallel=max_parallel)
 
     lines = [
+        *([header] if header else []),
         f"Created {len(created)} case(s):",
         *[f"- {path}" for path in created],
     ]
@@ -182,8 +198,50 @@ def _show_parametric_results(stdscr: Any, created: list[Path], run_solver: bool)
     Viewer(stdscr, "\n".join(lines)).display()
 
 
+def _run_created_cases(
+    stdscr: Any, created: list[Path], *, max_parallel: int | None = None,
+) -> list[Path]:
+    if len(created) > 1 and async_available():
+        limit = max(1, min(len(created), max_parallel or _default_case_parallel(created[0])))
+        completed = 0
+        failed = 0
+
+        def _case_done(_path: Path, ok: bool) -> None:
+            nonlocal completed, failed
+            completed += 1
+            failed += not ok
+            suffix = f" ({failed} failed)" if failed else ""
+            status_message(stdscr, f"Completed {completed}/{len(created)} cases{suffix}...")
+
+        status_message(stdscr, f"Running {len(created)} cases ({limit} at a time)...")
+        return run_cases_async(
+            created, check=False, max_parallel=limit, on_case_done=_case_done,
+        )
+    return run_cases(created, check=False)
+
+
+def _default_case_parallel(case_path: Path) -> int:
+    # Decomposed cases run numberOfSubdomains ranks each; share the CPUs out.
+    cpus = os.cpu_count() or 1
+    decompose_dict = case_path / "system" / "decomposeParDict"
+    if not decompose_dict.is_file():
+        return cpus
+    subdomains = read_number_of_subdomains(decompose_dict) or 1
+    return max(1, cpus // subdomains)
+
+
+def _prompt_parallel(stdscr: Any, case_path: Path, default: int | None) -> int | None:
+    shown = default or _default_case_parallel(case_path)
+    raw = _prompt_line(stdscr, f"Cases to run at a time [{shown}]: ")
+    try:
+        value = int(raw)
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
 def _prompt_line(stdscr: Any, prompt: str) -> str:
-    stdscr.clear()
+    stdscr.erase()
     value = prompt_line(stdscr, prompt)
     if value is None:
         return ""
@@ -197,53 +255,40 @@ def _parametric_form(
     values: list[str],
     run_solver: bool,
 ) -> tuple[str, str, list[str], bool] | None:
+    options = [
+        _parametric_form_option(idx, dict_path, entry, values, run_solver)
+        for idx in range(len(_PARAMETRIC_FORM_OPTIONS))
+    ]
+    handlers = {
+        0: _update_parametric_dict,
+        1: _update_parametric_entry,
+        2: _update_parametric_values,
+        3: _toggle_parametric_run,
+    }
+    menu = build_menu(
+        stdscr,
+        "Parametric wizard",
+        options,
+        menu_key="menu:parametric_form",
+        hint_provider=_parametric_form_hint,
+        status_line=(
+            "Creates sibling case folders; existing destination folders cause an error"
+        ),
+        help_lines=_parametric_form_help_lines(),
+    )
     while True:
-        values_text = ", ".join(values) if values else "<none>"
-        options = [
-            f"Dictionary file: {dict_path or 'system/controlDict'}",
-            f"Entry key: {entry or '<required>'}",
-            f"Sweep values: {values_text}",
-            f"Run solver: {'yes' if run_solver else 'no'}",
-            "Create cases",
-            "Back",
-        ]
-        def hint_for(idx: int) -> str:
-            hints = [
-                "Path inside case, e.g. system/controlDict or constant/thermophysicalProperties",
-                "Dictionary key (supports dotted keys), e.g. application or thermoType.transport",
-                "Comma-separated values. Example: simpleFoam, pisoFoam",
-                "Toggle whether to run solver in each created case",
-                "Create variant case folders with selected values",
-                "Return without changes",
-            ]
-            if 0 <= idx < len(hints):
-                return hints[idx]
-            return ""
-
-        menu = build_menu(
-            stdscr,
-            "Parametric wizard",
-            options,
-            menu_key="menu:parametric_form",
-            hint_provider=hint_for,
-            status_line=(
-                "Creates sibling case folders; existing destination folders cause an error"
-            ),
-            help_lines=_parametric_form_help_lines(),
-        )
         choice = menu.navigate()
         if choice in (-1, len(options) - 1):
             return None
-        handlers = {
-            0: _update_parametric_dict,
-            1: _update_parametric_entry,
-            2: _update_parametric_values,
-            3: _toggle_parametric_run,
-        }
         if choice in handlers:
+            previous_values = values
             dict_path, entry, values, run_solver = handlers[choice](
                 stdscr, dict_path, entry, values, run_solver,
             )
+            if choice != 2 or values is not previous_values:
+                options[choice] = _parametric_form_option(
+                    choice, dict_path, entry, values, run_solver,
+                )
             continue
         if choice == 4:
             result = _finalize_parametric(
@@ -253,6 +298,59 @@ def _parametric_form(
                 return result
 
 
+_PARAMETRIC_FORM_OPTIONS = (
+    "Dictionary file: {}",
+    "Entry key: {}",
+    "Sweep values: {}",
+    "Run solver: {}",
+    "Create cases",
+    "Back",
+)
+_PARAMETRIC_FORM_HINTS = (
+    "Path inside case, e.g. system/controlDict or constant/thermophysicalProperties",
+    "Dictionary key (supports dotted keys), e.g. application or thermoType.transport",
+    "Comma-separated values. Example: simpleFoam, pisoFoam",
+    "Toggle whether to run solver in each created case",
+    "Create variant case folders with selected values",
+    "Return without changes",
+)
+
+
+_PARAMETRIC_CSV_HINTS = (
+    "CSV path relative to case root.",
+    "Toggle whether to run solver in each created case.",
+    "Create all case variants from the CSV table.",
+    "Return without changes.",
+)
+
+
+def _parametric_form_hint(idx: int) -> str:
+    return _PARAMETRIC_FORM_HINTS[idx] if 0 <= idx < len(_PARAMETRIC_FORM_HINTS) else ""
+
+
+def _parametric_csv_hint(idx: int) -> str:
+    return _PARAMETRIC_CSV_HINTS[idx] if 0 <= idx < len(_PARAMETRIC_CSV_HINTS) else ""
+
+
+def _parametric_form_option(
+    idx: int,
+    dict_path: str,
+    entry: str,
+    values: list[str],
+    run_solver: bool,
+) -> str:
+    template = _PARAMETRIC_FORM_OPTIONS[idx]
+    if idx == 0:
+        return template.format(dict_path or "system/controlDict")
+    if idx == 1:
+        return template.format(entry or "<required>")
+    if idx == 2:
+        return template.format(", ".join(values) if values else "<none>")
+    if idx == 3:
+        return template.format("yes" if run_solver else "no")
+    return template
+
+
 def _parametric_csv_form(
     stdscr: Any,
     csv_path: str,
@@ -265,24 +363,12 @@ def _parametric_csv_form(
             "Create cases",
             "Back",
         ]
-
-        def hint_for(idx: int) -> str:
-            hints = [
-                "CSV path relative to case root.",
-                "Toggle whether to run solver in each created case.",
-                "Create all case variants from the CSV table.",
-                "Return without changes.",
-            ]
-            if 0 <= idx < len(hints):
-                return hints[idx]
-            return ""
-
         menu = build_menu(
             stdscr,
             "Parametric CSV study",
             options,
             menu_key="menu:parametric_csv_form",
-            hint_provider=hint_for,
+            hint_provider=_parametric_csv_hint,
             help_lines=_parametric_csv_help_lines(),
         )
         choice = menu.navigate()
@@ -455,7 +541,7 @@ def _axis_label(index: int, axis: dict[str, Any]) -> str:
 
 
 def _split_values(raw: str) -> list[str]:
-    return [item.strip() for item in raw.split(",") if item.strip()]
+    return _VALUE_TOKEN_RE.findall(raw)
 
 
 def _update_parametric_dict(
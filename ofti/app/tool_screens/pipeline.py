@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import curses
-import shlex
+import os
+import sys
+from collections.abc import Callable
 from contextlib import suppress
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
@@ -11,12 +14,22 @@ from ofti.app.tool_screens.runner import _show_message
 from ofti.core import pipeline as pipeline_service
 from ofti.tools.tool_catalog import tool_catalog
 from ofti.ui.status import status_message
+from ofti.ui_curses.keys import drain_keys
 from ofti.ui_curses.prompts import prompt_args_line, prompt_command_line, prompt_line
 from ofti.ui_curses.viewer import Viewer
 
 PIPELINE_FILENAME = pipeline_service.PIPELINE_FILENAME
 PIPELINE_HEADER = pipeline_service.PIPELINE_HEADER
 PIPELINE_SET_COMMAND = pipeline_service.PIPELINE_SET_COMMAND
+_SYNC_OUTPUT_BEGIN = b"\x1b[?2026h"
+_SYNC_OUTPUT_END = b"\x1b[?2026l"
+_PIPELINE_CATALOG_CACHE_SIZE = 16
+_PIPELINE_CATALOG_CACHE: dict[
+    str, tuple[tuple[tuple[int, int] | None, ...], list[tuple[str, list[str]]]],
+] = {}
+_PIPELINE_BACK_KEYS = frozenset({ord("h"), 27})  # 27: ESC
+_PIPELINE_CREATE_KEYS = frozenset({ord("c"), ord("C")})
+_PIPELINE_NAV_STEPS = {curses.KEY_DOWN: 1, ord("j"): 1, curses.KEY_UP: -1, ord("k"): -1}
 
 
 def pipeline_runner_screen(stdscr: Any, case_path: Path) -> None:
@@ -41,9 +54,9 @@ def pipeline_editor_screen(stdscr: Any, case_path: Path) -> None:
         stdscr.clear()
         stdscr.addstr(f"{PIPELINE_FILENAME} not found.\n")
         stdscr.addstr(f"Press c to create with {PIPELINE_HEADER}, any other key to return.\n")
-        stdscr.refresh()
+        _flush_screen(stdscr)
         ch = stdscr.getch()
-        if ch in (ord("c"), ord("C")):
+        if ch in _PIPELINE_CREATE_KEYS:
             pipeline_service.write_pipeline_file(pipeline_path, [])
         else:
             return
@@ -53,9 +66,9 @@ def pipeline_editor_screen(stdscr: Any, case_path: Path) -> None:
         stdscr.clear()
         stdscr.addstr(f"{PIPELINE_FILENAME} is missing {PIPELINE_HEADER}.\n")
         stdscr.addstr("Press c to replace with an OFTI pipeline header, any other key to return.\n")
-        stdscr.refresh()
+        _flush_screen(stdscr)
         ch = stdscr.getch()
-        if ch in (ord("c"), ord("C")):
+        if ch in _PIPELINE_CREATE_KEYS:
             pipeline_service.write_pipeline_file(pipeline_path, [])
             commands = []
             errors = []
@@ -66,70 +79,149 @@ def pipeline_editor_screen(stdscr: Any, case_path: Path) -> None:
         Viewer(stdscr, "\n".join(lines)).display()
         return
 
-    cursor = 0
+    state = _PipelineEditorState(
+        stdscr,
+        case_path,
+        pipeline_path,
+        commands,
+        shebang=pipeline_service.read_pipeline_shebang(pipeline_path),
+    )
+    try:
+        _pipeline_editor_loop(state)
+    finally:
+        state.flush()
+
+
+def _pipeline_editor_loop(state: _PipelineEditorState) -> None:
+    stdscr = state.stdscr
+    pending = -1
+    dirty = True
     while True:
-        _render_pipeline_editor(stdscr, commands, cursor)
-        key = stdscr.getch()
-        if key in (ord("h"), 27):  # ESC
+        if pending == -1:
+            if dirty:
+                _render_pipeline_editor(stdscr, state.commands, state.cursor)
+                dirty = False
+            key = stdscr.getch()
+        else:
+            key, pending = pending, -1
+        if key in _PIPELINE_BACK_KEYS:
             return
-        if key in (curses.KEY_DOWN, ord("j")):
-            if commands:
-                cursor = min(len(commands) - 1, cursor + 1)
-            continue
-        if key in (curses.KEY_UP, ord("k")):
-            if commands:
-                cursor = max(0, cursor - 1)
-            continue
-        if key in (ord("a"),):
-            choice = _pipeline_pick_tool(stdscr, case_path)
-            if choice is not None:
-                insert_at = cursor + 1 if commands else 0
-                commands.insert(insert_at, choice)
-                cursor = insert_at
-                pipeline_service.write_pipeline_file(pipeline_path, commands)
-            continue
-        if key in (ord("e"),):
-            if not commands:
-                continue
-            current = " ".join(shlex.quote(part) for part in commands[cursor])
-            edited = prompt_line(stdscr, f"Edit command: {current}\n> ")
-            if edited is None:
-                continue
-            if not edited:
-                continue
-            try:
-                parts = shlex.split(edited)
-            except ValueError:
-                _show_message(stdscr, "Invalid command line.")
-                continue
-            commands[cursor] = parts
-            pipeline_service.write_pipeline_file(pipeline_path, commands)
-            continue
-        if key in (ord("d"),):
-            if commands:
-                commands.pop(cursor)
-                if cursor >= len(commands):
-                    cursor = max(0, len(commands) - 1)
-                pipeline_service.write_pipeline_file(pipeline_path, commands)
-            continue
-        if key in (ord("u"),):
-            if commands and cursor > 0:
-                commands[cursor - 1], commands[cursor] = commands[cursor], commands[cursor - 1]
-                cursor -= 1
-                pipeline_service.write_pipeline_file(pipeline_path, commands)
-            continue
-        if key in (ord("n"),):
-            if commands and cursor < len(commands) - 1:
-                commands[cursor + 1], commands[cursor] = commands[cursor], commands[cursor + 1]
-                cursor += 1
-                pipeline_service.write_pipeline_file(pipeline_path, commands)
-            continue
-        if key in (ord("r"),):
-            if commands:
-                _run_pipeline_commands(stdscr, case_path, commands)
-            else:
-                _show_message(stdscr, "Pipeline has no steps.")
+        if key in _PIPELINE_NAV_STEPS:
+            previous = state.cursor
+            state.cursor, pending = _drain_nav_keys(stdscr, key, state.cursor, len(state.commands))
+            dirty = dirty or state.cursor != previous
             continue
+        handler = _PIPELINE_KEYMAP.get(key)
+        if handler is not None:
+            # Handlers may overlay prompts or viewers, so always repaint after them.
+            handler(state)
+            dirty = True
+        elif key == curses.KEY_RESIZE:
+            dirty = True
+
+
+@dataclass
+class _PipelineEditorState:
+    stdscr: Any
+    case_path: Path
+    pipeline_path: Path
+    commands: list[list[str]]
+    cursor: int = 0
+    shebang: str | None = None
+    unsaved: bool = False
+
+    def flush(self) -> None:
+        # Edits are batched and written on run and on leaving the editor.
+        if not self.unsaved:
+            return
+        pipeline_service.write_pipeline_file(
+            self.pipeline_path, self.commands, shebang=self.shebang,
+        )
+        self.unsaved = False
+
+
+def _pipeline_add(state: _PipelineEditorState) -> None:
+    choice = _pipeline_pick_tool(state.stdscr, state.case_path)
+    if not choice:
+        return
+    insert_at = state.cursor + 1 if state.commands else 0
+    state.commands.insert(insert_at, choice)
+    state.cursor = insert_at
+    state.unsaved = True
+
+
+def _pipeline_edit(state: _PipelineEditorState) -> None:
+    if not state.commands:
+        return
+    current = pipeline_service.join_command_line(state.commands[state.cursor])
+    edited = prompt_line(state.stdscr, f"Edit command: {current}\n> ")
+    if not edited:
+        return
+    try:
+        parts = pipeline_service.split_command_line(edited)
+    except ValueError:
+        _show_message(state.stdscr, "Invalid command line.")
+        return
+    if not parts or parts == state.commands[state.cursor]:
+        return
+    state.commands[state.cursor] = parts
+    state.unsaved = True
+
+
+def _pipeline_delete(state: _PipelineEditorState) -> None:
+    if not state.commands:
+        return
+    state.commands.pop(state.cursor)
+    if state.cursor >= len(state.commands):
+        state.cursor = max(0, len(state.commands) - 1)
+    state.unsaved = True
+
+
+def _pipeline_move_up(state: _PipelineEditorState) -> None:
+    commands, cursor = state.commands, state.cursor
+    if commands and cursor > 0:
+        commands[cursor - 1], commands[cursor] = commands[cursor], commands[cursor - 1]
+        state.cursor -= 1
+        state.unsaved = True
+
+
+def _pipeline_move_down(state: _PipelineEditorState) -> None:
+    commands, cursor = state.commands, state.cursor
+    if commands and cursor < len(commands) - 1:
+        commands[cursor + 1], commands[cursor] = commands[cursor], commands[cursor + 1]
+        state.cursor += 1
+        state.unsaved = True
+
+
+def _pipeline_run(state: _PipelineEditorState) -> None:
+    if state.commands:
+        state.flush()
+        _run_pipeline_commands(state.stdscr, state.case_path, state.commands)
+    else:
+        _show_message(state.stdscr, "Pipeline has no steps.")
+
+
+_PIPELINE_KEYMAP: dict[int, Callable[[_PipelineEditorState], None]] = {
+    ord("a"): _pipeline_add,
+    ord("e"): _pipeline_edit,
+    ord("d"): _pipeline_delete,
+    ord("u"): _pipeline_move_up,
+    ord("n"): _pipeline_move_down,
+    ord("r"): _pipeline_run,
+}
+
+
+def _drain_nav_keys(stdscr: Any, key: int, cursor: int, count: int) -> tuple[int, int]:
+    # Apply a burst of queued j/k presses before redrawing once.
+    def step(queued: int) -> bool:
+        nonlocal cursor
+        if queued not in _PIPELINE_NAV_STEPS:
+            return False
+        cursor = max(0, min(count - 1, cursor + _PIPELINE_NAV_STEPS[queued]))
+        return True
+
+    step(key)
+    return cursor, drain_keys(stdscr, step)
 
 
 def _run_pipeline_commands(
@@ -144,13 +236,40 @@ def _run_pipeline_commands(
 
 
 def _pipeline_tool_catalog(case_path: Path) -> list[tuple[str, list[str]]]:
+    key = str(case_path)
+    stamp = _pipeline_catalog_stamp(case_path)
+    cached = _PIPELINE_CATALOG_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return list(cached[1])
     base = tool_catalog(case_path)
     custom = [
         ("[config] set entry", [PIPELINE_SET_COMMAND]),
         ("[custom] echo", ["echo"]),
         ("[custom] command", []),
     ]
-    return base + custom
+    catalog = base + custom
+    _PIPELINE_CATALOG_CACHE.pop(key, None)
+    _PIPELINE_CATALOG_CACHE[key] = (stamp, catalog)
+    while len(_PIPELINE_CATALOG_CACHE) > _PIPELINE_CATALOG_CACHE_SIZE:
+        _PIPELINE_CATALOG_CACHE.pop(next(iter(_PIPELINE_CATALOG_CACHE)))
+    return list(catalog)
+
+
+def _pipeline_catalog_stamp(case_path: Path) -> tuple[tuple[int, int] | None, ...]:
+    # The catalog depends on controlDict (solver) and the two preset files.
+    stamps: list[tuple[int, int] | None] = []
+    for path in (
+        case_path / "system" / "controlDict",
+        case_path / "ofti.tools",
+        case_path / "ofti.postprocessing",
+    ):
+        try:
+            stat = path.stat()
+        except OSError:
+            stamps.append(None)
+        else:
+            stamps.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(stamps)
 
 
 def _pipeline_pick_tool(stdscr: Any, case_path: Path) -> list[str] | None:
@@ -201,39 +320,71 @@ def _pipeline_pick_tool(stdscr: Any, case_path: Path) -> list[str] | None:
 def _render_pipeline_editor(
     stdscr: Any, commands: list[list[str]], cursor: int,
 ) -> None:
-    stdscr.clear()
+    # erase() lets curses send only the cells that changed since the last frame.
+    if hasattr(stdscr, "erase"):
+        stdscr.erase()
+    else:
+        stdscr.clear()
     height, width = stdscr.getmaxyx()
+    max_col = max(1, width - 1)
     header = f"Pipeline editor ({PIPELINE_FILENAME})"
     controls = "a:add  e:edit  d:delete  u:up  n:down  r:run  h/esc:back"
-    try:
-        stdscr.addstr(0, 0, header[: max(1, width - 1)])
-        stdscr.addstr(1, 0, PIPELINE_HEADER[: max(1, width - 1)])
-        stdscr.addstr(2, 0, controls[: max(1, width - 1)])
-    except curses.error:
-        return
+    # Rows are clipped to the window up front, so only the list rows can still
+    # trip curses (wide glyphs spilling into the bottom-right cell).
+    for row, text in enumerate((header, PIPELINE_HEADER, controls)[:height]):
+        stdscr.addstr(row, 0, text[:max_col])
     start_row = 4
     available = max(0, height - start_row)
-    if not commands:
-        with suppress(curses.error):
-            stdscr.addstr(start_row, 0, "(empty pipeline)"[: max(1, width - 1)])
-        stdscr.refresh()
+    if not (commands and available):
+        if available:
+            stdscr.addstr(start_row, 0, "(empty pipeline)"[:max_col])
+        _flush_screen(stdscr)
         return
     cursor = max(0, min(cursor, len(commands) - 1))
     scroll = max(0, min(cursor, max(0, len(commands) - available)))
-    for idx in range(scroll, min(len(commands), scroll + available)):
-        prefix = ">> " if idx == cursor else "   "
-        label = " ".join(shlex.quote(part) for part in commands[idx])
-        line = f"{prefix}{label}"
-        try:
-            if idx == cursor:
-                stdscr.attron(curses.color_pair(1))
-                stdscr.addstr(start_row + idx - scroll, 0, line[: max(1, width - 1)])
-                stdscr.attroff(curses.color_pair(1))
-            else:
-                stdscr.addstr(start_row + idx - scroll, 0, line[: max(1, width - 1)])
-        except curses.error:
-            pass
-    stdscr.refresh()
+    label_col = max(0, max_col - 3)
+    label = pipeline_service.join_command_line
+    last = min(len(commands), scroll + available)
+    for y, idx in enumerate(range(scroll, last), start=start_row):
+        row = (">> " if idx == cursor else "   ") + label(commands[idx])[:label_col]
+        with suppress(curses.error):
+            stdscr.addnstr(y, 0, row, max_col)
+    # Recolour just the cursor row.
+    stdscr.chgat(start_row + cursor - scroll, 0, max_col, curses.color_pair(1))
+    _flush_screen(stdscr)
 
 
+def _flush_screen(stdscr: Any) -> None:
+    # Stage the frame and emit it with a single doupdate(), as Menu.display does.
+    try:
+        if hasattr(stdscr, "noutrefresh"):
+            stdscr.noutrefresh()
+            _doupdate_synchronized()
+        else:
+            stdscr.refresh()
+    except curses.error:
+        stdscr.refresh()
 
+
+def _doupdate_synchronized() -> None:
+    # Opt-in synchronized output (mode 2026): the terminal paints the frame
+    # doupdate() emits in one go; terminals without the mode ignore the marks.
+    fd = _sync_output_fd()
+    if fd is None:
+        curses.doupdate()
+        return
+    os.write(fd, _SYNC_OUTPUT_BEGIN)
+    try:
+        curses.doupdate()
+    finally:
+        os.write(fd, _SYNC_OUTPUT_END)
+
+
+def _sync_output_fd() -> int | None:
+    if os.environ.get("OFTI_SYNC_OUTPUT") != "1":
+        return None
+    try:
+        fd = sys.stdout.fileno()
+    except (OSError, ValueError):
+        return None
+    return fd if os.isatty(fd) else None
@@ -1,31 +1,43 @@
 from __future__ import annotations
 
+import os
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
 from ofti.app.tool_screens.menu_helpers import build_menu
+from ofti.app.tool_screens.parametric import (
+    _prompt_line,
+    _prompt_parallel,
+    _show_parametric_results,
+)
 from ofti.app.tool_screens.runner import _show_message, run_tool_command
 from ofti.core import postprocessing as postprocessing_core
 from ofti.foamlib import postprocessing as foam_postprocessing
 from ofti.foamlib.parametric import build_parametric_cases
-from ofti.foamlib.runner import run_cases
-from ofti.ui_curses.prompts import prompt_line
 from ofti.ui_curses.viewer import Viewer
 
+_BROWSER_MAX_FILES = 500
+
 
 def postprocessing_browser_screen(stdscr: Any, case_path: Path) -> None:
     root = case_path / "postProcessing"
     if not root.is_dir():
         _show_message(stdscr, "postProcessing directory not found.")
         return
-    files = postprocessing_core.collect_postprocessing_files(root)
+    found = postprocessing_core.iter_postprocessing_files(root)
+    files = list(islice(found, _BROWSER_MAX_FILES + 1))
     if not files:
         _show_message(stdscr, "No postProcessing files found.")
         return
-    labels = ["Summary"] + [p.relative_to(case_path).as_posix() for p in files] + ["Back"]
+    title = "PostProcessing browser"
+    if len(files) > _BROWSER_MAX_FILES:
+        files = files[:_BROWSER_MAX_FILES]
+        title = f"{title} (first {_BROWSER_MAX_FILES} files)"
+    labels = ["Summary", *_browser_labels(case_path, root, files), "Back"]
     menu = build_menu(
         stdscr,
-        "PostProcessing browser",
+        title,
         labels,
         menu_key="menu:postprocessing_browser",
         item_hint="Open selected output.",
@@ -39,13 +51,29 @@ def postprocessing_browser_screen(stdscr: Any, case_path: Path) -> None:
         return
     path = files[choice - 1]
     try:
-        text = path.read_text(errors="ignore")
+        text = postprocessing_core.read_postprocessing_text(path)
     except OSError as exc:
         _show_message(stdscr, f"Failed to read {path.name}: {exc}")
         return
     Viewer(stdscr, text).display()
 
 
+def _browser_labels(case_path: Path, root: Path, files: list[Path]) -> list[str]:
+    # The walk yields paths built by joining onto root, so a string slice gives
+    # the same label as relative_to() without re-validating every prefix.
+    prefix = f"{root}{os.sep}"
+    head = f"{root.name}/"
+    cut = len(prefix)
+    labels: list[str] = []
+    for path in files:
+        text = str(path)
+        if text.startswith(prefix):
+            labels.append(head + text[cut:].replace(os.sep, "/"))
+        else:
+            labels.append(path.relative_to(case_path).as_posix())
+    return labels
+
+
 def postprocessing_tables_screen(stdscr: Any, case_path: Path) -> None:
     if not foam_postprocessing.available():
         reason = (
@@ -132,7 +160,7 @@ def sampling_sets_screen(stdscr: Any, case_path: Path) -> None:
 
 
 def parametric_presets_screen(stdscr: Any, case_path: Path) -> None:
-    presets_path = case_path / "ofti.parametric"
+    presets_path = postprocessing_core.parametric_presets_path(case_path)
     if not presets_path.is_file():
         _show_message(stdscr, "ofti.parametric not found in case directory.")
         return
@@ -157,7 +185,10 @@ def parametric_presets_screen(stdscr: Any, case_path: Path) -> None:
         return
     preset = presets[choice]
     run_line = _prompt_line(stdscr, "Run solver for each case? [y/N]: ")
-    run_solver = run_line.strip().lower().startswith("y")
+    run_solver = run_line.lower().startswith("y")
+    max_parallel = postprocessing_core.read_parametric_parallel(presets_path)
+    if run_solver:
+        max_parallel = _prompt_parallel(stdscr, case_path, max_parallel)
     try:
         created = build_parametric_cases(
             case_path,
@@ -169,29 +200,13 @@ def parametric_presets_screen(stdscr: Any, case_path: Path) -> None:
         _show_message(stdscr, f"Parametric setup failed: {exc}")
         return
 
-    failures: list[Path] = []
-    if run_solver:
-        failures = run_cases(created, check=False)
-
-    lines = [
-        f"Preset: {preset.name}",
-        f"Created {len(created)} case(s):",
-        *[f"- {path}" for path in created],
-    ]
-    if run_solver:
-        if failures:
-            lines += ["", "Failures:", *[f"- {path}" for path in failures]]
-        else:
-            lines += ["", "All cases completed."]
-    Viewer(stdscr, "\n".join(lines)).display()
-
-
-def _prompt_line(stdscr: Any, prompt: str) -> str:
-    stdscr.clear()
-    value = prompt_line(stdscr, prompt)
-    if value is None:
-        return ""
-    return value
+    _show_parametric_results(
+        stdscr,
+        created,
+        run_solver,
+        header=f"Preset: {preset.name}",
+        max_parallel=max_parallel,
+    )
 
 
 def _table_source_label(row: dict[str, Any]) -> str:
@@ -4,18 +4,22 @@ from pathlib import Path
 from typing import Any
 
 from ofti.app.tool_screens.menu_helpers import build_menu
-from ofti.app.tool_screens.runner import _show_message, _write_tool_log, run_tool_command
+from ofti.app.tool_screens.runner import (
+    _no_foam_active,
+    _show_message,
+    _with_no_foam_hint,
+    _write_tool_log,
+    flush_tool_logs,
+    run_tool_command,
+)
+from ofti.core.case import decomposed_processors
 from ofti.foam.subprocess_utils import run_trusted
 from ofti.foamlib import runner as foamlib_runner
 from ofti.foamlib.adapter import FoamlibUnavailableError
 
 
-def _decomposed_processors(case_path: Path) -> list[Path]:
-    return sorted(p for p in case_path.iterdir() if p.is_dir() and p.name.startswith("processor"))
-
-
 def reconstruct_manager_screen(stdscr: Any, case_path: Path) -> None:
-    processors = _decomposed_processors(case_path)
+    processors = decomposed_processors(case_path)
     if not processors:
         _show_message(stdscr, "Case is not decomposed (no processor* directories).")
         return
@@ -55,7 +59,7 @@ def reconstruct_manager_screen(stdscr: Any, case_path: Path) -> None:
 
 
 def reconstruct_all_once(case_path: Path) -> tuple[bool, str]:
-    processors = _decomposed_processors(case_path)
+    processors = decomposed_processors(case_path)
     if not processors:
         return False, "No processor directories found (skip reconstruct)."
     try:
@@ -68,9 +72,11 @@ def reconstruct_all_once(case_path: Path) -> tuple[bool, str]:
 
 
 def reconstruct_latest_once(case_path: Path) -> tuple[bool, str]:
-    processors = _decomposed_processors(case_path)
+    processors = decomposed_processors(case_path)
     if not processors:
         return False, "No processor directories found (skip reconstruct)."
+    if _no_foam_active():
+        return False, _with_no_foam_hint("reconstructPar skipped")
     try:
         result = run_trusted(
             ["reconstructPar", "-latestTime"],
@@ -82,6 +88,7 @@ def reconstruct_latest_once(case_path: Path) -> tuple[bool, str]:
     except OSError as exc:
         return False, f"reconstructPar failed: {exc}"
     _write_tool_log(case_path, "reconstructPar", result.stdout, result.stderr)
+    flush_tool_logs()
     if result.returncode != 0:
         return False, f"reconstructPar exit code {result.returncode}"
     return True, "reconstructPar -latestTime completed."
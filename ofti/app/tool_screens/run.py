@@ -4,7 +4,7 @@ from pathlib import Path
 from typing import Any
 
 from ofti.app.tool_screens.runner import _show_message, run_tool_command, run_tool_command_capture
-from ofti.core.case import read_number_of_subdomains
+from ofti.core.case import decomposed_processors, read_number_of_subdomains
 from ofti.core.checkmesh import format_checkmesh_summary
 from ofti.core.templates import write_example_template
 from ofti.core.tool_output import format_log_blob
@@ -82,7 +82,7 @@ def run_decomposepar(stdscr: Any, case_path: Path) -> None:
 def _show_checkmesh_summary(stdscr: Any, stdout: str, stderr: str) -> None:
     output = "\n".join([stdout or "", stderr or ""]).strip()
     summary = format_checkmesh_summary(output)
-    stdscr.clear()
+    stdscr.erase()
     stdscr.addstr(summary + "\n")
     back_hint = key_hint("back", "h")
     stdscr.addstr(f"Press r for raw output, {back_hint} to return.\n")
@@ -102,7 +102,7 @@ def _parallel_consistency_report(case_path: Path) -> tuple[str, list[str]]:
 
     expected = read_number_of_subdomains(decompose_dict)
 
-    processors = _decomposed_processors(case_path)
+    processors = decomposed_processors(case_path)
     actual = len(processors)
 
     lines = []
@@ -133,7 +133,3 @@ def parallel_consistency_screen(stdscr: Any, case_path: Path) -> None:
     else:
         message = [header, "", *lines, "", "OK: counts match."]
     Viewer(stdscr, "\n".join(message)).display()
-
-
-def _decomposed_processors(case_path: Path) -> list[Path]:
-    return sorted(p for p in case_path.iterdir() if p.is_dir() and p.name.startswith("processor"))
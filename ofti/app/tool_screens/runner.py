@@ -1,21 +1,26 @@
 from __future__ import annotations
 
+import curses
 import os
 import shlex
+import threading
 import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import suppress
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
-from ofti.core.tool_output import CommandResult, format_command_result, format_log_blob
+from ofti.core.tool_output import CommandResult, format_command_result
 from ofti.core.tool_presets import load_presets_from_path
 from ofti.foam.config import get_config, key_in
 from ofti.foam.exceptions import QuitAppError
-from ofti.foam.subprocess_utils import run_trusted
-from ofti.tools.helpers import resolve_openfoam_bashrc, with_bashrc
-from ofti.tools.tool_aliases import STATIC_TOOL_ALIAS_NAMES
+from ofti.foam.subprocess_utils import run_trusted, shell_env, stop_thread_children
+from ofti.tools.helpers import bashrc_already_loaded, resolve_openfoam_bashrc, with_bashrc
+from ofti.tools.tool_aliases import STATIC_TOOL_ALIAS_KEYS
 from ofti.ui.status import status_message
+from ofti.ui_curses.keys import drain_keys
 from ofti.ui_curses.viewer import Viewer
 
 
@@ -26,8 +31,15 @@ class LastToolRun:
     command: list[str] | str
 
 
+_T = TypeVar("_T")
+
 _LAST_TOOL_RUN: LastToolRun | None = None
+_STATUS_POLL_S = 0.1
+_ESC_KEY = 27
 _LAST_TOOL_STATUS: tuple[str, str, float] | None = None
+_LOG_WRITER: ThreadPoolExecutor | None = None
+_LOG_WRITER_LOCK = threading.Lock()
+_LAST_LOG_WRITE: Future[None] | None = None
 
 
 def _no_foam_active() -> bool:
@@ -47,6 +59,15 @@ def _with_no_foam_hint(message: str) -> str:
     return f"{message}{hint}" if hint else message
 
 
+def _skip_without_foam(stdscr: Any, name: str) -> bool:
+    # Limited mode: the launch would only fail with "executable not found".
+    if not _no_foam_active():
+        return False
+    _record_tool_status(name, "skipped")
+    _show_message(stdscr, _with_no_foam_hint(f"{name} skipped"))
+    return True
+
+
 def _record_last_tool(name: str, kind: str, command: list[str] | str) -> None:
     global _LAST_TOOL_RUN
     _LAST_TOOL_RUN = LastToolRun(name=name, kind=kind, command=command)
@@ -104,13 +125,11 @@ def _normalize_tool_name(name: str) -> str:
 def list_tool_commands(case_path: Path) -> list[str]:
     from ofti.tools.cli_tools import run as run_ops
 
-    keys = run_ops.catalog_command_keys(case_path)
-    keys.extend(_normalize_tool_name(name) for name in STATIC_TOOL_ALIAS_NAMES)
-    return sorted(set(keys))
+    return sorted(STATIC_TOOL_ALIAS_KEYS.union(run_ops.catalog_command_keys(case_path)))
 
 
 def _show_message(stdscr: Any, message: str) -> None:
-    stdscr.clear()
+    stdscr.erase()
     stdscr.addstr(message + "\n")
     stdscr.addstr("Press any key to continue.\n")
     stdscr.refresh()
@@ -139,20 +158,21 @@ def _run_simple_tool(
     *,
     allow_runfunctions: bool = True,
 ) -> None:
+    if _skip_without_foam(stdscr, name):
+        return
     status_message(stdscr, f"Running {name}...")
     expanded = _expand_command(cmd, case_path)
     wm_dir = os.environ.get("WM_PROJECT_DIR")
     if allow_runfunctions and wm_dir and get_config().use_runfunctions:
-        cmd_str = " ".join(shlex.quote(part) for part in expanded)
+        cmd_str = shlex.join(expanded)
         shell_cmd = f'. "{wm_dir}/bin/tools/RunFunctions"; runApplication {cmd_str}'
         _record_last_tool(name, "shell", shell_cmd)
         _run_shell_tool(stdscr, case_path, name, shell_cmd)
         return
 
     bashrc = resolve_openfoam_bashrc()
-    if bashrc:
-        cmd_str = " ".join(shlex.quote(part) for part in expanded)
-        shell_cmd = f"{cmd_str}"
+    if bashrc and not bashrc_already_loaded(bashrc, expanded[0]):
+        shell_cmd = shlex.join(expanded)
         _record_last_tool(name, "shell", shell_cmd)
         _run_shell_tool(stdscr, case_path, name, shell_cmd)
         return
@@ -173,7 +193,7 @@ def _run_simple_tool(
 
     hint = _maybe_job_hint(name)
     summary = format_command_result(
-        [f"$ cd {case_path}", f"$ {' '.join(cmd)}"],
+        [f"$ cd {case_path}", f"$ {shlex.join(cmd)}"],
         CommandResult(result.returncode, result.stdout, result.stderr),
         hint=hint,
     )
@@ -185,9 +205,7 @@ def _run_shell_tool(stdscr: Any, case_path: Path, name: str, shell_cmd: str) ->
     status_message(stdscr, f"Running {name}...")
     shell_cmd = with_bashrc(_expand_shell_command(shell_cmd, case_path))
     _record_last_tool(name, "shell", shell_cmd)
-    env = os.environ.copy()
-    env.pop("BASH_ENV", None)
-    env.pop("ENV", None)
+    env = shell_env()
     try:
         result = run_trusted(
             ["bash", "--noprofile", "--norc", "-c", shell_cmd],
@@ -213,12 +231,58 @@ def _run_shell_tool(stdscr: Any, case_path: Path, name: str, shell_cmd: str) ->
 
 
 def _write_tool_log(case_path: Path, name: str, stdout: str, stderr: str) -> None:
+    # Large solver logs are written off the UI thread; one writer keeps the
+    # writes in submission order.
+    global _LAST_LOG_WRITE
     if not stdout and not stderr:
         return
-    log_path = case_path / f"log.{name}"
-    content = "\n".join([f"tool: {name}", "", format_log_blob(stdout, stderr), ""])
+    with _LOG_WRITER_LOCK:
+        _LAST_LOG_WRITE = _log_writer().submit(
+            _write_tool_log_now, case_path, name, stdout, stderr,
+        )
+
+
+def flush_tool_logs() -> None:
+    with _LOG_WRITER_LOCK:
+        pending = _LAST_LOG_WRITE
+    if pending is not None:
+        pending.result()
+
+
+def _log_writer() -> ThreadPoolExecutor:
+    global _LOG_WRITER
+    if _LOG_WRITER is None:
+        # Executor workers are joined at interpreter exit, so queued logs still land.
+        _LOG_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ofti-tool-log")
+    return _LOG_WRITER
+
+
+def _write_tool_log_now(case_path: Path, name: str, stdout: str, stderr: str) -> None:
+    pieces = (
+        f"tool: {name}\n\nstdout:\n",
+        stdout or "(empty)",
+        "\n\nstderr:\n",
+        stderr or "(empty)",
+        "\n",
+    )
     with suppress(OSError):
-        log_path.write_text(content)
+        _write_chunks(case_path / f"log.{name}", [piece.encode() for piece in pieces])
+
+
+def _write_chunks(path: Path, chunks: list[bytes]) -> None:
+    # Gather write: the pieces go out in one writev() unless the kernel takes
+    # only part of them, and are never joined into one big string first.
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        pending = [memoryview(chunk) for chunk in chunks if chunk]
+        while pending:
+            written = os.writev(fd, pending)
+            while pending and written >= len(pending[0]):
+                written -= len(pending.pop(0))
+            if pending:
+                pending[0] = pending[0][written:]
+    finally:
+        os.close(fd)
 
 
 def run_tool_command(
@@ -231,15 +295,19 @@ def run_tool_command(
 ) -> None:
     from ofti.tools.cli_tools import run as run_ops
 
-    if status:
-        status_message(stdscr, status)
+    if _skip_without_foam(stdscr, name):
+        return
     expanded = run_ops.expand_command(case_path, cmd)
     try:
-        result = run_ops.execute_case_command(
-            case_path,
-            name,
-            expanded,
-            background=False,
+        result = _run_with_status(
+            stdscr,
+            status,
+            lambda: run_ops.execute_case_command(
+                case_path,
+                name,
+                expanded,
+                background=False,
+            ),
         )
     except OSError as exc:
         _show_message(stdscr, _with_no_foam_hint(f"Failed to run {name}: {exc}"))
@@ -250,12 +318,63 @@ def run_tool_command(
     _write_tool_log(case_path, name, result.stdout, result.stderr)
     _record_tool_status(name, f"exit {result.returncode}")
     summary = format_command_result(
-        [f"$ cd {case_path}", f"$ {' '.join(expanded)}"],
+        [f"$ cd {case_path}", f"$ {shlex.join(expanded)}"],
         CommandResult(result.returncode, result.stdout, result.stderr),
     )
     Viewer(stdscr, summary).display()
 
 
+def _run_with_status(stdscr: Any, status: str | None, func: Callable[[], _T]) -> _T:
+    if not status:
+        return func()
+    outcome: dict[str, Any] = {}
+
+    def worker() -> None:
+        try:
+            outcome["result"] = func()
+        except Exception as exc:
+            outcome["error"] = exc
+
+    thread = threading.Thread(target=worker, daemon=True)
+    thread.start()
+    cancelled = False
+    while True:
+        status_message(stdscr, f"{status} (cancelling)" if cancelled else status)
+        try:
+            thread.join(_STATUS_POLL_S)
+            if thread.is_alive() and not cancelled and _cancel_requested(stdscr):
+                cancelled = True
+                stop_thread_children(thread.ident)
+        except KeyboardInterrupt:
+            cancelled = True
+            stop_thread_children(thread.ident)
+        if not thread.is_alive():
+            break
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
+
+
+def _cancel_requested(stdscr: Any) -> bool:
+    if not hasattr(stdscr, "timeout"):
+        return False
+    others: list[int] = []
+
+    def keep(key: int) -> bool:
+        if key == _ESC_KEY:
+            return False
+        others.append(key)
+        return True
+
+    cancel = drain_keys(stdscr, keep)
+    # Keys typed ahead during the run belong to the next screen; ungetch is
+    # LIFO, so push them back last-first to keep their order.
+    for key in reversed(others):
+        with suppress(curses.error):
+            curses.ungetch(key)
+    return cancel == _ESC_KEY
+
+
 def run_tool_command_capture(
     stdscr: Any,
     case_path: Path,
@@ -266,15 +385,19 @@ def run_tool_command_capture(
 ) -> CommandResult | None:
     from ofti.tools.cli_tools import run as run_ops
 
-    if status:
-        status_message(stdscr, status)
+    if _skip_without_foam(stdscr, name):
+        return None
     expanded = run_ops.expand_command(case_path, cmd)
     try:
-        result = run_ops.execute_case_command(
-            case_path,
-            name,
-            expanded,
-            background=False,
+        result = _run_with_status(
+            stdscr,
+            status,
+            lambda: run_ops.execute_case_command(
+                case_path,
+                name,
+                expanded,
+                background=False,
+            ),
         )
     except OSError as exc:
         _show_message(stdscr, _with_no_foam_hint(f"Failed to run {name}: {exc}"))
@@ -14,11 +14,12 @@ from ofti.app.tool_screens.runner import (
 )
 from ofti.foam.config import get_config, key_hint, key_in
 from ofti.tools.job_registry import refresh_jobs
+from ofti.ui_curses.keys import set_input_timeout
 
 
 def job_status_poll_screen(stdscr: Any, case_path: Path) -> None:
     """Show OFTI-tracked jobs (no external foamCheckJobs/foamPrintJobs)."""
-    stdscr.timeout(800)
+    set_input_timeout(stdscr, 800)
     try:
         while True:
             stdscr.clear()
@@ -55,7 +56,7 @@ def job_status_poll_screen(stdscr: Any, case_path: Path) -> None:
             if key_in(key, get_config().keys.get("back", [])):
                 return
     finally:
-        stdscr.timeout(-1)
+        set_input_timeout(stdscr, -1)
 
 
 def run_shell_script_screen(stdscr: Any, case_path: Path) -> None:
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import curses
-import os
 import shutil
 from contextlib import suppress
 from pathlib import Path
@@ -30,13 +29,14 @@ from ofti.core.solver_status import (
 )
 from ofti.core.tool_output import CommandResult, format_command_result
 from ofti.foam.config import get_config, key_hint, key_in
-from ofti.foam.subprocess_utils import resolve_executable
+from ofti.foam.subprocess_utils import resolve_executable, shell_env
 from ofti.foamlib import runner as foamlib_runner
 from ofti.foamlib.adapter import FoamlibUnavailableError
 from ofti.foamlib.logs import read_log_tail_lines
 from ofti.tools import watch_service
 from ofti.tools.cli_tools import run as run_ops
 from ofti.tools.helpers import resolve_openfoam_bashrc
+from ofti.ui_curses.keys import set_input_timeout
 from ofti.ui_curses.prompts import prompt_line
 from ofti.ui_curses.viewer import Viewer
 
@@ -285,7 +285,7 @@ def _tail_process_log(
 ) -> None:
     cfg = get_config()
     patterns = ["FATAL", "bounding", "Courant", "nan", "SIGFPE", "floating point exception"]
-    stdscr.timeout(_LIVE_TAIL_POLL_MS)
+    set_input_timeout(stdscr, _LIVE_TAIL_POLL_MS)
     stopped_by_user = False
     try:
         while True:
@@ -353,7 +353,7 @@ def _tail_process_log(
 
             stdscr.refresh()
             if process.poll() is not None:
-                stdscr.timeout(-1)
+                set_input_timeout(stdscr, -1)
                 stdscr.getch()
                 return
             key = stdscr.getch()
@@ -371,7 +371,7 @@ def _tail_process_log(
             returncode=returncode,
             stopped_by_user=stopped_by_user,
         )
-        stdscr.timeout(-1)
+        set_input_timeout(stdscr, -1)
 
 
 def _prepare_parallel_run(
@@ -410,9 +410,7 @@ def _resolve_mpi_launcher(stdscr: Any) -> str | None:
 
 
 def _clean_env(case_path: Path) -> dict[str, str]:
-    env = os.environ.copy()
-    env.pop("BASH_ENV", None)
-    env.pop("ENV", None)
+    env = shell_env()
     env["PWD"] = str(case_path.resolve())
     return env
 
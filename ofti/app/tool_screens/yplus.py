@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import Any
 
 from ofti.app.tool_screens.cleaning_utils import _ascii_kv_table, _run_shell_capture
-from ofti.app.tool_screens.runner import _show_message, _write_tool_log
+from ofti.app.tool_screens.runner import _show_message, _write_tool_log, flush_tool_logs
 from ofti.core.tool_output import format_log_blob
 from ofti.foam.config import get_config, key_hint
 from ofti.foam.subprocess_utils import run_trusted
@@ -21,6 +21,7 @@ def yplus_screen(stdscr: Any, case_path: Path) -> None:
     stdout, stderr = _run_tool_capture(case_path, "yPlus")
     _write_tool_log(case_path, "yPlus", stdout, stderr)
     stats = _parse_yplus_stats("\n".join([stdout, stderr]))
+    flush_tool_logs()
     if not stats:
         _show_message(stdscr, "No yPlus stats found in output.")
         return
@@ -1,13 +1,23 @@
 from __future__ import annotations
 
+import os
 import re
+import stat as stat_module
 from pathlib import Path
+from typing import TypeVar
 
 from ofti.core.entry_io import read_entry
 from ofti.core.mesh_info import mesh_counts
 from ofti.core.tool_dicts_service import apply_assignment_or_write
 from ofti.foam.openfoam import OpenFOAMError
 
+_T = TypeVar("_T")
+
+_CASE_CACHE_SIZE = 32
+_SOLVER_CACHE: dict[str, tuple[tuple[int, int], str]] = {}
+_SUBDOMAINS_CACHE: dict[str, tuple[tuple[int, int], int | None]] = {}
+_PROCESSORS_CACHE: dict[str, tuple[tuple[int, int], list[str]]] = {}
+
 
 def detect_mesh_stats(case_path: Path) -> str:
     log_path = latest_checkmesh_log(case_path)
@@ -62,8 +72,62 @@ def _mesh_count_parts(
 
 def detect_solver(case_path: Path) -> str:
     control_dict = case_path / "system" / "controlDict"
-    if not control_dict.is_file():
+    try:
+        stat = control_dict.stat()
+    except OSError:
         return "unknown"
+    if not stat_module.S_ISREG(stat.st_mode):
+        return "unknown"
+    # Many screens ask for the solver on open; reparse only when controlDict changes.
+    key = str(control_dict)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _SOLVER_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    solver = _read_solver(control_dict)
+    _remember(_SOLVER_CACHE, key, (stamp, solver))
+    return solver
+
+
+def decomposed_processors(case_path: Path) -> list[Path]:
+    # processor* dirs come from one scandir pass (no stat per entry) and are
+    # reused until the case directory itself changes.
+    try:
+        stat = case_path.stat()
+        # Subdirectories bump st_nlink, which also catches changes made within
+        # one coarse mtime tick.
+        stamp = (stat.st_mtime_ns, stat.st_nlink)
+        key = str(case_path)
+        cached = _PROCESSORS_CACHE.get(key)
+        if cached is None or cached[0] != stamp:
+            with os.scandir(case_path) as entries:
+                names = [
+                    entry.name
+                    for entry in entries
+                    if entry.name.startswith("processor") and entry.is_dir()
+                ]
+            cached = (stamp, sorted(names, key=_processor_sort_key))
+            _remember(_PROCESSORS_CACHE, key, cached)
+    except OSError:
+        return []
+    return [case_path / name for name in cached[1]]
+
+
+def _processor_sort_key(name: str) -> tuple[int, int, str]:
+    # processor2 before processor10; other processor* names (e.g. collated
+    # processorsN) follow in name order.
+    suffix = name[len("processor"):]
+    return (0, int(suffix), name) if suffix.isascii() and suffix.isdigit() else (1, 0, name)
+
+
+def _remember(cache: dict[str, _T], key: str, entry: _T) -> None:
+    cache.pop(key, None)
+    cache[key] = entry
+    while len(cache) > _CASE_CACHE_SIZE:
+        cache.pop(next(iter(cache)))
+
+
+def _read_solver(control_dict: Path) -> str:
     try:
         value = read_entry(control_dict, "application")
     except OpenFOAMError:
@@ -80,6 +144,23 @@ def read_application(control_dict: Path) -> str:
 
 
 def read_number_of_subdomains(decompose_dict: Path) -> int | None:
+    try:
+        stat = decompose_dict.stat()
+    except OSError:
+        stat = None
+    if stat is None:
+        return _read_number_of_subdomains(decompose_dict)
+    key = str(decompose_dict)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _SUBDOMAINS_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    number = _read_number_of_subdomains(decompose_dict)
+    _remember(_SUBDOMAINS_CACHE, key, (stamp, number))
+    return number
+
+
+def _read_number_of_subdomains(decompose_dict: Path) -> int | None:
     try:
         number = read_entry(decompose_dict, "numberOfSubdomains").strip().rstrip(";")
     except OpenFOAMError:
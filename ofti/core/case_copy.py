@@ -4,6 +4,7 @@ import shutil
 from collections.abc import Callable
 from pathlib import Path
 
+from ofti.core.times import is_time_name
 from ofti.foamlib import adapter as foamlib_integration
 
 _RUNTIME_DIR_NAMES = {"postProcessing", ".ofti", "__pycache__"}
@@ -102,11 +103,7 @@ def _is_runtime_artifact_name(name: str, *, keep_zero_directory: bool) -> bool:
 
 
 def _is_time_dir_name(name: str) -> bool:
-    try:
-        value = float(name)
-    except ValueError:
-        return False
-    return value >= 0
+    return is_time_name(name) and float(name) >= 0
 
 
 def _strip_runtime_artifacts(destination: Path, *, keep_zero_directory: bool) -> None:
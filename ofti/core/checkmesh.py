@@ -2,21 +2,29 @@ from __future__ import annotations
 
 import re
 
+_COURANT_PATTERNS = (
+    re.compile(r"(?i)max\s+courant\s+number\s*=\s*([0-9eE.+-]+)"),
+    re.compile(r"(?i)courant\s+number.*max:\s*([0-9eE.+-]+)"),
+    re.compile(r"(?i)max\s+courant\s+number\s*:\s*([0-9eE.+-]+)"),
+)
+
 
 def extract_last_courant(lines: list[str]) -> float | None:
-    patterns = [
-        r"(?i)max\s+courant\s+number\s*=\s*([0-9eE.+-]+)",
-        r"(?i)courant\s+number.*max:\s*([0-9eE.+-]+)",
-        r"(?i)max\s+courant\s+number\s*:\s*([0-9eE.+-]+)",
-    ]
     for line in reversed(lines):
-        for pattern in patterns:
-            match = re.search(pattern, line)
-            if match:
-                try:
-                    return float(match.group(1))
-                except ValueError:
-                    continue
+        value = parse_courant_line(line)
+        if value is not None:
+            return value
+    return None
+
+
+def parse_courant_line(line: str) -> float | None:
+    for pattern in _COURANT_PATTERNS:
+        match = pattern.search(line)
+        if match:
+            try:
+                return float(match.group(1))
+            except ValueError:
+                continue
     return None
 
 
@@ -1,27 +1,88 @@
 from __future__ import annotations
 
+import os
+import re
 import shlex
+import time
+from collections import deque
 from collections.abc import Callable, Iterable
+from contextlib import suppress
 from pathlib import Path
 
 from ofti.core.tool_dicts_service import apply_assignment_or_write
-from ofti.foam.subprocess_utils import run_trusted
+from ofti.foam.subprocess_utils import run_trusted_streaming
 
 PIPELINE_FILENAME = "Allrun"
 PIPELINE_HEADER = "# OFTI-PIPELINE"
+_HEADER_BYTES = PIPELINE_HEADER.encode()
+_NEWLINE = ord("\n")
 PIPELINE_SET_COMMAND = "ofti:set"
+_DEFAULT_SHEBANG = "#!/bin/bash"
+_PROGRESS_INTERVAL_S = 0.25
+_REPORT_MAX_LINES = 2000
+_PIPELINE_CACHE_SIZE = 16
+_PIPELINE_CACHE: dict[str, tuple[tuple[int, int], list[list[str]], list[str]]] = {}
+_COMMAND_LINE_CACHE_SIZE = 512
+_COMMAND_LINE_CACHE: dict[tuple[str, ...], str] = {}
+_FAST_TOKEN_RE = re.compile(r"[\w\-./=+:@,]+(?:[ \t]+[\w\-./=+:@,]+)*", re.ASCII)
 
 
 def read_pipeline_commands(path: Path) -> tuple[list[list[str]], list[str]]:
+    try:
+        stat = path.stat()
+        key = str(path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = _PIPELINE_CACHE.get(key)
+        if cached is None or cached[0] != stamp:
+            commands, errors = _parse_pipeline_bytes(path.read_bytes(), path.name)
+            cached = _remember_pipeline(key, stamp, commands, errors)
+    except OSError as exc:
+        return [], [f"Failed to read {path.name}: {exc}"]
+    return [list(parts) for parts in cached[1]], list(cached[2])
+
+
+def _parse_pipeline_bytes(data: bytes, name: str) -> tuple[list[list[str]], list[str]]:
+    if _HEADER_BYTES not in data:
+        return [], [f"Missing {PIPELINE_HEADER} header in {name}."]
+    start = -1 if b"\r" in data else _header_line_offset(data)
+    if start < 0:
+        # CR line endings, or a header that is not simply the first mention:
+        # fall back to the per-line scan over universal newlines.
+        text = data.decode("utf-8", "ignore").replace("\r\n", "\n").replace("\r", "\n")
+        return _parse_pipeline_stream(text.split("\n"), name)
+    line_no = data.count(b"\n", 0, start) + 1
+    end = data.find(b"\n", start)
+    body = data[end + 1:] if end >= 0 else b""
+    return _parse_pipeline_body(body.decode("utf-8", "ignore").split("\n"), line_no + 1)
+
+
+def _header_line_offset(data: bytes) -> int:
+    # bytes.find runs in C. Any earlier header line would contain the first
+    # match, so it is the header only if it sits alone on its own line.
+    hit = data.find(_HEADER_BYTES)
+    if hit > 0 and data[hit - 1] != _NEWLINE:
+        return -1
+    end = data.find(b"\n", hit)
+    line = data[hit:end] if end >= 0 else data[hit:]
+    return hit if line.strip() == _HEADER_BYTES else -1
+
+
+def _parse_pipeline_stream(
+    lines: Iterable[str], name: str,
+) -> tuple[list[list[str]], list[str]]:
+    iterator = iter(lines)
+    for line_no, raw in enumerate(iterator, start=1):
+        if raw.strip() == PIPELINE_HEADER:
+            return _parse_pipeline_body(iterator, line_no + 1)
+    return [], [f"Missing {PIPELINE_HEADER} header in {name}."]
+
+
+def _parse_pipeline_body(
+    lines: Iterable[str], first_line_no: int,
+) -> tuple[list[list[str]], list[str]]:
     commands: list[list[str]] = []
     errors: list[str] = []
-    lines, error = _read_pipeline_lines(path)
-    if error:
-        return [], [error]
-    header_index = _pipeline_header_index(lines)
-    if header_index is None:
-        return [], [f"Missing {PIPELINE_HEADER} header in {path.name}."]
-    for line_no, raw in enumerate(lines[header_index + 1 :], start=header_index + 2):
+    for line_no, raw in enumerate(lines, start=first_line_no):
         parts, error = _parse_pipeline_line(raw, line_no)
         if error:
             errors.append(error)
@@ -30,18 +91,15 @@ def read_pipeline_commands(path: Path) -> tuple[list[list[str]], list[str]]:
     return commands, errors
 
 
-def _read_pipeline_lines(path: Path) -> tuple[list[str], str | None]:
-    try:
-        return path.read_text(errors="ignore").splitlines(), None
-    except OSError as exc:
-        return [], f"Failed to read {path.name}: {exc}"
-
-
-def _pipeline_header_index(lines: list[str]) -> int | None:
-    for idx, raw in enumerate(lines):
-        if raw.strip() == PIPELINE_HEADER:
-            return idx
-    return None
+def _remember_pipeline(
+    key: str, stamp: tuple[int, int], commands: list[list[str]], errors: list[str],
+) -> tuple[tuple[int, int], list[list[str]], list[str]]:
+    entry = (stamp, commands, errors)
+    _PIPELINE_CACHE.pop(key, None)
+    _PIPELINE_CACHE[key] = entry
+    while len(_PIPELINE_CACHE) > _PIPELINE_CACHE_SIZE:
+        _PIPELINE_CACHE.pop(next(iter(_PIPELINE_CACHE)))
+    return entry
 
 
 def _parse_pipeline_line(raw: str, line_no: int) -> tuple[list[str], str | None]:
@@ -49,34 +107,140 @@ def _parse_pipeline_line(raw: str, line_no: int) -> tuple[list[str], str | None]
     if not line or line.startswith("#"):
         return [], None
     try:
-        return shlex.split(line), None
+        return split_command_line(line), None
     except ValueError as exc:
         return [], f"Line {line_no}: {exc}"
 
 
-def write_pipeline_file(path: Path, commands: Iterable[Iterable[str]]) -> None:
-    shebang = "#!/bin/bash"
-    if path.is_file():
-        try:
-            first = path.read_text(errors="ignore").splitlines()[:1]
-        except OSError:
-            first = []
-        if first and first[0].startswith("#!"):
-            shebang = first[0].strip()
+def split_command_line(line: str) -> list[str]:
+    # Plain word lists (no quotes, escapes or odd whitespace) skip shlex's lexer.
+    stripped = line.strip(" \t")
+    if _FAST_TOKEN_RE.fullmatch(stripped):
+        return stripped.split()
+    return shlex.split(line)
+
+
+def join_command_line(parts: Iterable[str]) -> str:
+    # Shared by the Allrun writer and the editor, which re-renders every frame.
+    key = tuple(parts)
+    line = _COMMAND_LINE_CACHE.get(key)
+    if line is None:
+        quote = shlex.quote
+        line = " ".join([quote(part) for part in key])
+        if len(_COMMAND_LINE_CACHE) >= _COMMAND_LINE_CACHE_SIZE:
+            _COMMAND_LINE_CACHE.pop(next(iter(_COMMAND_LINE_CACHE)))
+        _COMMAND_LINE_CACHE[key] = line
+    return line
+
+
+def read_pipeline_shebang(path: Path) -> str:
+    try:
+        with path.open(errors="ignore") as handle:
+            first = handle.readline()
+    except OSError:
+        first = ""
+    return first.strip() if first.startswith("#!") else _DEFAULT_SHEBANG
+
+
+def write_pipeline_file(
+    path: Path,
+    commands: Iterable[Iterable[str]],
+    *,
+    shebang: str | None = None,
+) -> None:
+    existing: str | None = None
+    if shebang is None:
+        shebang = _DEFAULT_SHEBANG
+        if path.is_file():
+            try:
+                existing = path.read_text(errors="ignore")
+            except OSError:
+                existing = None
+            first = existing.split("\n", 1)[0] if existing else ""
+            if first.startswith("#!"):
+                shebang = first.strip()
     lines = [shebang, PIPELINE_HEADER, ""]
-    for cmd in commands:
-        rendered = " ".join(shlex.quote(part) for part in cmd)
-        lines.append(rendered)
+    lines.extend(join_command_line(cmd) for cmd in commands)
     content = "\n".join(lines).rstrip() + "\n"
-    path.write_text(content)
+    if content == existing:
+        return
+    _write_atomic(path, content)
+    # Seed the read cache so the editor's next load of this file is a hit.
+    with suppress(OSError):
+        stat = path.stat()
+        commands_read, errors = _parse_pipeline_bytes(content.encode(), path.name)
+        _remember_pipeline(str(path), (stat.st_mtime_ns, stat.st_size), commands_read, errors)
+
+
+def _write_atomic(path: Path, content: str) -> None:
+    # Readers (and a shell running Allrun) only ever see the old or new file.
+    tmp = path.with_name(f".{path.name}.tmp")
+    try:
+        with tmp.open("w") as handle:
+            handle.write(content)
+            handle.flush()
+            os.fsync(handle.fileno())
+        with suppress(OSError):
+            tmp.chmod(path.stat().st_mode & 0o7777)
+        tmp.replace(path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+class TailBuffer:
+    # Rolling tail of a line stream, trimmed as if the whole text were strip()ped.
+    def __init__(self, max_lines: int = 20) -> None:
+        self.max_lines = max_lines
+        self.lines: deque[str] = deque(maxlen=max(0, max_lines))
+        self.total = 0
+        self._blank: deque[str] = deque(maxlen=max(0, max_lines))
+        self._blank_count = 0
+
+    def feed(self, line: str) -> None:
+        line = line.rstrip("\n")
+        if not line.strip():
+            # Held back until a non-blank line arrives so trailing blanks never count.
+            if self.total:
+                self._blank.append(line)
+                self._blank_count += 1
+            return
+        if not self.total:
+            line = line.lstrip()
+        if self._blank_count:
+            self.lines.extend(self._blank)
+            self.total += self._blank_count
+            self._blank.clear()
+            self._blank_count = 0
+        self.lines.append(line)
+        self.total += 1
+
+    def render(self) -> str:
+        if self.total == 0:
+            return "(empty)"
+        tail = list(self.lines)
+        if tail:
+            tail[-1] = tail[-1].rstrip()
+        body = "\n".join(tail)
+        if self.total <= self.max_lines:
+            return body
+        return f"... ({self.total - self.max_lines} lines omitted)\n{body}"
 
 
 def tail_text(text: str, max_lines: int = 20) -> str:
-    lines = text.strip().splitlines()
-    if len(lines) <= max_lines:
-        return "\n".join(lines) if lines else "(empty)"
-    tail = "\n".join(lines[-max_lines:])
-    return f"... ({len(lines) - max_lines} lines omitted)\n{tail}"
+    body = text.strip()
+    if not body:
+        return "(empty)"
+    if "\r" in body:
+        body = body.replace("\r\n", "\n").replace("\r", "\n")
+    # Walk back from the end so only the kept lines are ever sliced out.
+    cut = len(body)
+    for _ in range(max_lines):
+        cut = body.rfind("\n", 0, cut)
+        if cut < 0:
+            return body
+    omitted = body.count("\n", 0, cut) + 1
+    return f"... ({omitted} lines omitted)\n{body[cut + 1:]}"
 
 
 def run_pipeline_commands(
@@ -85,47 +249,97 @@ def run_pipeline_commands(
     *,
     status_cb: Callable[[str], None] | None = None,
 ) -> list[str]:
-    results: list[str] = []
+    # Each step is already tailed; the ring also bounds very long pipelines.
+    results: deque[str] = deque(maxlen=_REPORT_MAX_LINES)
+    total = 0
     command_list = [list(cmd) for cmd in commands]
     for idx, cmd in enumerate(command_list, start=1):
+        progress = None
         if status_cb is not None:
-            status_cb(f"Pipeline {idx}/{len(command_list)}: {' '.join(cmd)}")
-        if cmd and cmd[0] == PIPELINE_SET_COMMAND:
-            results.extend(_run_pipeline_set(case_path, cmd))
-            results.append("")
-            continue
-        lines, stop = _run_external_pipeline_command(case_path, cmd)
+            label = f"Pipeline {idx}/{len(command_list)}: {' '.join(cmd)}"
+            status_cb(label)
+            progress = _progress_reporter(status_cb, label)
+        try:
+            lines, stop = _run_pipeline_step(case_path, cmd, progress)
+        except KeyboardInterrupt:
+            # Ctrl-C ends the run but still hands back the report so far.
+            lines, stop = [f"$ {' '.join(cmd)}", "status: INTERRUPTED", ""], True
         results.extend(lines)
+        total += len(lines)
         if stop:
             break
-    return results
+    report = list(results)
+    if total > len(report):
+        report.insert(0, f"... ({total - len(report)} earlier report lines omitted)")
+    return report
 
 
-def _run_external_pipeline_command(case_path: Path, cmd: list[str]) -> tuple[list[str], bool]:
+def _run_pipeline_step(
+    case_path: Path,
+    cmd: list[str],
+    progress: Callable[[str], None] | None,
+) -> tuple[list[str], bool]:
+    if cmd and cmd[0] == PIPELINE_SET_COMMAND:
+        return [*_run_pipeline_set(case_path, cmd), ""], False
+    return _run_external_pipeline_command(case_path, cmd, progress=progress)
+
+
+def _progress_reporter(status_cb: Callable[[str], None], label: str) -> Callable[[str], None]:
+    start = last = time.monotonic()
+
+    def report(line: str) -> None:
+        nonlocal last
+        now = time.monotonic()
+        if now - last < _PROGRESS_INTERVAL_S:
+            return
+        last = now
+        status_cb(f"{label} ({now - start:.0f}s) {line.strip()}")
+
+    return report
+
+
+def _run_external_pipeline_command(
+    case_path: Path,
+    cmd: list[str],
+    *,
+    progress: Callable[[str], None] | None = None,
+) -> tuple[list[str], bool]:
     lines = [f"$ {' '.join(cmd)}"]
+    stdout = TailBuffer()
+    stderr = TailBuffer()
+
+    def on_stdout(line: str) -> None:
+        stdout.feed(line)
+        if progress is not None:
+            progress(line)
+
     try:
-        result = run_trusted(
+        returncode = run_trusted_streaming(
             cmd,
             cwd=case_path,
-            capture_output=True,
-            text=True,
-            stdin="",
-            check=False,
+            on_stdout=on_stdout,
+            on_stderr=stderr.feed,
         )
     except OSError as exc:
         return [*lines, f"status: ERROR ({exc})"], True
-    status = "OK" if result.returncode == 0 else f"ERROR ({result.returncode})"
+    except KeyboardInterrupt:
+        # The child is already stopped; keep what it printed and skip the rest.
+        returncode = None
+    if returncode is None:
+        status = "INTERRUPTED"
+    else:
+        status = "OK" if returncode == 0 else f"ERROR ({returncode})"
     lines.append(f"status: {status}")
-    lines.extend(_pipeline_stream_lines("stdout", result.stdout))
-    lines.extend(_pipeline_stream_lines("stderr", result.stderr))
+    lines.extend(_pipeline_stream_lines("stdout", stdout))
+    lines.extend(_pipeline_stream_lines("stderr", stderr))
     lines.append("")
-    return lines, result.returncode != 0
+    return lines, returncode != 0
 
 
-def _pipeline_stream_lines(label: str, text: str) -> list[str]:
-    if not text:
+def _pipeline_stream_lines(label: str, tail: TailBuffer) -> list[str]:
+    if not tail.total:
         return []
-    return [f"{label}:", tail_text(text)]
+    return [f"{label}:", tail.render()]
 
 
 def _run_pipeline_set(case_path: Path, cmd: list[str]) -> list[str]:
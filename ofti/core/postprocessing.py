@@ -1,30 +1,98 @@
 from __future__ import annotations
 
+import os
+import re
+from collections.abc import Iterable, Iterator
+from contextlib import suppress
 from dataclasses import dataclass
 from pathlib import Path
 
+from ofti.core.times import is_time_name
+
+_looks_like_time = is_time_name
+_TEXT_CACHE_SIZE = 32
+_TEXT_CACHE_MAX_BYTES = 8_000_000
+_TEXT_CACHE: dict[str, tuple[tuple[int, int], str]] = {}
+
 
 def collect_postprocessing_files(root: Path) -> list[Path]:
-    return sorted(p for p in root.rglob("*") if p.is_file())
+    return list(iter_postprocessing_files(root))
+
+
+def iter_postprocessing_files(root: Path) -> Iterator[Path]:
+    # Depth-first over name-sorted entries yields the same order as sorting
+    # every path, but lazily, so callers can stop after the first N files.
+    try:
+        with os.scandir(root) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from iter_postprocessing_files(Path(entry.path))
+        elif entry.is_file():
+            yield Path(entry.path)
+
+
+def read_postprocessing_text(path: Path) -> str:
+    # The browser often reopens the same output; reuse it until the file changes.
+    stat = path.stat()
+    key = str(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _TEXT_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    text = path.read_text(errors="ignore")
+    _TEXT_CACHE.pop(key, None)
+    if stat.st_size <= _TEXT_CACHE_MAX_BYTES:
+        _TEXT_CACHE[key] = (stamp, text)
+        _trim_text_cache()
+    return text
+
+
+def _trim_text_cache() -> None:
+    total = sum(stamp[1] for stamp, _text in _TEXT_CACHE.values())
+    while _TEXT_CACHE and (
+        len(_TEXT_CACHE) > _TEXT_CACHE_SIZE or total > _TEXT_CACHE_MAX_BYTES
+    ):
+        stamp, _text = _TEXT_CACHE.pop(next(iter(_TEXT_CACHE)))
+        total -= stamp[1]
 
 
 def postprocessing_summary(root: Path) -> list[str]:
     lines = ["POSTPROCESSING SUMMARY", "", f"Root: {root}", ""]
-    for subdir in sorted(p for p in root.iterdir() if p.is_dir()):
-        time_dirs = [d for d in subdir.iterdir() if d.is_dir() and _looks_like_time(d.name)]
-        files = [p for p in subdir.rglob("*") if p.is_file()]
-        lines.append(f"{subdir.name}: times={len(time_dirs)} files={len(files)}")
+    # Sort (name, path) string pairs from scandir rather than Path objects.
+    with os.scandir(root) as it:
+        subdirs = sorted((entry.name, entry.path) for entry in it if entry.is_dir())
+    for name, subdir in subdirs:
+        times, files = _scan_postprocessing_dir(Path(subdir))
+        lines.append(f"{name}: times={times} files={files}")
     if len(lines) == 4:
         lines.append("(no postProcessing subdirectories)")
     return lines
 
 
-def _looks_like_time(name: str) -> bool:
+def _scan_postprocessing_dir(subdir: Path) -> tuple[int, int]:
+    # One scandir walk counts top-level time directories and every file below.
     try:
-        float(name)
-    except ValueError:
-        return False
-    return True
+        top = list(os.scandir(subdir))
+    except OSError:
+        return 0, 0
+    times = sum(1 for entry in top if _looks_like_time(entry.name) and entry.is_dir())
+    return times, _count_files(top)
+
+
+def _count_files(entries: list[os.DirEntry[str]]) -> int:
+    files = 0
+    stack = [entries]
+    while stack:
+        for entry in stack.pop():
+            if entry.is_dir(follow_symlinks=False):
+                with suppress(OSError):
+                    stack.append(list(os.scandir(entry.path)))
+            elif entry.is_file():
+                files += 1
+    return files
 
 
 @dataclass(frozen=True)
@@ -35,20 +103,73 @@ class ParametricPreset:
     values: list[str]
 
 
+PARAMETRIC_PRESETS_FILENAME = "ofti.parametric"
+_PRESET_CACHE_SIZE = 32
+_PRESET_CACHE: dict[
+    str, tuple[tuple[int, int], list[ParametricPreset], list[str], int | None],
+] = {}
+_PARALLEL_HEADER_RE = re.compile(r"#\s*parallel\s*:\s*(\d+)\s*", re.IGNORECASE)
+# Both preset syntaxes split and strip their fields in a single match.
+_PRESET_PIPE_RE = re.compile(r"\s*([^|]*?)\s*\|\s*([^|]*?)\s*\|\s*([^|]*?)\s*\|\s*([^|]*?)\s*")
+_PRESET_COLON_RE = re.compile(r"([^:]*?)\s*:\s*(\S+)\s+(\S+)(?:\s+(.*?))?\s*", re.DOTALL)
+
+
+def parametric_presets_path(case_path: Path) -> Path:
+    return case_path / PARAMETRIC_PRESETS_FILENAME
+
+
 def read_parametric_presets(path: Path) -> tuple[list[ParametricPreset], list[str]]:
-    presets: list[ParametricPreset] = []
-    errors: list[str] = []
+    entry, error = _load_parametric_presets(path)
+    if entry is None:
+        return [], [error]
+    return list(entry[1]), list(entry[2])
+
+
+def read_parametric_parallel(path: Path) -> int | None:
+    # Optional "# parallel: N" line capping concurrent solver runs for the sweep.
+    entry, _error = _load_parametric_presets(path)
+    return entry[3] if entry is not None else None
+
+
+def _load_parametric_presets(
+    path: Path,
+) -> tuple[tuple[tuple[int, int], list[ParametricPreset], list[str], int | None] | None, str]:
     try:
-        lines = path.read_text(errors="ignore").splitlines()
+        stat = path.stat()
+        key = str(path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = _PRESET_CACHE.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached, ""
+        with path.open(errors="ignore") as handle:
+            presets, errors, parallel = _parse_parametric_presets(handle)
     except OSError as exc:
-        return [], [f"Failed to read {path.name}: {exc}"]
+        return None, f"Failed to read {path.name}: {exc}"
+    entry = (stamp, presets, errors, parallel)
+    _PRESET_CACHE.pop(key, None)
+    _PRESET_CACHE[key] = entry
+    while len(_PRESET_CACHE) > _PRESET_CACHE_SIZE:
+        _PRESET_CACHE.pop(next(iter(_PRESET_CACHE)))
+    return entry, ""
+
+
+def _parse_parametric_presets(
+    lines: Iterable[str],
+) -> tuple[list[ParametricPreset], list[str], int | None]:
+    presets: list[ParametricPreset] = []
+    errors: list[str] = []
+    parallel: int | None = None
     for line_no, raw in enumerate(lines, start=1):
+        header = _PARALLEL_HEADER_RE.fullmatch(raw.strip())
+        if header is not None:
+            parallel = int(header.group(1)) or None
+            continue
         preset, error = _parse_parametric_preset_line(raw, line_no)
         if error:
             errors.append(error)
         if preset is not None:
             presets.append(preset)
-    return presets, errors
+    return presets, errors, parallel
 
 
 def _parse_parametric_preset_line(
@@ -62,7 +183,7 @@ def _parse_parametric_preset_line(
     if error:
         return None, error
     name, dict_path, entry, values_raw = fields
-    values = [val.strip() for val in values_raw.split(",") if val.strip()]
+    values = list(filter(None, map(str.strip, values_raw.split(","))))
     if not (name and dict_path and entry and values):
         return None, f"Line {line_no}: missing name, dict, entry, or values"
     return ParametricPreset(name, dict_path, entry, values), None
@@ -73,18 +194,17 @@ def _parametric_preset_fields(
     line_no: int,
 ) -> tuple[tuple[str, str, str, str], str | None]:
     if "|" in line:
-        parts = [part.strip() for part in line.split("|")]
-        if len(parts) != 4:
+        match = _PRESET_PIPE_RE.fullmatch(line)
+        if match is None:
             return ("", "", "", ""), f"Line {line_no}: expected 4 fields separated by |"
-        return (parts[0], parts[1], parts[2], parts[3]), None
+        return match.group(1, 2, 3, 4), None
     if ":" not in line:
         return ("", "", "", ""), f"Line {line_no}: expected 'name | dict | entry | values'"
-    name_part, rest = line.split(":", 1)
-    tokens = rest.strip().split()
-    if len(tokens) < 2:
+    match = _PRESET_COLON_RE.fullmatch(line)
+    if match is None:
         return ("", "", "", ""), f"Line {line_no}: expected '<dict> <entry> <values>'"
-    values_raw = " ".join(tokens[2:]) if len(tokens) > 2 else ""
-    return (name_part.strip(), tokens[0], tokens[1], values_raw), None
+    name, dict_path, entry, values_raw = match.group(1, 2, 3, 4)
+    return (name, dict_path, entry, values_raw or ""), None
 
 
 @dataclass(frozen=True)
@@ -96,21 +216,32 @@ class SamplingOption:
 
 
 def sampling_options(case_path: Path) -> list[SamplingOption]:
-    topo = case_path / "system" / "topoSetDict"
-    sample = case_path / "system" / "sampleDict"
-    dist = case_path / "system" / "distributionDict"
+    system = case_path / "system"
+    present = _dir_file_names(system)
+    topo = system / "topoSetDict"
+    sample = system / "sampleDict"
+    dist = system / "distributionDict"
     return [
-        SamplingOption("Run topoSet", ["topoSet"], topo, topo.is_file()),
+        SamplingOption("Run topoSet", ["topoSet"], topo, topo.name in present),
         SamplingOption(
             "Run sample (postProcess -func sample)",
             ["postProcess", "-func", "sample"],
             sample,
-            sample.is_file(),
+            sample.name in present,
         ),
         SamplingOption(
             "Run distribution (postProcess -func distribution)",
             ["postProcess", "-func", "distribution"],
             dist,
-            dist.is_file(),
+            dist.name in present,
         ),
     ]
+
+
+def _dir_file_names(directory: Path) -> set[str]:
+    # One scandir pass answers every "does system/<dict> exist" check at once.
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name for entry in it if entry.is_file()}
+    except OSError:
+        return set()
@@ -10,20 +10,22 @@ import re
 from pathlib import Path
 
 PROCESSOR_RE = re.compile(r"^processor\d+$")
+TIME_NAME_RE = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+
+
+def is_time_name(name: str) -> bool:
+    # A regex match avoids raising ValueError for every constant/system/... name.
+    return TIME_NAME_RE.fullmatch(name) is not None
 
 
 def _numeric_subdirs(directory: Path) -> list[Path]:
-    times: list[Path] = []
     if not directory.is_dir():
-        return times
-    for entry in directory.iterdir():
-        if not entry.is_dir():
-            continue
-        try:
-            float(entry.name)
-        except ValueError:
-            continue
-        times.append(entry)
+        return []
+    times = [
+        entry
+        for entry in directory.iterdir()
+        if is_time_name(entry.name) and entry.is_dir()
+    ]
     return sorted(times, key=lambda p: float(p.name))
 
 
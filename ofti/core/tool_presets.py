@@ -1,26 +1,47 @@
 from __future__ import annotations
 
+import re
 import shlex
+import stat as stat_module
 from pathlib import Path
 
+# "name: command" lines; comments start with "#" after optional indentation.
+_PRESET_LINE_RE = re.compile(r"^[^\S\n]*+([^#:\n][^:\n]*):([^\n]*)", re.MULTILINE)
+_PRESETS_CACHE_SIZE = 32
+_PRESETS_CACHE: dict[str, tuple[tuple[int, int], list[tuple[str, list[str]]]]] = {}
 
-def load_presets_from_path(cfg_path: Path) -> list[tuple[str, list[str]]]:
-    presets: list[tuple[str, list[str]]] = []
-    if not cfg_path.is_file():
-        return presets
 
+def load_presets_from_path(cfg_path: Path) -> list[tuple[str, list[str]]]:
+    # The tool menu and catalog reload both preset files on every open.
     try:
-        lines = cfg_path.read_text().splitlines()
+        stat = cfg_path.stat()
     except OSError:
-        return presets
-
-    for raw_line in lines:
-        line = raw_line.strip()
-        if not line or line.startswith("#") or ":" not in line:
-            continue
-        name, cmd_str = line.split(":", 1)
-        name = name.strip()
-        cmd_str = cmd_str.strip()
+        return []
+    if not stat_module.S_ISREG(stat.st_mode):
+        return []
+    key = str(cfg_path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _PRESETS_CACHE.get(key)
+    if cached is None or cached[0] != stamp:
+        try:
+            presets = _parse_presets(cfg_path.read_text())
+        except OSError:
+            return []
+        cached = (stamp, presets)
+        _PRESETS_CACHE.pop(key, None)
+        _PRESETS_CACHE[key] = cached
+        while len(_PRESETS_CACHE) > _PRESETS_CACHE_SIZE:
+            _PRESETS_CACHE.pop(next(iter(_PRESETS_CACHE)))
+    return [(name, list(cmd)) for name, cmd in cached[1]]
+
+
+def _parse_presets(text: str) -> list[tuple[str, list[str]]]:
+    # Same line breaks as str.splitlines(), so the regex only has to know "\n".
+    text = "\n".join(text.splitlines())
+    presets: list[tuple[str, list[str]]] = []
+    for match in _PRESET_LINE_RE.finditer(text):
+        name = match[1].strip()
+        cmd_str = match[2].strip()
         if not name or not cmd_str:
             continue
         try:
@@ -44,6 +44,21 @@ def wm_project_dir_from_bashrc(bashrc: Path) -> str | None:
         return None
 
 
+def bashrc_already_loaded(bashrc: Path, executable: str) -> bool:
+    # True only when this installation's bashrc was really sourced into the
+    # running environment: picking a bashrc in the UI sets WM_PROJECT_DIR but
+    # not WM_PROJECT_VERSION, PATH or the library path.
+    wm_dir = os.environ.get("WM_PROJECT_DIR")
+    if not wm_dir or not os.environ.get("WM_PROJECT_VERSION"):
+        return False
+    if shutil.which(executable) is None:
+        return False
+    try:
+        return Path(wm_dir).resolve() == Path(bashrc).resolve().parent.parent
+    except OSError:
+        return False
+
+
 def auto_detect_bashrc_paths() -> list[Path]:
     found: list[Path] = []
     seen: set[Path] = set()
@@ -1,9 +1,24 @@
 from __future__ import annotations
 
+import codecs
+import io
+import locale
+import os
+import selectors
 import shutil
 import subprocess
-from collections.abc import Iterable
+import tempfile
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import ExitStack, contextmanager, suppress
 from os import PathLike
+from typing import IO, Any
+
+_STOP_GRACE_S = 2.0
+_SHELL_STARTUP_VARS = frozenset({"BASH_ENV", "ENV"})
+_READ_CHUNK = 65536
+_CHILDREN: dict[int, list[subprocess.Popen[Any]]] = {}
+_CHILDREN_LOCK = threading.Lock()
 
 
 def resolve_executable(cmd: str) -> str:
@@ -15,6 +30,11 @@ def resolve_executable(cmd: str) -> str:
     return resolved
 
 
+def shell_env() -> dict[str, str]:
+    # os.environ minus the variables that make non-interactive shells source files.
+    return {key: value for key, value in os.environ.items() if key not in _SHELL_STARTUP_VARS}
+
+
 def run_trusted(
     args: Iterable[str],
     *,
@@ -29,12 +49,157 @@ def run_trusted(
     if not args_list:
         raise ValueError("No command specified")
     args_list[0] = resolve_executable(args_list[0])
-    return subprocess.run(
+    with ExitStack() as stack:
+        # Captured output spools to unlinked temp files rather than pipes: the
+        # child never stalls on a full pipe and nothing is buffered chunk by
+        # chunk in Python while it runs.
+        out = stack.enter_context(tempfile.TemporaryFile()) if capture_output else None
+        err = stack.enter_context(tempfile.TemporaryFile()) if capture_output else None
+        proc = subprocess.Popen(
+            args_list,
+            cwd=cwd,
+            env=env,
+            stdin=subprocess.PIPE if stdin is not None else None,
+            stdout=out,
+            stderr=err,
+            text=text,
+        )
+        # Registered so a UI thread can cancel a command run on a worker thread.
+        with proc, _tracked_child(proc):
+            try:
+                proc.communicate(stdin)
+            except BaseException:
+                proc.kill()
+                raise
+        stdout = _read_capture(out, text=text)
+        stderr = _read_capture(err, text=text)
+    completed = subprocess.CompletedProcess(args_list, proc.returncode, stdout, stderr)
+    if check:
+        completed.check_returncode()
+    return completed
+
+
+def _read_capture(handle: IO[bytes] | None, *, text: bool) -> Any:
+    if handle is None:
+        return None
+    handle.seek(0)
+    data = handle.read()
+    if not text:
+        return data
+    # Same decoding as text-mode pipes: locale encoding, universal newlines.
+    decoded = data.decode(locale.getpreferredencoding(False))
+    if "\r" in decoded:
+        decoded = decoded.replace("\r\n", "\n").replace("\r", "\n")
+    return decoded
+
+
+@contextmanager
+def _tracked_child(proc: subprocess.Popen[Any]) -> Iterator[None]:
+    ident = threading.get_ident()
+    with _CHILDREN_LOCK:
+        _CHILDREN.setdefault(ident, []).append(proc)
+    try:
+        yield
+    finally:
+        with _CHILDREN_LOCK:
+            procs = _CHILDREN.get(ident, [])
+            if proc in procs:
+                procs.remove(proc)
+            if not procs:
+                _CHILDREN.pop(ident, None)
+
+
+def stop_thread_children(ident: int | None, *, grace_s: float = _STOP_GRACE_S) -> None:
+    # Terminate commands run_trusted started on thread `ident`; kill stragglers.
+    with _CHILDREN_LOCK:
+        procs = list(_CHILDREN.get(ident, [])) if ident is not None else []
+    _stop_processes(procs, grace_s)
+
+
+def _stop_processes(procs: list[subprocess.Popen[Any]], grace_s: float) -> None:
+    for proc in procs:
+        with suppress(OSError):
+            proc.terminate()
+    for proc in procs:
+        try:
+            proc.wait(grace_s)
+        except subprocess.TimeoutExpired:
+            with suppress(OSError):
+                proc.kill()
+
+
+def run_trusted_streaming(
+    args: Iterable[str],
+    *,
+    on_stdout: Callable[[str], None],
+    on_stderr: Callable[[str], None],
+    cwd: str | PathLike[str] | None = None,
+    env: dict[str, str] | None = None,
+) -> int:
+    # Hand output to the callbacks line by line instead of buffering it all.
+    args_list = list(args)
+    if not args_list:
+        raise ValueError("No command specified")
+    args_list[0] = resolve_executable(args_list[0])
+    proc = subprocess.Popen(
         args_list,
         cwd=cwd,
-        input=stdin,
         env=env,
-        text=text,
-        capture_output=capture_output,
-        check=check,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
     )
+    with proc, _tracked_child(proc):
+        try:
+            _pump_streams(proc, on_stdout, on_stderr)
+        except BaseException:
+            # Ctrl-C (or a failing callback) stops the child instead of waiting it
+            # out; one that ignores SIGTERM is killed after a grace period.
+            _stop_processes([proc], _STOP_GRACE_S)
+            raise
+        return proc.wait()
+
+
+def _pump_streams(
+    proc: subprocess.Popen[bytes],
+    on_stdout: Callable[[str], None],
+    on_stderr: Callable[[str], None],
+) -> None:
+    # One select loop serves both pipes, so callbacks never race each other.
+    with selectors.DefaultSelector() as selector:
+        for stream, callback in ((proc.stdout, on_stdout), (proc.stderr, on_stderr)):
+            if stream is not None:
+                selector.register(stream, selectors.EVENT_READ, _LineFeed(callback))
+        while selector.get_map():
+            for key, _events in selector.select():
+                chunk = os.read(key.fd, _READ_CHUNK)
+                if not chunk:
+                    selector.unregister(key.fileobj)
+                key.data.feed(chunk, final=not chunk)
+
+
+class _LineFeed:
+    # Decodes pipe chunks like text-mode reads (UTF-8, universal newlines).
+    def __init__(self, callback: Callable[[str], None]) -> None:
+        self._callback = callback
+        self._decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder("utf-8")(errors="replace"), translate=True,
+        )
+        self._pending: list[str] = []
+
+    def feed(self, chunk: bytes, *, final: bool = False) -> None:
+        # Unterminated text is kept as pieces and joined only once its newline
+        # arrives, so a long line is not re-copied for every chunk.
+        text = self._decoder.decode(chunk, final=final)
+        if "\n" not in text:
+            if text:
+                self._pending.append(text)
+        else:
+            first, *lines, rest = text.split("\n")
+            self._callback("".join([*self._pending, first, "\n"]))
+            for line in lines:
+                self._callback(line + "\n")
+            self._pending = [rest] if rest else []
+        if final and self._pending:
+            self._callback("".join(self._pending))
+            self._pending = []
@@ -35,6 +35,11 @@ _BASE_FILTER_TERMS = (
     "Solving for",
 )
 _MAX_FILTER_TERMS = 96
+_PARSED_LOG_CACHE_SIZE = 8
+_PARSED_LOG_CACHE: dict[
+    tuple[str, int, int, int | None],
+    tuple[LogMetrics, dict[str, list[float]]],
+] = {}
 
 
 def parse_residuals(text: str) -> dict[str, list[float]]:
@@ -135,6 +140,23 @@ def parse_log_metrics_and_residuals(text: str) -> tuple[LogMetrics, dict[str, li
     ), residuals
 
 
+def read_log_metrics_and_residuals(
+    path: Path,
+    *,
+    max_bytes: int | None = _DEFAULT_MAX_LOG_BYTES,
+) -> tuple[LogMetrics, dict[str, list[float]]]:
+    stat = path.stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size, max_bytes)
+    cached = _PARSED_LOG_CACHE.get(key)
+    if cached is not None:
+        return cached
+    parsed = parse_log_metrics_and_residuals(read_log_text(path, max_bytes=max_bytes))
+    _PARSED_LOG_CACHE[key] = parsed
+    if len(_PARSED_LOG_CACHE) > _PARSED_LOG_CACHE_SIZE:
+        _PARSED_LOG_CACHE.pop(next(iter(_PARSED_LOG_CACHE)))
+    return parsed
+
+
 def _append_time_value(line: str, values: list[float]) -> None:
     if "Time" not in line:
         return
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import itertools
+import os
 import re
 import shutil
 from collections.abc import Callable, Iterable, Mapping, Sequence
@@ -90,28 +91,69 @@ def _build_parametric_cases_fallback(
 ) -> list[Path]:
     output_root = output_root or case_path.parent
     created: list[Path] = []
+    manifest: tuple[list[str], list[str]] | None = None
     for raw_value in values:
         value = raw_value.strip()
         if not value:
             continue
+        if manifest is None:
+            manifest = _case_tree_manifest(case_path)
         created.append(
-            _create_fallback_parametric_case(case_path, output_root, dict_path, entry, value),
+            _create_fallback_parametric_case(
+                case_path, output_root, dict_path, entry, value, manifest=manifest,
+            ),
         )
     return created
 
 
+def _case_tree_manifest(case_path: Path) -> tuple[list[str], list[str]]:
+    dirs: list[str] = []
+    files: list[str] = []
+    stack = [""]
+    while stack:
+        rel = stack.pop()
+        with os.scandir(case_path / rel) as it:
+            entries = list(it)
+        ignored = _default_ignore(rel, [entry.name for entry in entries])
+        for entry in entries:
+            if entry.name in ignored:
+                continue
+            child = f"{rel}/{entry.name}" if rel else entry.name
+            if entry.is_dir():
+                dirs.append(child)
+                stack.append(child)
+            else:
+                files.append(child)
+    return dirs, files
+
+
+def _copy_case_manifest(
+    case_path: Path,
+    dest: Path,
+    manifest: tuple[list[str], list[str]],
+) -> None:
+    dirs, files = manifest
+    dest.mkdir(parents=True)
+    for rel in dirs:
+        (dest / rel).mkdir()
+    for rel in files:
+        shutil.copy2(case_path / rel, dest / rel)
+
+
 def _create_fallback_parametric_case(
     case_path: Path,
     output_root: Path,
     dict_path: Path,
     entry: str,
     value: str,
+    *,
+    manifest: tuple[list[str], list[str]] | None = None,
 ) -> Path:
     suffix = _sanitize_value(value)
     dest = output_root / f"{case_path.name}_{entry.replace('.', '_')}_{suffix}"
     if dest.exists():
         raise FileExistsError(dest)
-    shutil.copytree(case_path, dest, ignore=_default_ignore)
+    _copy_case_manifest(case_path, dest, manifest or _case_tree_manifest(case_path))
     target_dict = dest / dict_path
     if not target_dict.is_file():
         raise FileNotFoundError(target_dict)
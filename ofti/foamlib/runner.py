@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from pathlib import Path
 from typing import Any
 
@@ -161,6 +161,7 @@ async def _run_cases_async_impl(
     max_parallel: int,
     slurm: bool,
     fallback: bool,
+    on_case_done: Callable[[Path, bool], None] | None = None,
 ) -> list[Path]:
     if max_parallel <= 0:
         raise ValueError("max_parallel must be > 0")
@@ -174,6 +175,7 @@ async def _run_cases_async_impl(
             log=log,
             slurm=slurm,
             fallback=fallback,
+            on_case_done=on_case_done,
         )
     return await _run_cases_parallel(
         case_paths,
@@ -185,6 +187,7 @@ async def _run_cases_async_impl(
         max_parallel=max_parallel,
         slurm=slurm,
         fallback=fallback,
+        on_case_done=on_case_done,
     )
 
 
@@ -198,6 +201,7 @@ async def _run_cases_sequential(
     log: bool | str,
     slurm: bool,
     fallback: bool,
+    on_case_done: Callable[[Path, bool], None] | None = None,
 ) -> list[Path]:
     for case_path in case_paths:
         try:
@@ -212,7 +216,11 @@ async def _run_cases_sequential(
                 fallback=fallback,
             )
         except Exception:
+            if on_case_done is not None:
+                on_case_done(case_path, False)
             return [case_path]
+        if on_case_done is not None:
+            on_case_done(case_path, True)
     return []
 
 
@@ -227,6 +235,7 @@ async def _run_cases_parallel(
     max_parallel: int,
     slurm: bool,
     fallback: bool,
+    on_case_done: Callable[[Path, bool], None] | None = None,
 ) -> list[Path]:
     failures: list[Path] = []
     sem = asyncio.Semaphore(max_parallel)
@@ -245,8 +254,13 @@ async def _run_cases_parallel(
                     fallback=fallback,
                 )
             except Exception as exc:  # pragma: no cover - exercised via wrapper
-                return path, exc
-            return path, None
+                error: BaseException | None = exc
+            else:
+                error = None
+        # Runs on the event loop thread, i.e. the caller's thread.
+        if on_case_done is not None:
+            on_case_done(path, error is None)
+        return path, error
 
     results = await asyncio.gather(*(_guarded(path) for path in case_paths))
     for path, error in results:
@@ -266,6 +280,7 @@ def run_cases_async(
     max_parallel: int = 1,
     slurm: bool = False,
     fallback: bool = False,
+    on_case_done: Callable[[Path, bool], None] | None = None,
 ) -> list[Path]:
     paths = [Path(path) for path in case_paths]
     if not paths:
@@ -286,6 +301,7 @@ def run_cases_async(
             max_parallel=max_parallel,
             slurm=slurm,
             fallback=fallback,
+            on_case_done=on_case_done,
         ),
     )
 
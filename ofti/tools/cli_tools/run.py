@@ -12,7 +12,7 @@ from collections.abc import Mapping
 from pathlib import Path
 from typing import Any, TypedDict
 
-from ofti.core.case import read_number_of_subdomains
+from ofti.core.case import decomposed_processors, read_number_of_subdomains
 from ofti.core.entry_io import write_entry
 from ofti.core.solver_checks import resolve_solver_name, validate_initial_fields
 from ofti.foam.subprocess_utils import resolve_executable, run_trusted
@@ -30,11 +30,13 @@ from ofti.tools.cli_tools import run_queue as _run_queue
 from ofti.tools.cli_tools import run_smoke as _run_smoke
 from ofti.tools.helpers import with_bashrc
 from ofti.tools.job_registry import register_job
+from ofti.tools.tool_aliases import normalize_tool_name
 from ofti.tools.tool_catalog import tool_catalog
 
 from .common import require_case_dir
 
 RunResult = runner_service.RunResult
+_LATEST_TIME_PLACEHOLDER = "{{latestTime}}"
 
 parse_duration_seconds = _run_smoke.parse_duration_seconds
 smoke_payload = _run_smoke.smoke_payload
@@ -60,11 +62,6 @@ class GridAxis(TypedDict):
     values: list[str]
 
 
-def normalize_tool_name(value: str) -> str:
-    lowered = value.strip().lower()
-    return "".join(ch for ch in lowered if ch.isalnum() or ch in {"-", "_", ".", ":"})
-
-
 def tool_catalog_names(case_dir: Path) -> list[str]:
     payload = tool_catalog_payload(case_dir)
     return list(payload["tools"])
@@ -109,22 +106,25 @@ def catalog_command_keys(case_dir: Path) -> list[str]:
         token = normalize_tool_name(display.removeprefix("[post] "))
         if not token:
             continue
-        keys.append(token)
-        keys.append(normalize_tool_name(f"post:{token}"))
-        keys.append(normalize_tool_name(f"post.{token}"))
+        keys.extend((token, f"post:{token}", f"post.{token}"))
     return sorted(set(keys))
 
 
 def expand_command(case_dir: Path, cmd: list[str]) -> list[str]:
     case_path = require_case_dir(case_dir)
+    # latest_time() may launch foamListTimes; only pay for it when templated.
+    if not any(_LATEST_TIME_PLACEHOLDER in part for part in cmd):
+        return list(cmd)
     latest = latest_time(case_path)
-    return [part.replace("{{latestTime}}", latest) for part in cmd]
+    return [part.replace(_LATEST_TIME_PLACEHOLDER, latest) for part in cmd]
 
 
 def expand_shell_command(case_dir: Path, shell_cmd: str) -> str:
     case_path = require_case_dir(case_dir)
+    if _LATEST_TIME_PLACEHOLDER not in shell_cmd:
+        return shell_cmd
     latest = latest_time(case_path)
-    return shell_cmd.replace("{{latestTime}}", latest)
+    return shell_cmd.replace(_LATEST_TIME_PLACEHOLDER, latest)
 
 
 def solver_command(
@@ -201,7 +201,7 @@ def prepare_parallel_case(
             "dry_run": bool(dry_run),
             "applied": False,
         }
-    cleaned = _list_processor_dirs(case_path) if clean_processors else []
+    cleaned = decomposed_processors(case_path) if clean_processors else []
     decompose_cmd = ["decomposePar", "-force"]
     payload: dict[str, Any] = {
         "parallel": int(parallel),
@@ -455,14 +455,6 @@ def _write_subdomains_fallback(decompose_dict: Path, *, requested: int) -> bool:
     return True
 
 
-def _list_processor_dirs(case_path: Path) -> list[Path]:
-    return sorted(
-        path
-        for path in case_path.iterdir()
-        if path.is_dir() and path.name.startswith("processor")
-    )
-
-
 def _remove_processor_dirs(paths: list[Path]) -> None:
     for path in paths:
         try:
@@ -526,12 +518,8 @@ def _normalize_name(value: str) -> str:
 def _catalog_resolution_queries(name: str) -> list[str]:
     normalized = normalize_tool_name(name)
     queries = [name]
-    if normalized.startswith("post:"):
-        token = normalized.split(":", 1)[1]
-        if token:
-            queries.append(f"[post] {token}")
-    if normalized.startswith("post."):
-        token = normalized.split(".", 1)[1]
+    if normalized.startswith(("post:", "post.")):
+        token = normalized[len("post:") :]
         if token:
             queries.append(f"[post] {token}")
     return queries
@@ -8,7 +8,6 @@ patchable and avoid an import cycle.
 from __future__ import annotations
 
 import json
-import os
 import re
 import shutil
 import subprocess
@@ -19,6 +18,7 @@ from pathlib import Path
 from typing import Any
 
 from ofti.core.entry_io import read_entry, write_entry
+from ofti.foam.subprocess_utils import shell_env
 from ofti.tools import knife_service, runner_service
 
 from .common import require_case_dir
@@ -235,9 +235,7 @@ def _run_smoke_command(
     log_path: Path,
 ) -> tuple[subprocess.CompletedProcess[str], bool]:
     log_path.parent.mkdir(parents=True, exist_ok=True)
-    env = os.environ.copy()
-    env.pop("BASH_ENV", None)
-    env.pop("ENV", None)
+    env = shell_env()
     try:
         # Command is built by solver_command(), not shell text; timeout keeps smoke runs bounded.
         result = subprocess.run(  # noqa: S603
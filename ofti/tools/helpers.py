@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from ofti.foam.openfoam_env import (
     auto_detect_bashrc_paths,
+    bashrc_already_loaded,
     resolve_openfoam_bashrc,
     with_bashrc,
     wm_project_dir_from_bashrc,
@@ -9,6 +10,7 @@ from ofti.foam.openfoam_env import (
 
 __all__ = [
     "auto_detect_bashrc_paths",
+    "bashrc_already_loaded",
     "resolve_openfoam_bashrc",
     "with_bashrc",
     "wm_project_dir_from_bashrc",
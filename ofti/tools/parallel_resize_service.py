@@ -9,6 +9,7 @@ from typing import Any
 
 from ofti.core.case import read_number_of_subdomains, set_start_from_latest
 from ofti.core.case_snapshot import write_case_snapshot, write_snapshot_manifest
+from ofti.core.times import is_time_name
 from ofti.core.tool_dicts_service import apply_assignment_or_write
 from ofti.foam.times import latest_time
 from ofti.tools import case_source_service, knife_service, watch_service
@@ -421,7 +422,7 @@ def _processor_times(processor_dir: Path) -> list[str]:
         (
             path.name
             for path in processor_dir.iterdir()
-            if path.is_dir() and _is_time_name(path.name)
+            if is_time_name(path.name) and path.is_dir()
         ),
         key=_time_sort_key,
     )
@@ -487,14 +488,6 @@ def _reconstruct_command(time_name: str) -> list[str]:
     return ["reconstructPar", "-time", time_name]
 
 
-
-def _is_time_name(value: str) -> bool:
-    try:
-        float(value)
-    except ValueError:
-        return False
-    return True
-
 def _time_sort_key(value: str) -> tuple[float, str]:
     try:
         return (float(value), value)
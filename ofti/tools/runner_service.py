@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-import os
 import shlex
 from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Protocol
 
+from ofti.foam.subprocess_utils import shell_env
+
 
 class _RunTrustedResult(Protocol):
     returncode: int
@@ -44,9 +45,7 @@ def execute_case_command(
 ) -> RunResult:
     command_text = " ".join(shlex.quote(part) for part in cmd)
     shell_cmd = with_bashrc_fn(command_text)
-    env = os.environ.copy()
-    env.pop("BASH_ENV", None)
-    env.pop("ENV", None)
+    env = shell_env()
     if extra_env:
         env.update(extra_env)
 
@@ -57,3 +57,13 @@ STATIC_TOOL_ALIAS_GROUPS: tuple[tuple[str, ...], ...] = (
 STATIC_TOOL_ALIAS_NAMES: tuple[str, ...] = tuple(
     name for group in STATIC_TOOL_ALIAS_GROUPS for name in group
 )
+
+
+def normalize_tool_name(value: str) -> str:
+    lowered = value.strip().lower()
+    return "".join(ch for ch in lowered if ch.isalnum() or ch in {"-", "_", ".", ":"})
+
+
+STATIC_TOOL_ALIAS_KEYS: frozenset[str] = frozenset(
+    normalize_tool_name(name) for name in STATIC_TOOL_ALIAS_NAMES
+)
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+# curses cannot report a window's input delay, so screens that poll record it
+# here; helpers that briefly read without blocking put it back afterwards.
+_INPUT_TIMEOUTS: dict[int, int] = {}
+
+
+def set_input_timeout(stdscr: Any, delay_ms: int) -> None:
+    stdscr.timeout(delay_ms)
+    if delay_ms < 0:
+        _INPUT_TIMEOUTS.pop(id(stdscr), None)
+    else:
+        _INPUT_TIMEOUTS[id(stdscr)] = delay_ms
+
+
+def input_timeout(stdscr: Any) -> int:
+    return _INPUT_TIMEOUTS.get(id(stdscr), -1)
+
+
+def drain_keys(stdscr: Any, consume: Callable[[int], bool]) -> int:
+    # Feed already-queued keys to consume() until it declines one or the queue
+    # is empty; return that key (-1 when nothing is left) for the caller.
+    stdscr.timeout(0)
+    try:
+        while True:
+            key = stdscr.getch()
+            if key == -1 or not consume(key):
+                return key
+    finally:
+        stdscr.timeout(input_timeout(stdscr))
@@ -10,8 +10,9 @@ from typing import Any
 
 from ofti.foam.config import fzf_enabled, get_config, key_in
 from ofti.foam.exceptions import QuitAppError
-from ofti.foam.subprocess_utils import resolve_executable, run_trusted
+from ofti.foam.subprocess_utils import resolve_executable, run_trusted, shell_env
 from ofti.ui_curses.help.manager import help_registry
+from ofti.ui_curses.keys import drain_keys
 from ofti.ui_curses.viewer import Viewer
 
 
@@ -177,6 +178,7 @@ class Menu:
         self.disabled_helpers = disabled_helpers or {}
         self.help_lines = help_lines or []
         self._scroll = 0
+        self._pending_key = -1
 
     def display(self) -> None:
         if hasattr(self.stdscr, "erase"):
@@ -292,9 +294,7 @@ class Menu:
         case_path = os.environ.get("OFTI_CASE_PATH") or str(Path.cwd())
         curses.def_prog_mode()
         curses.endwin()
-        env = os.environ.copy()
-        env.pop("BASH_ENV", None)
-        env.pop("ENV", None)
+        env = shell_env()
         try:
             shell = env.get("SHELL") or "bash"
             subprocess.run([shell], cwd=case_path, env=env)
@@ -341,12 +341,41 @@ class Menu:
     def _show_help(self) -> None:
         _show_help(self.stdscr, "Help", self._help_lines())
 
-    def _handle_navigation_key(self, key: int, cfg: Any) -> str | None:
+    def _read_key(self) -> int:
+        if self._pending_key != -1:
+            key, self._pending_key = self._pending_key, -1
+            return key
+        # A polling caller may leave a getch timeout active; idle ticks
+        # should not trigger a full redraw of a static menu.
+        key = self.stdscr.getch()
+        while key == -1 and self.banner_provider is None:
+            key = self.stdscr.getch()
+        return key
+
+    def _nav_step(self, key: int, cfg: Any) -> int:
         if key in (curses.KEY_UP,) or key_in(key, cfg.keys.get("up", [])):
-            self.current_option = (self.current_option - 1) % len(self.options)
-            return "continue"
+            return -1
         if key in (curses.KEY_DOWN,) or key_in(key, cfg.keys.get("down", [])):
-            self.current_option = (self.current_option + 1) % len(self.options)
+            return 1
+        return 0
+
+    def _move_cursor(self, step: int, cfg: Any) -> None:
+        self.current_option = (self.current_option + step) % len(self.options)
+        if not hasattr(self.stdscr, "timeout"):
+            return
+
+        def consume(key: int) -> bool:
+            queued = self._nav_step(key, cfg)
+            self.current_option = (self.current_option + queued) % len(self.options)
+            return queued != 0
+
+        # Fold a burst of queued up/down repeats into a single redraw.
+        self._pending_key = drain_keys(self.stdscr, consume)
+
+    def _handle_navigation_key(self, key: int, cfg: Any) -> str | None:
+        step = self._nav_step(key, cfg)
+        if step:
+            self._move_cursor(step, cfg)
             return "continue"
         if key_in(key, cfg.keys.get("top", [])):
             self.current_option = 0
@@ -377,7 +406,7 @@ class Menu:
         cfg = get_config()
         while True:
             self.display()
-            key = self.stdscr.getch()
+            key = self._read_key()
 
             if key_in(key, cfg.keys.get("quit", [])):
                 raise QuitAppError()
@@ -461,7 +490,7 @@ class Submenu(Menu):
         cfg = get_config()
         while True:
             self.display()
-            key = self.stdscr.getch()
+            key = self._read_key()
 
             if key_in(key, cfg.keys.get("quit", [])):
                 raise QuitAppError()
@@ -555,7 +584,7 @@ class RootMenu(Menu):
         cfg = get_config()
         while True:
             self.display()
-            key = self.stdscr.getch()
+            key = self._read_key()
 
             if key_in(key, cfg.keys.get("quit", [])):
                 raise QuitAppError()
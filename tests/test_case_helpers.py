@@ -1,7 +1,11 @@
 from pathlib import Path
 
+import pytest
+
+from ofti.core import case as case_module
 from ofti.core.case import (
     detect_mesh_stats,
+    detect_solver,
     has_mesh,
     latest_checkmesh_log,
     parse_cells_count,
@@ -30,3 +34,27 @@ def test_detect_mesh_stats_from_log(tmp_path: Path) -> None:
     summary = detect_mesh_stats(case_dir)
     assert "10 cells" in summary
     assert "skew=1.2" in summary
+
+
+def test_detect_solver_reuses_parse_until_control_dict_changes(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    assert detect_solver(tmp_path) == "unknown"
+    control = tmp_path / "system" / "controlDict"
+    control.parent.mkdir()
+    control.write_text("application simpleFoam;\n")
+    reads: list[Path] = []
+
+    def _read(path: Path, _key: str) -> str:
+        reads.append(path)
+        return path.read_text().split()[1]
+
+    monkeypatch.setattr(case_module, "read_entry", _read)
+    assert detect_solver(tmp_path) == "simpleFoam"
+    assert detect_solver(tmp_path) == "simpleFoam"
+    assert reads == [control]
+
+    control.write_text("application pisoFoam;\n")
+    assert detect_solver(tmp_path) == "pisoFoam"
+    assert len(reads) == 2
@@ -75,6 +75,16 @@ def test_run_expand_command_helpers_replace_latest_time(tmp_path: Path) -> None:
     assert shell_expanded == "postProcess -time 1.5"
 
 
+def test_run_expand_command_skips_latest_time_without_placeholder(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    case = _make_case(tmp_path / "case")
+    monkeypatch.setattr(run, "latest_time", lambda _case: pytest.fail("no lookup needed"))
+
+    assert run.expand_command(case, ["blockMesh"]) == ["blockMesh"]
+    assert run.expand_shell_command(case, "checkMesh -allGeometry") == "checkMesh -allGeometry"
+
+
 def test_run_solver_command_validates_errors(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     case = _make_case(tmp_path / "case")
 
@@ -2,6 +2,7 @@ from pathlib import Path
 
 import pytest
 
+from ofti.foamlib import logs
 from ofti.foamlib.logs import (
     execution_time_deltas,
     parse_courant_numbers,
@@ -10,6 +11,7 @@ from ofti.foamlib.logs import (
     parse_log_metrics_and_residuals,
     parse_residuals,
     parse_time_steps,
+    read_log_metrics_and_residuals,
     read_log_tail_lines,
     read_log_text,
     read_log_text_filtered,
@@ -50,6 +52,34 @@ def test_parse_time_and_courant_and_exec() -> None:
     assert execution_time_deltas(metrics.execution_times) == [1.2]
 
 
+def test_read_log_metrics_and_residuals_reuses_unchanged_file(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "log.simpleFoam"
+    path.write_text("Time = 0.1\nSolving for Ux, Initial residual = 0.5, Final residual = 0.1\n")
+    calls: list[str] = []
+    original = logs.parse_log_metrics_and_residuals
+
+    def _parse(text: str) -> tuple[logs.LogMetrics, dict[str, list[float]]]:
+        calls.append(text)
+        return original(text)
+
+    monkeypatch.setattr(logs, "parse_log_metrics_and_residuals", _parse)
+    monkeypatch.setattr(logs, "_PARSED_LOG_CACHE", {})
+    metrics, residuals = read_log_metrics_and_residuals(path)
+    assert metrics.times == [0.1]
+    assert residuals == {"Ux": [0.5]}
+    assert read_log_metrics_and_residuals(path) == (metrics, residuals)
+    assert len(calls) == 1
+
+    path.write_text("Time = 0.1\nTime = 0.2\n")
+    metrics, residuals = read_log_metrics_and_residuals(path)
+    assert metrics.times == [0.1, 0.2]
+    assert residuals == {}
+    assert len(calls) == 2
+
+
 def test_read_log_tail_lines(tmp_path: Path) -> None:
     path = tmp_path / "log.simpleFoam"
     path.write_text("\n".join(f"line-{idx}" for idx in range(1, 21)) + "\n")
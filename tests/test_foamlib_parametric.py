@@ -2,6 +2,7 @@ from pathlib import Path
 
 import pytest
 
+from ofti.foamlib import parametric
 from ofti.foamlib.adapter import read_entry
 from ofti.foamlib.parametric import build_parametric_cases
 
@@ -22,3 +23,46 @@ def test_build_parametric_cases(tmp_path: Path) -> None:
     assert (new_case / "system" / "controlDict").is_file()
     value = read_entry(new_case / "system" / "controlDict", "application")
     assert value.strip().rstrip(";") == "simpleFoam"
+
+
+def test_fallback_parametric_cases_walk_template_once(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    case_path = tmp_path / "base"
+    (case_path / "system").mkdir(parents=True)
+    (case_path / "system" / "controlDict").write_text("application simpleFoam;\n")
+    (case_path / "constant" / "polyMesh").mkdir(parents=True)
+    (case_path / "constant" / "polyMesh" / "points").write_text("()\n")
+    (case_path / "processor0").mkdir()
+    (case_path / "postProcessing").mkdir()
+    (case_path / "log.simpleFoam").write_text("log\n")
+
+    walks: list[Path] = []
+    original = parametric._case_tree_manifest
+
+    def _manifest(path: Path) -> tuple[list[str], list[str]]:
+        walks.append(path)
+        return original(path)
+
+    monkeypatch.setattr(parametric, "_case_tree_manifest", _manifest)
+    monkeypatch.setattr(parametric, "_write_dict_entry", lambda *_a: True)
+    created = parametric._build_parametric_cases_fallback(
+        case_path,
+        Path("system/controlDict"),
+        "application",
+        ["pisoFoam", "pimpleFoam"],
+        output_root=tmp_path,
+    )
+
+    assert walks == [case_path]
+    assert [path.name for path in created] == [
+        "base_application_pisoFoam",
+        "base_application_pimpleFoam",
+    ]
+    for dest in created:
+        assert (dest / "constant" / "polyMesh" / "points").read_text() == "()\n"
+        assert (dest / "system" / "controlDict").is_file()
+        assert not (dest / "processor0").exists()
+        assert not (dest / "postProcessing").exists()
+        assert not (dest / "log.simpleFoam").exists()
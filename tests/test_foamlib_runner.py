@@ -118,3 +118,36 @@ def test_run_cases_async_uses_backend_flags(monkeypatch: pytest.MonkeyPatch, tmp
         fallback=True,
     )
     assert ok_slurm == []
+
+
+def test_run_cases_async_reports_each_finished_case(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path,
+) -> None:
+    class _AsyncCase:
+        def __init__(self, path: Path) -> None:
+            self.path = path
+
+        async def run(self, *_args, **_kwargs) -> None:
+            if self.path.name == "bad":
+                raise RuntimeError("solver failed")
+
+    monkeypatch.setattr(runner, "AsyncFoamCase", _AsyncCase)
+    monkeypatch.setattr(runner, "available", lambda: True)
+    paths = [tmp_path / "ok", tmp_path / "bad"]
+    done: list[tuple[str, bool]] = []
+
+    failures = runner.run_cases_async(
+        paths,
+        check=False,
+        max_parallel=2,
+        on_case_done=lambda path, ok: done.append((path.name, ok)),
+    )
+
+    assert failures == [tmp_path / "bad"]
+    assert sorted(done) == [("bad", False), ("ok", True)]
+
+    done.clear()
+    assert runner.run_cases_async(
+        paths, check=True, on_case_done=lambda path, ok: done.append((path.name, ok)),
+    ) == [tmp_path / "bad"]
+    assert done == [("ok", True), ("bad", False)]
@@ -44,6 +44,21 @@ def test_logs_select_fallback_and_solver_menu(monkeypatch: pytest.MonkeyPatch, t
     assert logs_select._select_solver_log_file(case, _Screen(), title="solver") == solver_log
 
 
+def test_list_logs_filters_files_and_orders(tmp_path: Path) -> None:
+    case = tmp_path / "case"
+    case.mkdir()
+    (case / "log.b").write_text("b\n")
+    (case / "log.a").write_text("a\n")
+    (case / "log.dir").mkdir()
+    (case / "other").write_text("x\n")
+    os.utime(case / "log.b", ns=(1_000_000_000, 1_000_000_000))
+    os.utime(case / "log.a", ns=(2_000_000_000, 2_000_000_000))
+    assert logs_select._list_logs(case) == [case / "log.a", case / "log.b"]
+    assert logs_select._list_logs(case, by_mtime=True) == [case / "log.b", case / "log.a"]
+    assert logs_select._list_logs(case, "log.b") == [case / "log.b"]
+    assert logs_select._list_logs(tmp_path / "missing") == []
+
+
 def test_select_solver_log_file_missing_solver_logs(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     case = tmp_path / "case"
     case.mkdir()
@@ -223,3 +238,115 @@ def test_log_tail_screen_uses_bounded_reads_and_resets_timeout(
     assert seen["max_bytes"] == logs_view._LOG_TAIL_MAX_BYTES
     assert screen.timeout_values[0] == logs_view._LOG_TAIL_POLL_MS
     assert screen.timeout_values[-1] == -1
+
+
+def test_log_tail_screen_skips_reads_while_log_is_unchanged(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    case = tmp_path / "case"
+    case.mkdir()
+    log_path = case / "log.simpleFoam"
+    log_path.write_text("Time = 1\n")
+    reads: list[Path] = []
+
+    def _tail(path: Path, *, max_lines: int, max_bytes: int) -> list[str]:
+        reads.append(path)
+        return ["Time = 1"]
+
+    monkeypatch.setattr(logs_view, "get_config", lambda: types.SimpleNamespace(courant_limit=0.5, keys={"back": [ord("h")]}))
+    monkeypatch.setattr(logs_view, "key_in", lambda key, keys: key in keys)
+    monkeypatch.setattr(logs_view, "build_menu", lambda *_a, **_k: _Menu(0))
+    monkeypatch.setattr(logs_view, "read_log_tail_lines", _tail)
+    logs_view.log_tail_screen(_Screen(keys=[-1, -1, ord("h")]), case)
+    assert reads == [log_path]
+
+
+def test_refresh_tail_state_appends_only_new_bytes(tmp_path: Path) -> None:
+    log_path = tmp_path / "log.simpleFoam"
+    log_path.write_text("Time = 1\nTime = 2\nparti")
+    state = logs_view._TailState()
+    logs_view._refresh_tail_state(log_path, state)
+    assert logs_view._tail_state_lines(state) == ["Time = 1", "Time = 2", "parti"]
+
+    with log_path.open("a") as handle:
+        handle.write("al\nTime = 3\n")
+    logs_view._refresh_tail_state(log_path, state)
+    assert list(state.lines) == ["Time = 1", "Time = 2", "partial", "Time = 3"]
+    assert state.partial == b""
+
+    log_path.write_text("rotated\n")
+    logs_view._refresh_tail_state(log_path, state)
+    assert logs_view._tail_state_lines(state) == ["rotated"]
+
+
+def test_refresh_tail_state_caps_partial_line(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path,
+) -> None:
+    monkeypatch.setattr(logs_view, "_LOG_TAIL_MAX_BYTES", 8)
+    log_path = tmp_path / "log.simpleFoam"
+    log_path.write_text("Time = 1\n")
+    state = logs_view._TailState()
+    logs_view._refresh_tail_state(log_path, state)
+    for chunk in ("abcdef", "ghijkl", "mnop"):
+        with log_path.open("a") as handle:
+            handle.write(chunk)
+        logs_view._refresh_tail_state(log_path, state)
+    assert state.partial == b"ijklmnop"
+    assert logs_view._tail_state_lines(state)[-1] == "ijklmnop"
+
+
+def test_refresh_tail_state_reloads_log_truncated_and_regrown(tmp_path: Path) -> None:
+    log_path = tmp_path / "log.simpleFoam"
+    log_path.write_text("Time = 1\nTime = 2\n")
+    state = logs_view._TailState()
+    logs_view._refresh_tail_state(log_path, state)
+
+    # Truncated and rewritten past the old size between two polls.
+    log_path.write_text("restart A\nrestart B\nrestart C\n")
+    logs_view._refresh_tail_state(log_path, state)
+    assert logs_view._tail_state_lines(state) == ["restart A", "restart B", "restart C"]
+
+    with log_path.open("a") as handle:
+        handle.write("restart D\n")
+    logs_view._refresh_tail_state(log_path, state)
+    assert list(state.lines)[-2:] == ["restart C", "restart D"]
+
+
+def test_draw_tail_block_writes_once_and_bolds_matches() -> None:
+    class _BlockScreen(_Screen):
+        def __init__(self) -> None:
+            super().__init__(height=6, width=40)
+            self.bold_rows: list[int] = []
+
+        def getyx(self) -> tuple[int, int]:
+            return (2, 0)
+
+        def chgat(self, row: int, *_args: object) -> None:
+            self.bold_rows.append(row)
+
+    screen = _BlockScreen()
+    lines = ["old", "Time = 1", "FATAL ERROR", "Time = 2"]
+    logs_view._draw_tail_block(
+        screen,
+        lines,
+        [False, False, True, False],
+        height=6,
+        width=40,
+    )
+    assert screen.lines == ["Time = 1\n!! FATAL ERROR\nTime = 2\n"]
+    assert screen.bold_rows == [3]
+
+
+def test_tail_view_reports_alerts_and_limits_visible_lines() -> None:
+    lines = [f"line {idx}" for idx in range(60)]
+    lines += ["Courant Number mean: 0.1 max: 1.5", "floating point exception", "nan"]
+
+    tail, marks, highlight = logs_view._tail_view(lines, 0.5)
+
+    assert len(tail) == logs_view._LOG_TAIL_VISIBLE_LINES
+    assert tail[-1] == "nan"
+    assert marks[-3:] == [True, True, True]
+    assert not any(marks[:-3])
+    assert "Courant max: 1.5" in highlight
+    assert "ALERT: Courant>0.5, FPE, NaN" in highlight
@@ -60,3 +60,18 @@ def test_menu_global_search_invokes_command() -> None:
     cfg.keys["global_search"] = ["s"]
     menu = Menu(FakeScreen(keys=[]), "Title", ["alpha"])
     assert menu._handle_navigation_key(ord("s"), cfg) == "global_search"
+
+
+def test_menu_idle_getch_ticks_do_not_redraw(monkeypatch) -> None:
+    screen = FakeScreen(keys=[-1, -1, -1, ord("h")])
+    menu = Menu(screen, "Title", ["Only"])
+    draws: list[int] = []
+    original_display = menu.display
+
+    def _display() -> None:
+        draws.append(1)
+        original_display()
+
+    monkeypatch.setattr(menu, "display", _display)
+    assert menu.navigate() == -1
+    assert len(draws) == 1
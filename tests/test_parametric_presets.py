@@ -1,5 +1,8 @@
 from pathlib import Path
 
+import pytest
+
+from ofti.core import postprocessing
 from ofti.core.postprocessing import read_parametric_presets
 
 
@@ -18,3 +21,76 @@ def test_read_parametric_presets_colon_format(tmp_path: Path) -> None:
     presets, errors = read_parametric_presets(path)
     assert not errors
     assert presets[0].entry == "application"
+
+
+def test_read_parametric_presets_reports_malformed_lines(tmp_path: Path) -> None:
+    path = tmp_path / "ofti.parametric"
+    path.write_text(
+        "  a  |  dict  |  entry  |  1 , ,2  \n"
+        "b | dict | entry\n"
+        "c: dict\n"
+        "d: dict entry\n"
+        "plain words\n"
+        "e:dict  entry   x,y\n",
+    )
+    presets, errors = read_parametric_presets(path)
+    assert [(p.name, p.dict_path, p.entry, p.values) for p in presets] == [
+        ("a", "dict", "entry", ["1", "2"]),
+        ("e", "dict", "entry", ["x", "y"]),
+    ]
+    assert errors == [
+        "Line 2: expected 4 fields separated by |",
+        "Line 3: expected '<dict> <entry> <values>'",
+        "Line 4: missing name, dict, entry, or values",
+        "Line 5: expected 'name | dict | entry | values'",
+    ]
+
+
+def test_read_parametric_presets_reuses_parse_until_file_changes(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    path = tmp_path / "ofti.parametric"
+    path.write_text("speed | system/controlDict | application | simpleFoam\n")
+    first, _ = read_parametric_presets(path)
+
+    parsed: list[str] = []
+    original = postprocessing._parse_parametric_preset_line
+
+    def _parse(raw: str, line_no: int):
+        parsed.append(raw)
+        return original(raw, line_no)
+
+    monkeypatch.setattr(postprocessing, "_parse_parametric_preset_line", _parse)
+    again, _ = read_parametric_presets(path)
+    assert again == first
+    assert again is not first
+    assert parsed == []
+
+    path.write_text("speed | system/controlDict | application | simpleFoam, pisoFoam\n")
+    updated, errors = read_parametric_presets(path)
+    assert not errors
+    assert updated[0].values == ["simpleFoam", "pisoFoam"]
+    assert len(parsed) == 1
+
+    path.unlink()
+    missing, errors = read_parametric_presets(path)
+    assert missing == []
+    assert errors and errors[0].startswith("Failed to read ofti.parametric")
+
+
+def test_read_parametric_parallel_header(tmp_path: Path) -> None:
+    path = tmp_path / "ofti.parametric"
+    path.write_text("# parallel: 4\nspeed | system/controlDict | application | simpleFoam\n")
+    presets, errors = read_parametric_presets(path)
+    assert not errors
+    assert [preset.name for preset in presets] == ["speed"]
+    assert postprocessing.read_parametric_parallel(path) == 4
+
+    path.write_text("# just a note\nspeed | system/controlDict | application | simpleFoam\n")
+    assert postprocessing.read_parametric_parallel(path) is None
+    assert postprocessing.read_parametric_parallel(tmp_path / "missing") is None
+
+
+def test_parametric_presets_path(tmp_path: Path) -> None:
+    assert postprocessing.parametric_presets_path(tmp_path) == tmp_path / "ofti.parametric"
@@ -2,6 +2,7 @@ from pathlib import Path
 
 from ofti.app.tool_screens import pipeline
 from ofti.core import pipeline as pipeline_service
+from ofti.tools.tool_catalog import tool_catalog
 
 
 def test_pipeline_catalog_includes_common_steps(tmp_path: Path) -> None:
@@ -16,6 +17,38 @@ def test_pipeline_catalog_includes_common_steps(tmp_path: Path) -> None:
     assert "setFields" in labels
 
 
+def test_tool_catalog_orders_base_presets_then_post(tmp_path: Path) -> None:
+    case_dir = tmp_path / "case"
+    case_dir.mkdir()
+    (case_dir / "ofti.tools").write_text("mine: echo hi\n")
+    (case_dir / "ofti.postprocessing").write_text("probe: postProcess -func probes\n")
+
+    labels = [name for name, _cmd in tool_catalog(case_dir)]
+
+    assert labels[0] == "blockMesh"
+    assert labels[-2:] == ["mine", "[post] probe"]
+
+
+def test_pipeline_catalog_reuses_cache_until_presets_change(
+    tmp_path: Path, monkeypatch,
+) -> None:
+    case_dir = tmp_path / "case"
+    case_dir.mkdir()
+    calls: list[Path] = []
+    monkeypatch.setattr(
+        pipeline, "tool_catalog", lambda path: calls.append(path) or [("blockMesh", ["blockMesh"])],
+    )
+
+    first = pipeline._pipeline_tool_catalog(case_dir)
+    second = pipeline._pipeline_tool_catalog(case_dir)
+    assert first == second
+    assert len(calls) == 1
+
+    (case_dir / "ofti.tools").write_text("mine: echo hi\n")
+    pipeline._pipeline_tool_catalog(case_dir)
+    assert len(calls) == 2
+
+
 def test_read_pipeline_commands_parses_lines(tmp_path: Path) -> None:
     path = tmp_path / "Allrun"
     path.write_text("#!/bin/bash\n# OFTI-PIPELINE\n\nblockMesh\n# comment\nsnappyHexMesh\n")
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import shlex
 from pathlib import Path
 
+import pytest
+
 from ofti.core import pipeline as pipeline_service
 
 
@@ -20,6 +23,65 @@ def test_pipeline_round_trip(tmp_path: Path) -> None:
     assert read_back == commands
 
 
+def test_pipeline_write_skips_unchanged_content(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / pipeline_service.PIPELINE_FILENAME
+    path.write_text("#!/usr/bin/env bash\n# OFTI-PIPELINE\n\nblockMesh\n")
+    writes: list[str] = []
+    original = pipeline_service._write_atomic
+    monkeypatch.setattr(
+        pipeline_service, "_write_atomic", lambda target, text: writes.append(text) or original(target, text),
+    )
+
+    pipeline_service.write_pipeline_file(path, [["blockMesh"]])
+    assert writes == []
+
+    pipeline_service.write_pipeline_file(path, [["blockMesh"], ["checkMesh"]])
+    assert writes == ["#!/usr/bin/env bash\n# OFTI-PIPELINE\n\nblockMesh\ncheckMesh\n"]
+
+
+def test_pipeline_write_replaces_file_and_keeps_mode(tmp_path: Path) -> None:
+    path = tmp_path / pipeline_service.PIPELINE_FILENAME
+    path.write_text("#!/bin/sh\n# OFTI-PIPELINE\n")
+    path.chmod(0o755)
+
+    pipeline_service.write_pipeline_file(path, [["blockMesh"]])
+
+    assert path.read_text() == "#!/bin/sh\n# OFTI-PIPELINE\n\nblockMesh\n"
+    assert path.stat().st_mode & 0o777 == 0o755
+    assert sorted(p.name for p in tmp_path.iterdir()) == [pipeline_service.PIPELINE_FILENAME]
+
+
+def test_pipeline_read_is_cached_until_file_changes(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / pipeline_service.PIPELINE_FILENAME
+    pipeline_service.write_pipeline_file(path, [["blockMesh"]])
+    opened: list[Path] = []
+    original_open = Path.open
+    monkeypatch.setattr(
+        Path, "open", lambda self, *a, **k: opened.append(self) or original_open(self, *a, **k),
+    )
+
+    commands, _errors = pipeline_service.read_pipeline_commands(path)
+    commands.append(["mutated"])
+    assert pipeline_service.read_pipeline_commands(path) == ([["blockMesh"]], [])
+    assert opened == []
+
+    path.write_text("#!/bin/bash\n# OFTI-PIPELINE\nsnappyHexMesh -overwrite\n")
+    opened.clear()
+    assert pipeline_service.read_pipeline_commands(path) == ([["snappyHexMesh", "-overwrite"]], [])
+    assert opened == [path]
+
+
+def test_pipeline_shebang_is_read_once_and_reused(tmp_path: Path) -> None:
+    path = tmp_path / pipeline_service.PIPELINE_FILENAME
+    assert pipeline_service.read_pipeline_shebang(path) == "#!/bin/bash"
+    path.write_text("#!/usr/bin/env bash\n# OFTI-PIPELINE\n")
+    shebang = pipeline_service.read_pipeline_shebang(path)
+
+    pipeline_service.write_pipeline_file(path, [["blockMesh"]], shebang=shebang)
+
+    assert path.read_text() == "#!/usr/bin/env bash\n# OFTI-PIPELINE\n\nblockMesh\n"
+
+
 def test_pipeline_missing_header(tmp_path: Path) -> None:
     path = tmp_path / pipeline_service.PIPELINE_FILENAME
     path.write_text("#!/bin/bash\necho hello\n")
@@ -30,6 +92,49 @@ def test_pipeline_missing_header(tmp_path: Path) -> None:
     assert errors
 
 
+def test_pipeline_reports_line_numbers_after_preamble(tmp_path: Path) -> None:
+    path = tmp_path / pipeline_service.PIPELINE_FILENAME
+    path.write_text("#!/bin/bash\nset -e\n# OFTI-PIPELINE\r\nblockMesh\necho 'open\n")
+
+    read_back, errors = pipeline_service.read_pipeline_commands(path)
+
+    assert read_back == [["blockMesh"]]
+    assert errors == ["Line 5: No closing quotation"]
+
+
+def test_split_command_line_matches_shlex() -> None:
+    for line in (
+        "blockMesh",
+        "  mpirun -np 4 simpleFoam -parallel\t",
+        "ofti:set system/controlDict endTime 1000",
+        "echo 'uniform (1 0 0)'",
+        'echo "a b" c\\ d',
+        "postProcess -func 'mag(U)'",
+    ):
+        assert pipeline_service.split_command_line(line) == shlex.split(line)
+
+
+def test_join_command_line_matches_shlex() -> None:
+    for parts in ([], ["blockMesh"], ["echo", "uniform (1 0 0)", "it's", ""]):
+        assert pipeline_service.join_command_line(parts) == shlex.join(parts)
+
+
+def test_join_command_line_is_cached(monkeypatch) -> None:
+    monkeypatch.setattr(pipeline_service, "_COMMAND_LINE_CACHE", {})
+    monkeypatch.setattr(pipeline_service, "_COMMAND_LINE_CACHE_SIZE", 2)
+    quoted: list[str] = []
+    original_quote = shlex.quote
+    monkeypatch.setattr(shlex, "quote", lambda part: quoted.append(part) or original_quote(part))
+
+    assert pipeline_service.join_command_line(["echo", "a b"]) == "echo 'a b'"
+    assert pipeline_service.join_command_line(("echo", "a b")) == "echo 'a b'"
+    assert quoted == ["echo", "a b"]
+
+    pipeline_service.join_command_line(["ls"])
+    pipeline_service.join_command_line(["pwd"])
+    assert list(pipeline_service._COMMAND_LINE_CACHE) == [("ls",), ("pwd",)]
+
+
 def test_pipeline_run_echo(tmp_path: Path) -> None:
     commands = [["echo", "hello"]]
     results = pipeline_service.run_pipeline_commands(tmp_path, commands)
@@ -37,3 +142,120 @@ def test_pipeline_run_echo(tmp_path: Path) -> None:
     assert results
     assert results[0].startswith("$ echo hello")
     assert any("status: OK" in line for line in results)
+
+
+def test_pipeline_run_reports_throttled_progress(tmp_path: Path, monkeypatch) -> None:
+    ticks = iter([0.0, 0.1, 0.3, 0.4, 1.0])
+    monkeypatch.setattr(pipeline_service.time, "monotonic", lambda: next(ticks))
+
+    def _fake_run(_cmd, *, on_stdout, **_kwargs) -> int:
+        for line in ("a\n", "b\n", "c\n", "d\n"):
+            on_stdout(line)
+        return 0
+
+    monkeypatch.setattr(pipeline_service, "run_trusted_streaming", _fake_run)
+    statuses: list[str] = []
+
+    results = pipeline_service.run_pipeline_commands(tmp_path, [["solver"]], status_cb=statuses.append)
+
+    assert statuses == ["Pipeline 1/1: solver", "Pipeline 1/1: solver (0s) b", "Pipeline 1/1: solver (1s) d"]
+    assert "a\nb\nc\nd" in results
+
+
+def test_tail_buffer_matches_stripped_tail() -> None:
+    buffer = pipeline_service.TailBuffer(max_lines=2)
+    for line in ["\n", "  first\n", "\n", "second\n", "third  \n", "\n", "  \n"]:
+        buffer.feed(line)
+
+    assert buffer.total == 4
+    assert buffer.render() == "... (2 lines omitted)\nsecond\nthird"
+    assert pipeline_service.TailBuffer().render() == "(empty)"
+
+
+def test_tail_text_keeps_last_lines() -> None:
+    text = "\r\n".join(f"line{i}" for i in range(50)) + "\n\n"
+
+    tail = pipeline_service.tail_text(text, max_lines=3)
+
+    assert tail == "... (47 lines omitted)\nline47\nline48\nline49"
+    assert pipeline_service.tail_text("a\nb", max_lines=3) == "a\nb"
+    assert pipeline_service.tail_text("  \n", max_lines=3) == "(empty)"
+
+
+def test_read_pipeline_commands_locates_header_variants(tmp_path: Path) -> None:
+    header = pipeline_service.PIPELINE_HEADER
+    path = tmp_path / "Allrun"
+    path.write_text(f"{header}-old\necho skipped\n{header}  \r\nblockMesh\nbad 'quote\n")
+
+    commands, errors = pipeline_service.read_pipeline_commands(path)
+
+    assert commands == [["blockMesh"]]
+    assert errors[0].startswith("Line 5:")
+
+    path.write_text(f"#!/bin/sh\n  {header}\nsimpleFoam\n")
+    assert pipeline_service.read_pipeline_commands(path) == ([["simpleFoam"]], [])
+
+    path.write_text(f"{header}-old\n")
+    assert pipeline_service.read_pipeline_commands(path) == ([], ["Missing # OFTI-PIPELINE header in Allrun."])
+
+    path.write_bytes(b"")
+    assert pipeline_service.read_pipeline_commands(path)[0] == []
+
+
+def test_tail_text_agrees_with_tail_buffer() -> None:
+    samples = ["", "one", "\n\n  a\n\n b \n\n", "x\r\ny\rz\n", "\n".join(str(i) for i in range(30))]
+    for text in samples:
+        for max_lines in (0, 1, 2, 20):
+            buffer = pipeline_service.TailBuffer(max_lines)
+            for line in text.replace("\r\n", "\n").replace("\r", "\n").splitlines(keepends=True):
+                buffer.feed(line)
+            assert pipeline_service.tail_text(text, max_lines) == buffer.render(), (text, max_lines)
+
+
+def test_run_pipeline_commands_keeps_last_report_lines(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(pipeline_service, "_REPORT_MAX_LINES", 5)
+    monkeypatch.setattr(pipeline_service, "apply_assignment_or_write", lambda *_a, **_k: True)
+    commands = [[pipeline_service.PIPELINE_SET_COMMAND, "f", f"k{i}", "v"] for i in range(3)]
+
+    results = pipeline_service.run_pipeline_commands(tmp_path, commands)
+
+    assert results == [
+        "... (4 earlier report lines omitted)",
+        "status: OK",
+        "",
+        "$ ofti:set f k2 v",
+        "status: OK",
+        "",
+    ]
+
+
+def test_run_pipeline_commands_stops_on_interrupt(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def _interrupted(_cmd: list[str], **kwargs: object) -> int:
+        kwargs["on_stdout"]("partial\n")
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(pipeline_service, "run_trusted_streaming", _interrupted)
+
+    results = pipeline_service.run_pipeline_commands(tmp_path, [["sleep", "9"], ["echo", "x"]])
+
+    assert results[:2] == ["$ sleep 9", "status: INTERRUPTED"]
+    assert "partial" in results
+    assert not any(line.startswith("$ echo") for line in results)
+
+
+def test_pipeline_parse_uses_first_header_and_cr_line_numbers(tmp_path: Path) -> None:
+    path = tmp_path / pipeline_service.PIPELINE_FILENAME
+    path.write_bytes(b"  # OFTI-PIPELINE  \recho hi\r\n# OFTI-PIPELINE\r\n")
+    assert pipeline_service.read_pipeline_commands(path) == ([["echo", "hi"]], [])
+
+    path.write_bytes(b"  # OFTI-PIPELINE\necho a\n# OFTI-PIPELINE\necho b\n")
+    assert pipeline_service.read_pipeline_commands(path)[0] == [["echo", "a"], ["echo", "b"]]
+
+    path.write_bytes(b"#!/bin/bash\r# OFTI-PIPELINE\r\recho 'a\r")
+    assert pipeline_service.read_pipeline_commands(path) == (
+        [], ["Line 4: No closing quotation"],
+    )
@@ -1,7 +1,14 @@
 from pathlib import Path
 
+import pytest
+
+from ofti.core import postprocessing
 from ofti.core.case import preferred_log_name
-from ofti.core.postprocessing import collect_postprocessing_files, postprocessing_summary
+from ofti.core.postprocessing import (
+    collect_postprocessing_files,
+    iter_postprocessing_files,
+    postprocessing_summary,
+)
 
 
 def test_postprocessing_summary_counts(tmp_path: Path) -> None:
@@ -12,9 +19,21 @@ def test_postprocessing_summary_counts(tmp_path: Path) -> None:
     (root / "forces" / "0.1" / "forces.dat").write_text("0 1\n")
 
     summary = postprocessing_summary(root)
-    joined = "\n".join(summary)
-    assert "probes: times=1 files=1" in joined
-    assert "forces: times=1 files=1" in joined
+    assert summary[4:] == ["forces: times=1 files=1", "probes: times=1 files=1"]
+
+
+def test_postprocessing_summary_counts_nested_files_and_top_level_times(tmp_path: Path) -> None:
+    root = tmp_path / "postProcessing"
+    nested = root / "sets" / "1e-3" / "lines" / "2"
+    nested.mkdir(parents=True)
+    (nested / "a.xy").write_text("0\n")
+    (root / "sets" / "1e-3" / "b.xy").write_text("0\n")
+    (root / "sets" / "notes").mkdir()
+    (root / "sets" / "README").write_text("x\n")
+
+    summary = postprocessing_summary(root)
+
+    assert "sets: times=1 files=3" in summary
 
 
 def test_collect_postprocessing_files(tmp_path: Path) -> None:
@@ -27,6 +46,20 @@ def test_collect_postprocessing_files(tmp_path: Path) -> None:
     assert files == [file_path]
 
 
+def test_iter_postprocessing_files_matches_sorted_rglob(tmp_path: Path) -> None:
+    root = tmp_path / "postProcessing"
+    for rel in ("b.txt", "b/c", "b/a/z", "a-1", "A", "b0/x"):
+        target = root / rel
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text("x\n")
+    (root / "empty").mkdir()
+
+    files = iter_postprocessing_files(root)
+
+    assert next(files) == root / "A"
+    assert [root / "A", *files] == sorted(p for p in root.rglob("*") if p.is_file())
+
+
 def test_preferred_log_file(tmp_path: Path) -> None:
     case_dir = tmp_path / "case"
     case_dir.mkdir()
@@ -51,3 +84,33 @@ def test_preferred_log_file(tmp_path: Path) -> None:
     log_path = case_dir / "log.simpleFoam"
     log_path.write_text("log")
     assert preferred_log_name(case_dir) == log_path.name
+
+
+def test_read_postprocessing_text_reuses_until_file_changes(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    path = tmp_path / "probe.dat"
+    path.write_text("0 1\n")
+    assert postprocessing.read_postprocessing_text(path) == "0 1\n"
+
+    reads: list[Path] = []
+    original = Path.read_text
+
+    def _read(self: Path, *args: object, **kwargs: object) -> str:
+        reads.append(self)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", _read)
+    assert postprocessing.read_postprocessing_text(path) == "0 1\n"
+    assert reads == []
+
+    path.write_text("0 1\n1 2\n")
+    assert postprocessing.read_postprocessing_text(path) == "0 1\n1 2\n"
+    assert reads == [path]
+
+    large = tmp_path / "large.dat"
+    large.write_text("0 1 2 3\n")
+    monkeypatch.setattr(postprocessing, "_TEXT_CACHE_MAX_BYTES", 4)
+    assert postprocessing.read_postprocessing_text(large) == "0 1 2 3\n"
+    assert str(large) not in postprocessing._TEXT_CACHE
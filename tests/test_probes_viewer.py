@@ -1,6 +1,24 @@
 from __future__ import annotations
 
-from ofti.app.tool_screens.logs_probes import _parse_probe_line, _parse_probe_series
+from pathlib import Path
+
+from ofti.app.tool_screens.logs_probes import (
+    _find_probe_files,
+    _parse_probe_line,
+    _parse_probe_series,
+)
+
+
+def test_find_probe_files_walks_tree_and_skips_positions(tmp_path: Path) -> None:
+    root = tmp_path / "probes"
+    (root / "0.5").mkdir(parents=True)
+    (root / "0").mkdir()
+    (root / "0.5" / "p").write_text("0 1\n")
+    (root / "0" / "U").write_text("0 (1 0 0)\n")
+    (root / "0" / "positions").write_text("(0 0 0)\n")
+
+    assert _find_probe_files(root) == [root / "0" / "U", root / "0.5" / "p"]
+    assert _find_probe_files(tmp_path / "missing") == []
 
 
 def test_parse_probe_series_scalar() -> None:
@@ -14,6 +32,19 @@ def test_parse_probe_series_scalar() -> None:
     assert count == 3
 
 
+def test_parse_probe_series_scalar_skips_malformed_rows() -> None:
+    text = """// header
+# Time p0 p1
+bad 1.0 2.0
+0.1
+0.2 7.0 nan-ish
+"""
+    times, values, count = _parse_probe_series(text)
+    assert times == [0.2]
+    assert values == [7.0]
+    assert count == 2
+
+
 def test_parse_probe_series_vector() -> None:
     text = """# t U0 U1
 0 (1 0 0) (0 2 0)
@@ -33,3 +64,9 @@ def test_parse_probe_line_vector_sample() -> None:
     assert time == 0.1
     assert round(values[0], 6) == 3.741657
     assert count == 1
+
+
+def test_parse_probe_line_handles_tabs_and_missing_values() -> None:
+    assert _parse_probe_line("0.2\t(3 4 0)\t(0 0 1)") == (0.2, [5.0, 1.0], 2)
+    assert _parse_probe_line("0.3") is None
+    assert _parse_probe_line("time 1 2") is None
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import sys
 import types
 from pathlib import Path
+from typing import Any
 
 import pytest
 
 from ofti.app.tool_screens import runner
+from ofti.core.tool_output import format_log_blob
 from ofti.foam.exceptions import QuitAppError
+from ofti.ui_curses.openfoam_env import _set_openfoam_bashrc
 
 
 class _Screen:
@@ -17,6 +21,9 @@ class _Screen:
     def clear(self) -> None:
         self.lines.clear()
 
+    def erase(self) -> None:
+        self.lines.clear()
+
     def addstr(self, *args: object) -> None:
         self.lines.append(str(args[-1]))
 
@@ -82,7 +89,10 @@ def test_runner_load_presets_parsing_and_read_errors(
         ),
     )
     assert runner._load_presets_from_path(cfg) == [("ok", ["echo", "1"])]
+    runner._load_presets_from_path(cfg)[0][1].append("mutated")
+    assert runner._load_presets_from_path(cfg) == [("ok", ["echo", "1"])]
 
+    cfg.write_text("ok: echo 2\n")
     orig_read_text = Path.read_text
 
     def _boom(
@@ -123,6 +133,46 @@ def test_run_simple_tool_prefers_runfunctions_then_bashrc(monkeypatch: pytest.Mo
     runner._run_simple_tool(screen, case, "checkMesh", ["checkMesh"])
     assert seen[-1] == "checkMesh"
 
+    bashrc = tmp_path / "OpenFOAM" / "etc" / "bashrc"
+    bashrc.parent.mkdir(parents=True)
+    bashrc.write_text("")
+    direct: list[list[str]] = []
+    monkeypatch.setenv("WM_PROJECT_DIR", str(tmp_path / "OpenFOAM"))
+    monkeypatch.setenv("WM_PROJECT_VERSION", "v2406")
+    monkeypatch.setattr("ofti.foam.openfoam_env.shutil.which", lambda name: f"/bin/{name}")
+    monkeypatch.setattr(runner, "resolve_openfoam_bashrc", lambda: bashrc)
+    monkeypatch.setattr(runner, "Viewer", lambda *_a: types.SimpleNamespace(display=lambda: None))
+    monkeypatch.setattr(
+        runner,
+        "run_trusted",
+        lambda cmd, **_k: direct.append(cmd) or types.SimpleNamespace(returncode=0, stdout="", stderr=""),
+    )
+    runner._run_simple_tool(screen, case, "checkMesh", ["checkMesh"])
+    assert direct == [["checkMesh"]]
+    assert len(seen) == 2
+
+
+def test_run_simple_tool_sources_bashrc_picked_but_not_loaded(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path,
+) -> None:
+    case = tmp_path / "case"
+    case.mkdir()
+    bashrc = tmp_path / "OpenFOAM" / "etc" / "bashrc"
+    bashrc.parent.mkdir(parents=True)
+    bashrc.write_text("")
+    monkeypatch.delenv("WM_PROJECT_VERSION", raising=False)
+    monkeypatch.setenv("WM_PROJECT_DIR", "")
+    monkeypatch.setenv("OFTI_BASHRC", "")
+    monkeypatch.setattr("ofti.ui_curses.openfoam_env.get_config", types.SimpleNamespace)
+    _set_openfoam_bashrc(bashrc)
+    seen: list[str] = []
+    monkeypatch.setattr(runner, "get_config", lambda: types.SimpleNamespace(use_runfunctions=False))
+    monkeypatch.setattr(runner, "resolve_openfoam_bashrc", lambda: bashrc)
+    monkeypatch.setattr(runner, "_run_shell_tool", lambda *_a, **_k: seen.append(str(_a[3])))
+    monkeypatch.setattr(runner, "run_trusted", lambda *_a, **_k: pytest.fail("exec'd directly"))
+    runner._run_simple_tool(_Screen(), case, "blockMesh", ["blockMesh"])
+    assert seen == ["blockMesh"]
+
 
 def test_run_simple_tool_direct_and_error(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     case = tmp_path / "case"
@@ -229,6 +279,7 @@ def test_run_tool_command_variants(monkeypatch: pytest.MonkeyPatch, tmp_path: Pa
     runner.run_tool_command(screen, case, "demo", ["echo", "1"], status="run")
     assert status_lines[-1] == "run"
     assert viewed
+    runner.flush_tool_logs()
     assert (case / "log.demo").is_file()
 
     captured = runner.run_tool_command_capture(screen, case, "demo", ["echo", "1"], status=None)
@@ -246,21 +297,144 @@ def test_write_tool_log_ignores_empty_and_errors(monkeypatch: pytest.MonkeyPatch
     case = tmp_path / "case"
     case.mkdir()
     runner._write_tool_log(case, "x", "", "")
+    runner.flush_tool_logs()
     assert not (case / "log.x").exists()
 
-    orig_write_text = Path.write_text
+    orig_open = runner.os.open
 
-    def _raise_on_log_y(
-        self: Path,
-        data: str,
-        encoding: str | None = None,
-        errors: str | None = None,
-        newline: str | None = None,
-    ) -> int:
-        if self.name == "log.y":
+    def _raise_on_log_y(path: Path, *args: Any, **kwargs: Any) -> Any:
+        if Path(path).name == "log.y":
             raise OSError("nope")
-        return orig_write_text(self, data, encoding=encoding, errors=errors, newline=newline)
+        return orig_open(path, *args, **kwargs)
 
-    monkeypatch.setattr(Path, "write_text", _raise_on_log_y)
+    monkeypatch.setattr(runner.os, "open", _raise_on_log_y)
     runner._write_tool_log(case, "y", "out", "err")
+    runner.flush_tool_logs()
     assert not (case / "log.y").exists()
+
+
+def test_write_tool_log_matches_log_blob_layout(tmp_path: Path) -> None:
+    runner._write_tool_log(tmp_path, "demo", "line 1\nline 2", "")
+    runner.flush_tool_logs()
+    expected = "\n".join(["tool: demo", "", format_log_blob("line 1\nline 2", ""), ""])
+    assert (tmp_path / "log.demo").read_text() == expected
+
+
+def test_write_tool_log_finishes_short_writes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    real_writev = runner.os.writev
+    monkeypatch.setattr(runner.os, "writev", lambda fd, bufs: real_writev(fd, [bufs[0][:3]]))
+    runner._write_tool_log(tmp_path, "demo", "out", "err")
+    runner.flush_tool_logs()
+    expected = "\n".join(["tool: demo", "", format_log_blob("out", "err"), ""])
+    assert (tmp_path / "log.demo").read_text() == expected
+
+
+def test_run_with_status_spins_until_worker_finishes(monkeypatch: pytest.MonkeyPatch) -> None:
+    status_lines: list[str] = []
+    release = runner.threading.Event()
+
+    def _status(_screen: object, text: str) -> None:
+        status_lines.append(text)
+        if len(status_lines) >= 3:
+            release.set()
+
+    def _work() -> int:
+        release.wait(5)
+        return 7
+
+    monkeypatch.setattr(runner, "status_message", _status)
+    monkeypatch.setattr(runner, "_STATUS_POLL_S", 0.01)
+
+    assert runner._run_with_status(_Screen(), "busy", _work) == 7
+    assert len(status_lines) >= 3
+    assert set(status_lines) == {"busy"}
+
+    def _fail() -> None:
+        raise ValueError("bad")
+
+    with pytest.raises(ValueError, match="bad"):
+        runner._run_with_status(_Screen(), "busy", _fail)
+    assert runner._run_with_status(_Screen(), None, lambda: "direct") == "direct"
+
+
+def test_run_with_status_esc_stops_worker_command(monkeypatch: pytest.MonkeyPatch) -> None:
+    class _KeyScreen(_Screen):
+        def timeout(self, _delay: int) -> None:
+            return None
+
+        def getch(self) -> int:
+            return self._keys.pop(0) if self._keys else -1
+
+    status_lines: list[str] = []
+    monkeypatch.setattr(runner, "status_message", lambda _s, text: status_lines.append(text))
+    monkeypatch.setattr(runner, "_STATUS_POLL_S", 0.05)
+    sleeper = [sys.executable, "-c", "import time; time.sleep(30)"]
+
+    result = runner._run_with_status(
+        _KeyScreen(keys=[-1, 27]), "busy", lambda: runner.run_trusted(sleeper),
+    )
+
+    assert result.returncode != 0
+    assert status_lines[0] == "busy"
+
+
+def test_cancel_requested_pushes_back_other_keys(monkeypatch: pytest.MonkeyPatch) -> None:
+    class _KeyScreen(_Screen):
+        def timeout(self, _delay: int) -> None:
+            return None
+
+        def getch(self) -> int:
+            return self._keys.pop(0) if self._keys else -1
+
+    pushed: list[int] = []
+    monkeypatch.setattr(runner.curses, "ungetch", pushed.append)
+    assert not runner._cancel_requested(_KeyScreen(keys=[ord("a"), ord("b")]))
+    assert pushed == [ord("b"), ord("a")]
+
+    pushed.clear()
+    assert runner._cancel_requested(_KeyScreen(keys=[ord("a"), 27]))
+    assert pushed == [ord("a")]
+
+
+def test_no_foam_mode_skips_tool_launches(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path,
+) -> None:
+    monkeypatch.delenv("PYTEST_CURRENT_TEST", raising=False)
+    monkeypatch.setenv("OFTI_NO_FOAM", "1")
+    messages: list[str] = []
+    monkeypatch.setattr(runner, "_show_message", lambda _s, text: messages.append(text))
+    monkeypatch.setattr(
+        runner, "run_trusted", lambda *_a, **_k: pytest.fail("no launch in limited mode"),
+    )
+
+    runner._run_simple_tool(_Screen(), tmp_path, "blockMesh", ["blockMesh"])
+    runner.run_tool_command(_Screen(), tmp_path, "checkMesh", ["checkMesh"])
+    assert runner.run_tool_command_capture(_Screen(), tmp_path, "x", ["x"]) is None
+
+    assert messages == [
+        "blockMesh skipped (OpenFOAM env not found)",
+        "checkMesh skipped (OpenFOAM env not found)",
+        "x skipped (OpenFOAM env not found)",
+    ]
+
+
+def test_write_tool_log_runs_off_the_calling_thread(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    writers: list[str] = []
+    original = runner._write_tool_log_now
+
+    def _record(*args: Any) -> None:
+        writers.append(runner.threading.current_thread().name)
+        original(*args)
+
+    monkeypatch.setattr(runner, "_write_tool_log_now", _record)
+    runner._write_tool_log(tmp_path, "first", "1", "")
+    runner._write_tool_log(tmp_path, "second", "2", "")
+    runner.flush_tool_logs()
+
+    assert len(writers) == 2
+    assert all(name.startswith("ofti-tool-log") for name in writers)
+    assert (tmp_path / "log.second").read_text().startswith("tool: second")
@@ -3,6 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 
 from ofti.app.tool_screens import runner
+from ofti.tools.tool_aliases import STATIC_TOOL_ALIAS_KEYS, STATIC_TOOL_ALIAS_NAMES
 
 
 def test_normalize_tool_name_strips_and_lowercases() -> None:
@@ -10,6 +11,11 @@ def test_normalize_tool_name_strips_and_lowercases() -> None:
     assert runner._normalize_tool_name("post:Process") == "post:process"
 
 
+def test_static_alias_keys_are_normalized_once() -> None:
+    assert {runner._normalize_tool_name(name) for name in STATIC_TOOL_ALIAS_NAMES} == STATIC_TOOL_ALIAS_KEYS
+    assert "cli-tools" in STATIC_TOOL_ALIAS_KEYS
+
+
 def test_list_tool_commands_includes_basics(tmp_path: Path) -> None:
     case_dir = tmp_path / "case"
     case_dir.mkdir()
@@ -14,3 +14,14 @@ def test_sampling_options_enabled(tmp_path: Path) -> None:
     sample_opt = next(opt for opt in options if "sample" in opt.label)
     assert topo_opt.enabled is True
     assert sample_opt.enabled is False
+
+
+def test_sampling_options_ignore_directories_and_missing_system(tmp_path: Path) -> None:
+    case_dir = tmp_path / "case"
+    assert not any(opt.enabled for opt in sampling_options(case_dir))
+
+    (case_dir / "system" / "sampleDict").mkdir(parents=True)
+    (case_dir / "system" / "distributionDict").write_text("FoamFile {}")
+
+    enabled = {opt.required_path.name: opt.enabled for opt in sampling_options(case_dir)}
+    assert enabled == {"topoSetDict": False, "sampleDict": False, "distributionDict": True}
@@ -1,8 +1,12 @@
-from unittest import mock
+import subprocess
+import sys
+import threading
+import time
 
 import pytest
 
-from ofti.foam.subprocess_utils import resolve_executable, run_trusted
+from ofti.foam import subprocess_utils
+from ofti.foam.subprocess_utils import resolve_executable, run_trusted, run_trusted_streaming
 
 
 def test_resolve_executable_passes_absolute_path() -> None:
@@ -20,15 +24,125 @@ def test_resolve_executable_missing(monkeypatch) -> None:
         resolve_executable("missing")
 
 
-def test_run_trusted_executes(monkeypatch) -> None:
-    _ = monkeypatch
-    completed = mock.Mock()
-    completed.returncode = 0
-    completed.stdout = "ok"
-    completed.stderr = ""
+def test_run_trusted_executes(tmp_path) -> None:
+    script = "import sys; print(sys.stdin.read().upper()); print('warn', file=sys.stderr)"
 
-    with mock.patch("ofti.foam.subprocess_utils.subprocess.run", return_value=completed) as run:
-        result = run_trusted(["echo", "hi"])
+    result = run_trusted([sys.executable, "-c", script], cwd=tmp_path, stdin="hi")
 
-    assert result is completed
-    assert run.called
+    assert result.returncode == 0
+    assert result.stdout == "HI\n"
+    assert result.stderr == "warn\n"
+    with pytest.raises(subprocess.CalledProcessError):
+        run_trusted([sys.executable, "-c", "raise SystemExit(2)"], check=True)
+
+
+def test_stop_thread_children_terminates_worker_command() -> None:
+    codes: list[int] = []
+    worker = threading.Thread(
+        target=lambda: codes.append(
+            run_trusted([sys.executable, "-c", "import time; time.sleep(30)"]).returncode,
+        ),
+    )
+    worker.start()
+    deadline = time.monotonic() + 5
+    while worker.ident not in subprocess_utils._CHILDREN and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    subprocess_utils.stop_thread_children(worker.ident, grace_s=1)
+    worker.join(5)
+
+    assert codes and codes[0] != 0
+    assert worker.ident not in subprocess_utils._CHILDREN
+
+
+def test_run_trusted_streaming_feeds_both_streams(tmp_path) -> None:
+    out: list[str] = []
+    err: list[str] = []
+    script = "import sys; print('a'); print('b'); print('oops', file=sys.stderr); sys.exit(3)"
+
+    code = run_trusted_streaming(
+        [sys.executable, "-c", script], cwd=tmp_path, on_stdout=out.append, on_stderr=err.append,
+    )
+
+    assert code == 3
+    assert out == ["a\n", "b\n"]
+    assert err == ["oops\n"]
+
+
+def test_run_trusted_streaming_requires_command() -> None:
+    with pytest.raises(ValueError, match="No command"):
+        run_trusted_streaming([], on_stdout=print, on_stderr=print)
+
+
+def test_run_trusted_streaming_terminates_child_when_callback_fails() -> None:
+    script = "import time; print('start', flush=True); time.sleep(30)"
+
+    def _stop(_line: str) -> None:
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        run_trusted_streaming([sys.executable, "-c", script], on_stdout=_stop, on_stderr=print)
+
+
+def test_run_trusted_streaming_kills_child_ignoring_sigterm(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(subprocess_utils, "_STOP_GRACE_S", 0.2)
+    script = (
+        "import signal, sys, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); "
+        "print('up', flush=True); time.sleep(30)"
+    )
+
+    def _stop(_line: str) -> None:
+        raise KeyboardInterrupt
+
+    started = time.monotonic()
+    with pytest.raises(KeyboardInterrupt):
+        run_trusted_streaming(
+            [sys.executable, "-c", script], cwd=tmp_path, on_stdout=_stop, on_stderr=print,
+        )
+    assert time.monotonic() - started < 10
+
+
+def test_line_feed_matches_text_mode_reads() -> None:
+    lines: list[str] = []
+    feed = subprocess_utils._LineFeed(lines.append)
+    data = "a\r\nb\rcé\nlast".encode()
+    for idx in range(len(data)):
+        feed.feed(data[idx:idx + 1])
+    feed.feed(b"", final=True)
+
+    assert lines == ["a\n", "b\n", "cé\n", "last"]
+
+
+def test_line_feed_joins_long_line_split_across_chunks() -> None:
+    lines: list[str] = []
+    feed = subprocess_utils._LineFeed(lines.append)
+    for chunk in (b"x" * 4, b"y" * 4, b"z\nnext\nta", b"il"):
+        feed.feed(chunk)
+    assert lines == ["xxxxyyyyz\n", "next\n"]
+    feed.feed(b"", final=True)
+
+    assert lines[-1] == "tail"
+
+
+def test_shell_env_drops_startup_file_hooks(monkeypatch) -> None:
+    monkeypatch.setenv("BASH_ENV", "hook.sh")
+    monkeypatch.setenv("ENV", "hook.sh")
+    monkeypatch.setenv("OFTI_KEEP", "1")
+
+    env = subprocess_utils.shell_env()
+
+    assert "BASH_ENV" not in env
+    assert "ENV" not in env
+    assert env["OFTI_KEEP"] == "1"
+
+
+def test_run_trusted_capture_matches_text_pipes(tmp_path) -> None:
+    script = "import sys; sys.stdout.write('a\\r\\nb\\rc'); sys.stdout.flush(); sys.stderr.write('e')"
+
+    result = run_trusted([sys.executable, "-c", script], cwd=tmp_path)
+    raw = run_trusted([sys.executable, "-c", script], cwd=tmp_path, text=False)
+    quiet = run_trusted([sys.executable, "-c", "print('x')"], capture_output=False)
+
+    assert (result.stdout, result.stderr) == ("a\nb\nc", "e")
+    assert (raw.stdout, raw.stderr) == (b"a\r\nb\rc", b"e")
+    assert (quiet.stdout, quiet.stderr) == (None, None)
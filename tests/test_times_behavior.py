@@ -19,3 +19,14 @@ def test_latest_time_is_filesystem_only(tmp_path: Path) -> None:
         (tmp_path / name).mkdir()
 
     assert times.latest_time(tmp_path) == "3.5"
+
+
+def test_is_time_name_matches_numeric_directory_names(tmp_path: Path) -> None:
+    for name in ("0", "1e-3", ".5", "+2", "-1.5E+2"):
+        assert times.is_time_name(name), name
+    for name in ("", "system", "1.2.3", "inf", "nan", "1_000", " 1", "e5"):
+        assert not times.is_time_name(name), name
+
+    (tmp_path / "1e-3").mkdir()
+    (tmp_path / "4").write_text("not a directory\n")
+    assert [d.name for d in times.time_directories(tmp_path)] == ["1e-3"]
@@ -6,7 +6,7 @@ from typing import Any, cast
 
 import pytest
 
-from ofti.app.tool_screens import diagnostics, postprocessing, shell_tools, solver
+from ofti.app.tool_screens import diagnostics, parametric, postprocessing, shell_tools, solver
 
 
 class _Screen:
@@ -20,6 +20,9 @@ class _Screen:
     def clear(self) -> None:
         self.lines.clear()
 
+    def erase(self) -> None:
+        self.lines.clear()
+
     def addstr(self, *args: object) -> None:
         self.lines.append(str(args[-1]))
 
@@ -77,13 +80,13 @@ def test_postprocessing_browser_and_presets_branches(
 
     root = case / "postProcessing"
     root.mkdir()
-    monkeypatch.setattr(postprocessing.postprocessing_core, "collect_postprocessing_files", lambda _root: [])
+    monkeypatch.setattr(postprocessing.postprocessing_core, "iter_postprocessing_files", lambda _root: iter([]))
     postprocessing.postprocessing_browser_screen(screen, case)
     assert "No postProcessing files found." in shown[-1]
 
     sample = root / "probe.dat"
     sample.write_text("1 2 3\n")
-    monkeypatch.setattr(postprocessing.postprocessing_core, "collect_postprocessing_files", lambda _root: [sample])
+    monkeypatch.setattr(postprocessing.postprocessing_core, "iter_postprocessing_files", lambda _root: iter([sample]))
     monkeypatch.setattr(postprocessing, "build_menu", lambda *_a, **_k: _Menu(0))
 
     class _Viewer:
@@ -104,13 +107,58 @@ def test_postprocessing_browser_and_presets_branches(
     assert "Failed to read probe.dat" in shown[-1]
 
     monkeypatch.setattr(postprocessing, "build_menu", lambda *_a, **_k: _Menu(2))
-    monkeypatch.setattr(postprocessing.postprocessing_core, "collect_postprocessing_files", lambda _root: [sample])
+    monkeypatch.setattr(postprocessing.postprocessing_core, "iter_postprocessing_files", lambda _root: iter([sample]))
     postprocessing.postprocessing_browser_screen(screen, case)
 
-    monkeypatch.setattr(postprocessing, "prompt_line", lambda *_a, **_k: None)
+    monkeypatch.setattr(parametric, "prompt_line", lambda *_a, **_k: None)
     assert postprocessing._prompt_line(screen, "x") == ""
 
 
+def test_postprocessing_browser_caps_listed_files(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path,
+) -> None:
+    case = tmp_path / "case"
+    root = case / "postProcessing"
+    root.mkdir(parents=True)
+    files = [root / f"{idx}.dat" for idx in range(3)]
+    pulled: list[Path] = []
+
+    def _iter(_root: Path):
+        for path in files:
+            pulled.append(path)
+            yield path
+
+    menus: list[tuple[str, list[str]]] = []
+
+    def _build_menu(_s: object, title: str, labels: list[str], **_k: object) -> _Menu:
+        menus.append((title, labels))
+        return _Menu(-1)
+
+    monkeypatch.setattr(postprocessing, "_BROWSER_MAX_FILES", 1)
+    monkeypatch.setattr(postprocessing.postprocessing_core, "iter_postprocessing_files", _iter)
+    monkeypatch.setattr(postprocessing, "build_menu", _build_menu)
+    postprocessing.postprocessing_browser_screen(_Screen(), case)
+
+    assert menus == [
+        ("PostProcessing browser (first 1 files)", ["Summary", "postProcessing/0.dat", "Back"]),
+    ]
+    assert pulled == files[:2]
+
+
+def test_postprocessing_browser_labels_match_relative_paths(tmp_path: Path) -> None:
+    case = tmp_path / "case"
+    root = case / "postProcessing"
+    (root / "probes" / "0").mkdir(parents=True)
+    (root / "probes" / "0" / "p.dat").write_text("1\n")
+    (root / "a.dat").write_text("1\n")
+    files = [*postprocessing.postprocessing_core.iter_postprocessing_files(root), case / "other.dat"]
+
+    labels = postprocessing._browser_labels(case, root, files)
+
+    assert labels == [p.relative_to(case).as_posix() for p in files]
+    assert labels[:2] == ["postProcessing/a.dat", "postProcessing/probes/0/p.dat"]
+
+
 def test_postprocessing_sampling_and_parametric_error_paths(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
@@ -147,6 +195,7 @@ def test_postprocessing_sampling_and_parametric_error_paths(
             return None
 
     monkeypatch.setattr(postprocessing, "Viewer", _Viewer)
+    monkeypatch.setattr(parametric, "Viewer", _Viewer)
     monkeypatch.setattr(postprocessing.postprocessing_core, "read_parametric_presets", lambda _p: ([], ["bad line"]))
     postprocessing.parametric_presets_screen(screen, case)
     assert "PARAMETRIC PRESET ERRORS" in viewed[-1]
@@ -161,13 +210,13 @@ def test_postprocessing_sampling_and_parametric_error_paths(
     postprocessing.parametric_presets_screen(screen, case)
 
     monkeypatch.setattr(postprocessing, "build_menu", lambda *_a, **_k: _Menu(0))
-    monkeypatch.setattr(postprocessing, "prompt_line", lambda *_a, **_k: "y")
+    monkeypatch.setattr(parametric, "prompt_line", lambda *_a, **_k: "y")
     monkeypatch.setattr(postprocessing, "build_parametric_cases", lambda *_a, **_k: (_ for _ in ()).throw(ValueError("bad preset")))
     postprocessing.parametric_presets_screen(screen, case)
     assert "Parametric setup failed: bad preset" in shown[-1]
 
     monkeypatch.setattr(postprocessing, "build_parametric_cases", lambda *_a, **_k: [case])
-    monkeypatch.setattr(postprocessing, "run_cases", lambda *_a, **_k: [])
+    monkeypatch.setattr(parametric, "run_cases", lambda *_a, **_k: [])
     postprocessing.parametric_presets_screen(screen, case)
     assert "All cases completed." in viewed[-1]
 
@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+import time
 import types
 from pathlib import Path
+from typing import Any
 
 import pytest
 
-from ofti.app.tool_screens import job_control, logs_select, mesh_utils, pipeline
+from ofti.app.tool_screens import (
+    job_control,
+    logs_select,
+    logs_view,
+    mesh_utils,
+    pipeline,
+    runner,
+)
 from ofti.ui_curses import prompts as input_prompts
 
 
@@ -28,6 +37,9 @@ class _Screen:
     def addstr(self, *args: object) -> None:
         self.lines.append(str(args[-1]))
 
+    def addnstr(self, _y: int, _x: int, text: str, limit: int) -> None:
+        self.lines.append(text[:limit])
+
     def refresh(self) -> None:
         return None
 
@@ -131,6 +143,89 @@ def test_mesh_utils_branches(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) ->
     assert "log.cartesianMesh not found." in messages[-1]
 
 
+def test_transform_points_status_quotes_arguments(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    statuses: list[str] = []
+    monkeypatch.setattr(
+        mesh_utils,
+        "run_tool_command",
+        lambda *_a, **kwargs: statuses.append(kwargs["status"]),
+    )
+    monkeypatch.setattr(mesh_utils, "build_menu", lambda *_a, **_k: _Menu(2))
+    monkeypatch.setattr(mesh_utils, "prompt_line", lambda *_a, **_k: "(2 2 1)")
+    mesh_utils.transform_points_screen(_Screen(), tmp_path)
+    assert statuses == ["Running transformPoints -scale '(2 2 1)'..."]
+
+
+def test_cfmesh_log_view_and_tail(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    screen = _Screen()
+    case = tmp_path / "case"
+    (case / "system").mkdir(parents=True)
+    (case / "system" / "cfMeshDict").write_text("ok\n")
+    monkeypatch.setattr(mesh_utils, "build_menu", lambda *_a, **_k: _Menu(1))
+
+    viewed: list[str] = []
+    monkeypatch.setattr(mesh_utils.Viewer, "display", lambda self: viewed.append(self.content))
+    monkeypatch.setattr(logs_view, "_LOG_VIEW_MAX_BYTES", 16)
+    (case / "log.cartesianMesh").write_text("early output\n" * 10 + "final line\n")
+    mesh_utils.cfmesh_screen(screen, case)
+    assert viewed[-1].startswith("[large log: showing last 16 bytes")
+    assert viewed[-1].endswith("final line\n")
+    assert "early output\nearly output" not in viewed[-1]
+
+    tailed: list[Path] = []
+    monkeypatch.setattr(mesh_utils, "tail_log_file", lambda _s, path: tailed.append(path))
+    monkeypatch.setattr(mesh_utils, "build_menu", lambda *_a, **_k: _Menu(2))
+    mesh_utils.cfmesh_screen(screen, case)
+    assert tailed == [case / "log.cartesianMesh"]
+
+    messages: list[str] = []
+    monkeypatch.setattr(mesh_utils, "_show_message", lambda _s, text: messages.append(text))
+    (case / "log.cartesianMesh").unlink()
+    mesh_utils.cfmesh_screen(screen, case)
+    assert messages == ["log.cartesianMesh not found."]
+    assert tailed == [case / "log.cartesianMesh"]
+
+
+def test_cfmesh_run_starts_in_background_and_tails_log(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path,
+) -> None:
+    case = tmp_path / "case"
+    (case / "system").mkdir(parents=True)
+    (case / "system" / "cfMeshDict").write_text("ok\n")
+    monkeypatch.setattr(mesh_utils, "build_menu", lambda *_a, **_k: _Menu(0))
+    started: list[tuple[str, list[str]]] = []
+    tailed: list[Path] = []
+    monkeypatch.setattr(
+        mesh_utils.job_control,
+        "start_tool_background",
+        lambda _s, _case, name, cmd: started.append((name, cmd)) or True,
+    )
+    monkeypatch.setattr(mesh_utils, "tail_log_file", lambda _s, path: tailed.append(path))
+    mesh_utils.cfmesh_screen(_Screen(), case)
+    assert started == [("cartesianMesh", ["cartesianMesh"])]
+    assert tailed == [case / "log.cartesianMesh"]
+
+    monkeypatch.setattr(mesh_utils.job_control, "start_tool_background", lambda *_a: False)
+    mesh_utils.cfmesh_screen(_Screen(), case)
+    assert tailed == [case / "log.cartesianMesh"]
+
+
+def test_log_readers_wait_for_pending_tool_logs(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path,
+) -> None:
+    real_write = runner._write_tool_log_now
+
+    def _slow_write(*args: Any) -> None:
+        time.sleep(0.05)
+        real_write(*args)
+
+    monkeypatch.setattr(runner, "_write_tool_log_now", _slow_write)
+    runner._write_tool_log(tmp_path, "demo", "out", "err")
+    assert logs_select._list_logs(tmp_path) == [tmp_path / "log.demo"]
+    runner._write_tool_log(tmp_path, "demo", "second", "")
+    assert "second" in logs_view._read_log_view_text(tmp_path / "log.demo")
+
+
 def test_pipeline_pick_tool_and_runner(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     case = tmp_path / "case"
     case.mkdir()
@@ -219,7 +314,7 @@ def test_pipeline_editor_and_runner_paths(monkeypatch: pytest.MonkeyPatch, tmp_p
     monkeypatch.setattr(
         pipeline.pipeline_service,
         "write_pipeline_file",
-        lambda p, commands: writes.append((p, commands)),
+        lambda p, commands, **_k: writes.append((p, commands)),
     )
     pipeline.pipeline_editor_screen(_Screen(keys=[ord("c"), ord("h")]), missing_case)
     assert writes
@@ -1,6 +1,5 @@
 import curses
 from pathlib import Path
-from unittest import mock
 
 from ofti.app.tool_screens.diagnostics import dictionary_compare_screen
 from ofti.app.tool_screens.pipeline import PIPELINE_HEADER, pipeline_runner_screen
@@ -68,17 +67,16 @@ def test_pipeline_runner_screen_runs_commands(tmp_path: Path, monkeypatch) -> No
     pipeline.write_text("\n".join(["#!/bin/bash", PIPELINE_HEADER, "echo hello"]))
 
     screen = FakeScreen(keys=[ord("h")])
-    completed = mock.Mock(returncode=0, stdout="ok\n", stderr="")
-
     seen = {}
 
     def fake_run(*_args, **kwargs):
         seen.update(kwargs)
-        return completed
+        kwargs["on_stdout"]("ok\n")
+        return 0
 
-    monkeypatch.setattr("ofti.core.pipeline.run_trusted", fake_run)
+    monkeypatch.setattr("ofti.core.pipeline.run_trusted_streaming", fake_run)
     pipeline_runner_screen(screen, case_dir)
-    assert seen.get("stdin") == ""
+    assert seen.get("cwd") == case_dir
 
 
 def test_dictionary_compare_screen(monkeypatch, tmp_path: Path) -> None:
@@ -22,6 +22,9 @@ class _Screen:
     def clear(self) -> None:
         self.lines.clear()
 
+    def erase(self) -> None:
+        self.lines.clear()
+
     def addstr(self, *args: Any) -> None:
         self.lines.append(str(args[-1]))
 
@@ -313,8 +316,8 @@ def test_postprocessing_browser_sampling_and_presets(
     monkeypatch.setattr(postprocessing, "build_menu", _menu_sequence([0]))
     monkeypatch.setattr(
         postprocessing.postprocessing_core,
-        "collect_postprocessing_files",
-        lambda *_a, **_k: [output],
+        "iter_postprocessing_files",
+        lambda *_a, **_k: iter([output]),
     )
     monkeypatch.setattr(
         postprocessing.postprocessing_core,
@@ -355,9 +358,10 @@ def test_postprocessing_browser_sampling_and_presets(
         lambda *_a, **_k: ([SimpleNamespace(name="demo", dict_path="system/controlDict", entry="application", values=["simpleFoam"])], []),
     )
     monkeypatch.setattr(postprocessing, "build_menu", _menu_sequence([0]))
-    monkeypatch.setattr(postprocessing, "_prompt_line", lambda *_a, **_k: "y")
+    # Shared by the y/N and parallelism prompts; "y" is not a count, so the default stays.
+    monkeypatch.setattr(parametric_tools, "prompt_line", lambda *_a, **_k: "y")
     monkeypatch.setattr(postprocessing, "build_parametric_cases", lambda *_a, **_k: [case / "case_1"])
-    monkeypatch.setattr(postprocessing, "run_cases", lambda *_a, **_k: [case / "case_1"])
+    monkeypatch.setattr(parametric_tools, "run_cases", lambda *_a, **_k: [case / "case_1"])
     postprocessing.parametric_presets_screen(_Screen(), case)
     assert "Failures" in shown[-1]
 
@@ -499,3 +503,161 @@ def test_parametric_csv_and_grid_flows(
     monkeypatch.setattr(parametric_tools, "run_cases", lambda *_a, **_k: [])
     parametric_tools.foamlib_parametric_study_screen(_Screen(), case)
     assert "All cases completed." in shown[-1]
+
+
+def test_parametric_runs_multiple_cases_concurrently(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    created = [tmp_path / "a", tmp_path / "b", tmp_path / "c"]
+    calls: list[dict[str, Any]] = []
+
+    def _run_cases_async(paths: list[Path], **kwargs: Any) -> list[Path]:
+        calls.append({"paths": paths, **kwargs})
+        return [paths[1]]
+
+    monkeypatch.setattr(parametric_tools, "async_available", lambda: True)
+    monkeypatch.setattr(parametric_tools, "run_cases_async", _run_cases_async)
+    monkeypatch.setattr(parametric_tools.os, "cpu_count", lambda: 2)
+    monkeypatch.setattr(
+        parametric_tools,
+        "run_cases",
+        lambda *_a, **_k: pytest.fail("sequential runner should not be used"),
+    )
+
+    statuses: list[str] = []
+    monkeypatch.setattr(parametric_tools, "status_message", lambda _s, text: statuses.append(text))
+
+    assert parametric_tools._run_created_cases(_Screen(), created) == [tmp_path / "b"]
+    on_done = calls[-1].pop("on_case_done")
+    assert calls == [{"paths": created, "check": False, "max_parallel": 2}]
+    on_done(created[0], True)
+    on_done(created[1], False)
+    assert statuses == [
+        "Running 3 cases (2 at a time)...",
+        "Completed 1/3 cases...",
+        "Completed 2/3 cases (1 failed)...",
+    ]
+
+    parametric_tools._run_created_cases(_Screen(), created, max_parallel=1)
+    assert calls[-1]["max_parallel"] == 1
+
+    monkeypatch.setattr(parametric_tools, "run_cases", lambda *_a, **_k: [])
+    assert parametric_tools._run_created_cases(_Screen(), created[:1]) == []
+
+
+def test_parametric_default_parallel_shares_cpus_with_decomposed_cases(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(parametric_tools.os, "cpu_count", lambda: 8)
+    assert parametric_tools._default_case_parallel(tmp_path) == 8
+
+    decompose = tmp_path / "system" / "decomposeParDict"
+    decompose.parent.mkdir()
+    decompose.write_text("numberOfSubdomains 4;\n")
+    monkeypatch.setattr(parametric_tools, "read_number_of_subdomains", lambda _p: 4)
+    assert parametric_tools._default_case_parallel(tmp_path) == 2
+
+    monkeypatch.setattr(parametric_tools, "read_number_of_subdomains", lambda _p: 16)
+    assert parametric_tools._default_case_parallel(tmp_path) == 1
+
+    monkeypatch.setattr(parametric_tools, "read_number_of_subdomains", lambda _p: None)
+    assert parametric_tools._default_case_parallel(tmp_path) == 8
+
+
+def test_prompt_parallel_parses_positive_counts(monkeypatch: pytest.MonkeyPatch) -> None:
+    prompts: list[str] = []
+    answers = iter(["3", "", "0", "x"])
+
+    def _prompt(_stdscr: object, text: str) -> str:
+        prompts.append(text)
+        return next(answers)
+
+    monkeypatch.setattr(parametric_tools, "_prompt_line", _prompt)
+    monkeypatch.setattr(parametric_tools, "_default_case_parallel", lambda _p: 6)
+    assert parametric_tools._prompt_parallel(_Screen(), Path("case"), None) == 3
+    assert parametric_tools._prompt_parallel(_Screen(), Path("case"), 4) == 4
+    assert parametric_tools._prompt_parallel(_Screen(), Path("case"), None) is None
+    assert parametric_tools._prompt_parallel(_Screen(), Path("case"), 2) == 2
+    assert prompts[:2] == ["Cases to run at a time [6]: ", "Cases to run at a time [4]: "]
+
+
+def test_parametric_form_updates_only_changed_labels(monkeypatch: pytest.MonkeyPatch) -> None:
+    seen: list[list[str]] = []
+    built: list[object] = []
+    choices = iter([3, 2, 4])
+
+    class _FormMenu:
+        def __init__(self, options: list[str]) -> None:
+            self.options = options
+
+        def navigate(self) -> int:
+            seen.append(list(self.options))
+            return next(choices)
+
+    def _build_menu(_stdscr: object, _title: str, options: list[str], **_kwargs: object):
+        built.append(options)
+        return _FormMenu(options)
+
+    monkeypatch.setattr(parametric_tools, "build_menu", _build_menu)
+    monkeypatch.setattr(parametric_tools, "_prompt_line", lambda *_a: "simpleFoam, pisoFoam")
+
+    result = parametric_tools._parametric_form(
+        _Screen(), "system/controlDict", "application", [], False,
+    )
+
+    assert result == ("system/controlDict", "application", ["simpleFoam", "pisoFoam"], True)
+    assert seen[0][2:4] == ["Sweep values: <none>", "Run solver: no"]
+    assert seen[1][2:4] == ["Sweep values: <none>", "Run solver: yes"]
+    assert seen[2][2] == "Sweep values: simpleFoam, pisoFoam"
+    assert len(built) == 1
+    assert parametric_tools._parametric_form_hint(5) == "Return without changes"
+    assert parametric_tools._parametric_form_hint(9) == ""
+    assert parametric_tools._parametric_csv_hint(0) == "CSV path relative to case root."
+    assert parametric_tools._parametric_csv_hint(-1) == ""
+
+
+def test_parametric_split_values_matches_strip_semantics() -> None:
+    samples = ["", " , ,", "a", " a ,b,, c d ,\te\t", "1e-3,2e-3 ,  x\n"]
+    for raw in samples:
+        expected = [item.strip() for item in raw.split(",") if item.strip()]
+        assert parametric_tools._split_values(raw) == expected
+
+
+def test_parametric_form_option_labels() -> None:
+    labels = [
+        parametric_tools._parametric_form_option(idx, "", "", [], True)
+        for idx in range(len(parametric_tools._PARAMETRIC_FORM_OPTIONS))
+    ]
+    assert labels == [
+        "Dictionary file: system/controlDict",
+        "Entry key: <required>",
+        "Sweep values: <none>",
+        "Run solver: yes",
+        "Create cases",
+        "Back",
+    ]
+
+
+def test_parametric_mode_skips_menu_for_single_preset(monkeypatch: pytest.MonkeyPatch) -> None:
+    preset = SimpleNamespace(name="demo", dict_path="system/controlDict", entry="application", values=["a"])
+    monkeypatch.setattr(
+        parametric_tools,
+        "build_menu",
+        lambda *_a, **_k: pytest.fail("menu should be skipped"),
+    )
+    assert parametric_tools._select_parametric_mode(
+        _Screen(), [preset], preprocessing_ready=False,
+    ) == ("single", preset)
+    assert parametric_tools._select_parametric_mode(
+        _Screen(), [], preprocessing_ready=False,
+    ) == ("single", None)
+
+    monkeypatch.setattr(parametric_tools, "build_menu", lambda *_a, **_k: _OneChoiceMenu(1))
+    assert parametric_tools._select_parametric_mode(
+        _Screen(), [preset, preset], preprocessing_ready=False,
+    ) == ("single", preset)
+    assert parametric_tools._select_parametric_mode(
+        _Screen(), [preset], preprocessing_ready=True,
+    ) == ("single", None)
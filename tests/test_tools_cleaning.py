@@ -18,6 +18,9 @@ class FakeScreen:
     def clear(self) -> None:
         self.lines.clear()
 
+    def erase(self) -> None:
+        self.lines.clear()
+
     def addstr(self, *args) -> None:
         self.lines.append(str(args[-1]))
 
@@ -4,6 +4,8 @@ import types
 from pathlib import Path
 from unittest import mock
 
+import pytest
+
 from ofti.app.tool_screens import menus
 from ofti.app.tool_screens.cleaning_ops import clean_time_directories, remove_all_logs
 from ofti.app.tool_screens.diagnostics import diagnostics_screen
@@ -34,6 +36,9 @@ class FakeScreen:
         text = args[-1]
         self.lines.append(str(text))
 
+    def addnstr(self, _y, _x, text, limit):
+        self.lines.append(str(text)[:limit])
+
     def move(self, y, x):
         # Cursor movement is ignored in tests.
         pass
@@ -279,6 +284,28 @@ def test_run_tool_by_name_cli_group_aliases(tmp_path: Path) -> None:
     run_screen.assert_called_once_with(screen, case_dir)
 
 
+def test_run_tool_by_name_static_alias_background_is_rejected(tmp_path: Path) -> None:
+    case_dir = tmp_path / "case"
+    case_dir.mkdir()
+    screen = FakeScreen(keys=[ord("h")])
+
+    with mock.patch("ofti.app.tool_screens.menus._show_message") as show_message:
+        assert run_tool_by_name(screen, case_dir, "knife", background=True) is True
+
+    show_message.assert_called_once_with(screen, "knife cannot run in background.")
+    assert run_tool_by_name(screen, case_dir, "not-a-tool") is False
+
+
+def test_menus_resolves_alias_screens_lazily() -> None:
+    from ofti.app.tool_screens import pipeline
+
+    assert menus.pipeline_editor_screen is pipeline.pipeline_editor_screen
+    for handler_key in menus._TOOL_ALIAS_HANDLERS:
+        assert callable(menus._tool_alias_handler(handler_key))
+    with pytest.raises(AttributeError):
+        _ = menus.not_a_screen
+
+
 def test_tools_screen_runs_simple_and_special_entries(tmp_path: Path, monkeypatch) -> None:
     case_dir = tmp_path / "case"
     case_dir.mkdir()
@@ -6,6 +6,7 @@ from pathlib import Path
 import pytest
 
 from ofti.app.tool_screens import pipeline
+from ofti.ui_curses.keys import set_input_timeout
 
 
 class _Screen:
@@ -21,6 +22,9 @@ class _Screen:
     def addstr(self, *args: object) -> None:
         self.lines.append(str(args[-1]))
 
+    def addnstr(self, _y: int, _x: int, text: str, limit: int) -> None:
+        self.lines.append(text[:limit])
+
     def refresh(self) -> None:
         return None
 
@@ -32,6 +36,12 @@ class _Screen:
             return self._keys.pop(0)
         return ord("h")
 
+    def timeout(self, delay: int) -> None:
+        self.delay = delay
+
+    def chgat(self, *args: object) -> None:
+        self.highlighted = args
+
     def attron(self, *_args: object) -> None:
         return None
 
@@ -81,7 +91,7 @@ def test_pipeline_editor_missing_file_and_parse_errors(monkeypatch: pytest.Monke
     monkeypatch.setattr(
         pipeline.pipeline_service,
         "write_pipeline_file",
-        lambda p, commands: writes.append((p, commands)),
+        lambda p, commands, **_k: writes.append((p, commands)),
     )
     pipeline.pipeline_editor_screen(_Screen(keys=[ord("x")]), missing_case)
     assert writes == []
@@ -109,6 +119,72 @@ def test_pipeline_editor_missing_file_and_parse_errors(monkeypatch: pytest.Monke
     assert "PIPELINE PARSE ERRORS" in shown[-1]
 
 
+def test_pipeline_editor_coalesces_queued_navigation(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path,
+) -> None:
+    case = tmp_path / "case"
+    case.mkdir()
+    (case / pipeline.PIPELINE_FILENAME).write_text(f"{pipeline.PIPELINE_HEADER}\n")
+    monkeypatch.setattr(
+        pipeline.pipeline_service,
+        "read_pipeline_commands",
+        lambda _path: ([["echo", "1"], ["echo", "2"], ["echo", "3"]], []),
+    )
+    cursors: list[int] = []
+    monkeypatch.setattr(
+        pipeline, "_render_pipeline_editor", lambda _s, _c, cursor: cursors.append(cursor),
+    )
+    screen = _Screen(keys=[ord("j"), ord("j"), ord("j"), ord("j"), ord("k"), -1, ord("k"), ord("h")])
+    pipeline.pipeline_editor_screen(screen, case)
+    assert cursors == [0, 1]
+    assert screen.delay == -1
+
+    cursors.clear()
+    screen = _Screen(keys=[ord("x"), ord("k"), -1, ord("z"), curses.KEY_RESIZE, ord("h")])
+    pipeline.pipeline_editor_screen(screen, case)
+    assert cursors == [0, 0]
+
+    # Opened from a polling screen, the editor hands its getch timeout back intact.
+    screen = _Screen(keys=[ord("j"), -1, ord("h")])
+    set_input_timeout(screen, 200)
+    try:
+        pipeline.pipeline_editor_screen(screen, case)
+        assert screen.delay == 200
+    finally:
+        set_input_timeout(screen, -1)
+
+
+def test_pipeline_editor_batches_writes_until_exit(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path,
+) -> None:
+    case = tmp_path / "case"
+    case.mkdir()
+    path = case / pipeline.PIPELINE_FILENAME
+    path.write_text(f"#!/bin/sh\n{pipeline.PIPELINE_HEADER}\n\necho 1\necho 2\necho 3\n")
+    monkeypatch.setattr(pipeline, "_render_pipeline_editor", lambda *_a, **_k: None)
+    writes: list[tuple[list[list[str]], str | None]] = []
+    monkeypatch.setattr(
+        pipeline.pipeline_service,
+        "write_pipeline_file",
+        lambda _p, commands, shebang=None: writes.append(([list(c) for c in commands], shebang)),
+    )
+
+    keys = [ord("n"), ord("n"), ord("u"), ord("d"), ord("h")]
+    pipeline.pipeline_editor_screen(_Screen(keys=keys), case)
+    assert writes == [([["echo", "2"], ["echo", "3"]], "#!/bin/sh")]
+
+    writes.clear()
+
+    def _quit(*_a: object) -> None:
+        raise RuntimeError("quit")
+
+    monkeypatch.setattr(pipeline, "_show_message", _quit)
+    monkeypatch.setattr(pipeline, "prompt_line", lambda *_a, **_k: '"')
+    with pytest.raises(RuntimeError):
+        pipeline.pipeline_editor_screen(_Screen(keys=[ord("d"), ord("e")]), case)
+    assert writes == [([["echo", "2"], ["echo", "3"]], "#!/bin/sh")]
+
+
 def test_pipeline_editor_keypaths(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     case = tmp_path / "case"
     case.mkdir()
@@ -117,7 +193,7 @@ def test_pipeline_editor_keypaths(monkeypatch: pytest.MonkeyPatch, tmp_path: Pat
     monkeypatch.setattr(
         pipeline.pipeline_service,
         "write_pipeline_file",
-        lambda _path, commands: writes.append([list(row) for row in commands]),
+        lambda _path, commands, **_k: writes.append([list(row) for row in commands]),
     )
     monkeypatch.setattr(pipeline, "_render_pipeline_editor", lambda *_a, **_k: None)
 
@@ -135,6 +211,11 @@ def test_pipeline_editor_keypaths(monkeypatch: pytest.MonkeyPatch, tmp_path: Pat
     monkeypatch.setattr(pipeline, "prompt_line", lambda *_a, **_k: "")
     pipeline.pipeline_editor_screen(_Screen(keys=[ord("e"), ord("h")]), case)
 
+    for unchanged in ("echo 1", "  echo  '1' ", "   "):
+        monkeypatch.setattr(pipeline, "prompt_line", lambda *_a, text=unchanged, **_k: text)
+        pipeline.pipeline_editor_screen(_Screen(keys=[ord("e"), ord("h")]), case)
+    assert writes == []
+
     monkeypatch.setattr(pipeline, "prompt_line", lambda *_a, **_k: "echo 2")
     pipeline.pipeline_editor_screen(_Screen(keys=[ord("e"), ord("h")]), case)
     assert any(row == ["echo", "2"] for rows in writes for row in rows)
@@ -203,10 +284,83 @@ def test_render_pipeline_editor_branches(monkeypatch: pytest.MonkeyPatch) -> Non
     monkeypatch.setattr(pipeline.curses, "color_pair", lambda _n: 1)
     screen = _Screen(height=6, width=40)
     pipeline._render_pipeline_editor(screen, [["echo", "1"], ["echo", "2"], ["echo", "3"]], cursor=2)
-    assert any(">>" in line for line in screen.lines)
+    assert screen.lines[-2:] == ["   echo 2", ">> echo 3"]
+    assert screen.highlighted == (5, 0, 39, 1)
 
-    class _ErrorScreen(_Screen):
-        def addstr(self, *_args: object) -> None:
-            raise curses.error()
+    narrow = _Screen(height=6, width=12)
+    pipeline._render_pipeline_editor(narrow, [["echo", "a-very-long-argument"]], cursor=0)
+    assert narrow.lines[-1] == ">> echo a-v"
+    assert all(len(line) <= 11 for line in narrow.lines)
 
-    pipeline._render_pipeline_editor(_ErrorScreen(), [["echo", "1"]], cursor=0)
+    class _EraseScreen(_Screen):
+        def __init__(self) -> None:
+            super().__init__(height=6, width=40)
+            self.calls: list[str] = []
+
+        def clear(self) -> None:
+            self.calls.append("clear")
+
+        def erase(self) -> None:
+            self.calls.append("erase")
+
+        def refresh(self) -> None:
+            self.calls.append("refresh")
+
+        def noutrefresh(self) -> None:
+            self.calls.append("noutrefresh")
+
+    monkeypatch.setattr(pipeline.curses, "doupdate", lambda: erase_screen.calls.append("doupdate"))
+    erase_screen = _EraseScreen()
+    pipeline._render_pipeline_editor(erase_screen, [["echo", "1"]], cursor=0)
+    assert erase_screen.calls == ["erase", "noutrefresh", "doupdate"]
+
+
+def test_render_pipeline_editor_clips_to_window(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(pipeline.curses, "color_pair", lambda _n: 1)
+
+    class _ErrorScreen(_Screen):
+        def addnstr(self, y: int, x: int, text: str, limit: int) -> None:
+            if y == 4:
+                raise curses.error()
+            super().addnstr(y, x, text, limit)
+
+    error_screen = _ErrorScreen()
+    pipeline._render_pipeline_editor(error_screen, [["echo", "1"]], cursor=0)
+    assert error_screen.highlighted[0] == 4
+
+    tiny = _Screen(height=2, width=40)
+    pipeline._render_pipeline_editor(tiny, [["echo", "1"]], cursor=0)
+    pipeline._render_pipeline_editor(tiny, [], cursor=0)
+    assert tiny.lines == ["Pipeline editor (Allrun)", "# OFTI-PIPELINE"]
+    assert not hasattr(tiny, "highlighted")
+
+
+def test_flush_screen_wraps_frame_in_sync_marks(monkeypatch: pytest.MonkeyPatch) -> None:
+    events: list[object] = []
+
+    class _Out:
+        def fileno(self) -> int:
+            return 7
+
+    class _Screen2(_Screen):
+        def noutrefresh(self) -> None:
+            events.append("noutrefresh")
+
+    monkeypatch.setattr(pipeline.curses, "doupdate", lambda: events.append("doupdate"))
+    monkeypatch.setattr(pipeline.os, "write", lambda fd, data: events.append((fd, data)))
+    monkeypatch.setattr(pipeline.os, "isatty", lambda fd: fd == 7)
+    monkeypatch.setattr(pipeline.sys, "stdout", _Out())
+
+    monkeypatch.delenv("OFTI_SYNC_OUTPUT", raising=False)
+    pipeline._flush_screen(_Screen2())
+    assert events == ["noutrefresh", "doupdate"]
+
+    events.clear()
+    monkeypatch.setenv("OFTI_SYNC_OUTPUT", "1")
+    pipeline._flush_screen(_Screen2())
+    assert events == ["noutrefresh", (7, b"\x1b[?2026h"), "doupdate", (7, b"\x1b[?2026l")]
+
+    events.clear()
+    monkeypatch.setattr(pipeline.os, "isatty", lambda _fd: False)
+    pipeline._flush_screen(_Screen2())
+    assert events == ["noutrefresh", "doupdate"]
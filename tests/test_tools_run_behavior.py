@@ -127,8 +127,25 @@ def test_decomposed_processors_sorted(tmp_path: Path) -> None:
     (case / "processor10").mkdir()
     (case / "processor2").mkdir()
     (case / "notes").mkdir()
-    names = [path.name for path in run._decomposed_processors(case)]
-    assert names == ["processor10", "processor2"]
+    (case / "processors4").mkdir()
+    (case / "processor.txt").write_text("")
+    names = [path.name for path in run.decomposed_processors(case)]
+    assert names == ["processor2", "processor10", "processors4"]
+
+    (case / "processor3").mkdir()
+    assert [path.name for path in run.decomposed_processors(case)][1] == "processor3"
+    assert run.decomposed_processors(case / "missing") == []
+
+
+def test_decomposed_processors_tolerates_non_ascii_digits(tmp_path: Path) -> None:
+    case = tmp_path / "case"
+    case.mkdir()
+    (case / "processor1").mkdir()
+    (case / "processor\u00b2").mkdir()
+    (case / "processor\u0663").mkdir()
+    names = [path.name for path in run.decomposed_processors(case)]
+    assert names[0] == "processor1"
+    assert sorted(names[1:]) == ["processor\u00b2", "processor\u0663"]
 
 
 def test_parallel_consistency_screen_warn_and_mismatch(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -266,9 +266,9 @@ def test_parametric_presets_screen(monkeypatch, tmp_path: Path) -> None:
     presets = case_dir / "ofti.parametric"
     presets.write_text("demo | system/controlDict | application | simpleFoam\n")
     monkeypatch.setattr("ofti.app.tool_screens.postprocessing.build_parametric_cases", lambda *_a, **_k: [case_dir])
-    monkeypatch.setattr("ofti.app.tool_screens.postprocessing.run_cases", lambda *_a, **_k: [])
+    monkeypatch.setattr("ofti.app.tool_screens.parametric.run_cases", lambda *_a, **_k: [])
     monkeypatch.setattr("ofti.ui_curses.menus.Menu.navigate", lambda *_: 0)
-    monkeypatch.setattr("ofti.app.tool_screens.postprocessing.prompt_line", lambda *_: "n")
+    monkeypatch.setattr("ofti.app.tool_screens.parametric.prompt_line", lambda *_: "n")
     viewed = _capture_viewer(monkeypatch)
     postprocessing.parametric_presets_screen(FakeScreen(), case_dir)
     assert viewed or presets.is_file()
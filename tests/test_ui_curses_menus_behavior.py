@@ -8,6 +8,7 @@ import pytest
 from ofti.foam.config import Config
 from ofti.foam.exceptions import QuitAppError
 from ofti.ui_curses import menus
+from ofti.ui_curses.keys import set_input_timeout
 
 
 class _Screen:
@@ -150,3 +151,44 @@ def test_menu_quit_raises(monkeypatch: pytest.MonkeyPatch) -> None:
     menu = menus.Menu(_Screen(keys=[ord("q")]), "Title", ["one"])
     with pytest.raises(QuitAppError):
         menu.navigate()
+
+
+def test_menu_coalesces_queued_moves(monkeypatch: pytest.MonkeyPatch) -> None:
+    class _QueueScreen(_Screen):
+        def __init__(self, keys: list[int]) -> None:
+            super().__init__(keys=keys)
+            self.delay = -1
+            self.displays = 0
+
+        def timeout(self, delay: int) -> None:
+            self.delay = delay
+
+        def erase(self) -> None:
+            self.displays += 1
+
+        def getch(self) -> int:
+            if self.delay == 0 and self._keys and self._keys[0] == -2:
+                self._keys.pop(0)
+                return -1
+            return super().getch()
+
+    monkeypatch.setattr(menus, "get_config", _cfg)
+    keys = [curses.KEY_DOWN, curses.KEY_DOWN, curses.KEY_DOWN, curses.KEY_UP, -2, 10]
+    screen = _QueueScreen(keys)
+    menu = menus.Menu(screen, "Title", ["a", "b", "c", "d", "back"])
+
+    assert menu.navigate() == 2
+    assert screen.displays == 2
+    assert screen.delay == -1
+
+    screen = _QueueScreen([curses.KEY_DOWN, curses.KEY_DOWN, 10])
+    assert menus.Menu(screen, "Title", ["a", "b", "c", "back"]).navigate() == 2
+
+    # A polling caller's getch timeout survives an arrow key in a nested menu.
+    screen = _QueueScreen([curses.KEY_DOWN, -2, 10])
+    set_input_timeout(screen, 200)
+    try:
+        assert menus.Menu(screen, "Title", ["a", "b", "back"]).navigate() == 1
+        assert screen.delay == 200
+    finally:
+        set_input_timeout(screen, -1)
@@ -35,6 +35,9 @@ class TestScreen:
     def attroff(self, *_args, **_kwargs) -> None:
         pass
 
+    def chgat(self, *_args, **_kwargs) -> None:
+        pass
+
     def refresh(self) -> None:
         pass
 